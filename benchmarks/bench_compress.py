@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+对比各压缩格式的写出耗时与文件大小：
+    python benchmarks/bench_compress.py --tracks 50 --samples 20000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from tracegen.perfetto.perfetto_trace_manager import PerfettoTraceManager
+from tracegen.perfetto.trace_writer import COMPRESSION_SUFFIX, zstandard
+
+def build_manager(tracks, samples, seed=0):
+    rnd = random.Random(seed)
+    manager = PerfettoTraceManager(intern_strings=True)
+    base_ns = 1_748_473_200_000_000_000
+    for t in range(tracks):
+        name = f"proc_{t}(1{t:03d})"
+        timestamps = [base_ns + i * 30_000_000_000 for i in range(samples)]
+        values = [round(rnd.random() * 100, 2) for _ in range(samples)]
+        manager.add_counter_series('bench_counter', name, name, timestamps, values, category='bench')
+    return manager
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tracks', type=int, default=50)
+    parser.add_argument('--samples', type=int, default=20000)
+    args = parser.parse_args()
+    manager = build_manager(args.tracks, args.samples)
+    codecs = [None, 'gzip'] + (['zstd'] if zstandard is not None else [])
+    print(f"{'codec':<8}{'write_s':>10}{'file_MB':>10}{'raw_MB':>10}{'ratio':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec in codecs:
+            manager.compress = codec
+            path = os.path.join(tmp, f"bench.perfetto{COMPRESSION_SUFFIX[codec]}")
+            begin = time.perf_counter()
+            writer = manager.save_to_file(path)
+            elapsed = time.perf_counter() - begin
+            ratio = writer.compression_ratio
+            print(f"{codec or 'none':<8}{elapsed:>10.3f}{writer.file_bytes / 1e6:>10.2f}"
+                  f"{writer.bytes_written / 1e6:>10.2f}{ratio:>8.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+标准事件表示的内存/速度对比：StandardEvent（__slots__ + interned字符串）与原先的每条事件一个dict：
+    python benchmarks/bench_events.py --scale 10
+- held_MB:    适配器输出的完整事件列表驻留内存（tracemalloc，含字符串与arguments）
+- adapter_s:  适配器耗时
+- write_s:    PerfettoTraceManager.from_standard_format 耗时（内存模式）
+dict组由 to_dict() 逐条转换得到，各条事件的track_name等字符串仍与记录共享（旧实现中各不相同），
+因此dict组的内存偏小，结果偏保守；dict组的adapter_s包含逐条转换的耗时，仅供参考。
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from synthetic import make_rows
+from tracegen.api import ITER_ADAPTER_MAP
+from tracegen.perfetto.perfetto_trace_manager import PerfettoTraceManager
+
+def build(data_type, rows, as_dict):
+    events = ITER_ADAPTER_MAP[data_type](rows)
+    if as_dict:
+        return [event.to_dict() for event in events]
+    return list(events)
+
+def measure(data_type, rows, as_dict):
+    gc.collect()
+    tracemalloc.start()
+    begin = time.perf_counter()
+    events = build(data_type, rows, as_dict)
+    adapter_s = time.perf_counter() - begin
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    manager = PerfettoTraceManager(intern_strings=True)
+    begin = time.perf_counter()
+    count = manager.from_standard_format(events)
+    write_s = time.perf_counter() - begin
+    return len(events), held, adapter_s, write_s, count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='数据规模倍数（见 synthetic.BASE_ROWS）')
+    parser.add_argument('--types', default='short,long,gfx', help='数据类型，逗号分隔')
+    args = parser.parse_args()
+    print(f"{'case':<14}{'events':>10}{'held_MB':>10}{'B/event':>9}{'adapter_s':>11}{'write_s':>9}")
+    for data_type in [t for t in args.types.split(',') if t]:
+        rows = make_rows(data_type, args.scale)
+        results = {}
+        for label, as_dict in (('dict', True), ('record', False)):
+            events, held, adapter_s, write_s, count = measure(data_type, rows, as_dict)
+            results[label] = (held, count)
+            print(f"{data_type + '/' + label:<14}{events:>10}{held / 1e6:>10.2f}{held / events:>9.0f}"
+                  f"{adapter_s:>11.3f}{write_s:>9.3f}")
+        assert results['dict'][1] == results['record'][1]
+        print(f"{data_type + ' 节省':<12}{1 - results['record'][0] / results['dict'][0]:>32.0%}")
+
+if __name__ == '__main__':
+    main()
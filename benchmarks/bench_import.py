@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+启动开销基准：用 python -X importtime 在全新的解释器中测量各场景的导入耗时：
+    PYTHONPATH=. python benchmarks/bench_import.py --repeat 5
+- cli:        import tracegen.cli（tracegen --help 等不转换数据的调用只付出这部分）
+- api:        import tracegen.api
+- adapter:    取 -t gfx 的适配器（只导入gfx适配器及NumPy）
+- convert:    转换所需的全部模块（全部适配器 + PerfettoTraceManager/perfetto_trace_pb2 + requests）
+每个场景取最快一次，输出导入总耗时与自身耗时最多的模块；
+cli/api 场景导入了 HEAVY_MODULES 中的任何一个时视为回归，以退出码1结束。
+"""
+import argparse
+import subprocess
+import sys
+
+SCENARIOS = {
+    'cli': "import tracegen.cli",
+    'api': "import tracegen.api",
+    'adapter': "from tracegen.api import ADAPTER_MAP; ADAPTER_MAP['gfx']",
+    'convert': ("from tracegen.api import ADAPTER_MAP, COLUMNAR_ADAPTER_MAP; "
+                "[(ADAPTER_MAP[t], COLUMNAR_ADAPTER_MAP[t]) for t in ADAPTER_MAP]; "
+                "import tracegen.perfetto.perfetto_trace_manager, tracegen.data_fetcher as f; f._requests()"),
+}
+# 启动时不应导入的重量级模块（只在真正转换时按需导入）
+HEAVY_MODULES = ('numpy', 'requests', 'tracegen.perfetto.perfetto_trace_pb2')
+LAZY_SCENARIOS = ('cli', 'api')
+
+def measure(code):
+    """
+    在新进程中执行code，返回 (导入总耗时us, {模块: 自身耗时us})。
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          capture_output=True, text=True, check=True)
+    total = 0
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+        if not name[1:].startswith(' '):  # 顶层导入（无缩进）的累计耗时之和为总耗时
+            total += int(cumulative_us)
+    return total, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='每个场景重复次数（取最快一次）')
+    parser.add_argument('--top', type=int, default=5, help='列出自身耗时最多的前N个模块')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='场景，逗号分隔')
+    args = parser.parse_args()
+    baseline_total, _ = min(measure('pass') for _ in range(args.repeat))
+    print(f"解释器自身启动导入（site等）: {baseline_total / 1000:.1f}ms，以下各场景已扣除")
+    print(f"{'scenario':<10}{'import_ms':>11}  top modules (self ms)")
+    regressions = []
+    for name in [s for s in args.scenarios.split(',') if s]:
+        total, modules = min((measure(SCENARIOS[name]) for _ in range(args.repeat)), key=lambda r: r[0])
+        top = sorted(modules.items(), key=lambda item: -item[1])[:args.top]
+        print(f"{name:<10}{(total - baseline_total) / 1000:>11.1f}  "
+              + ', '.join(f"{module} {us / 1000:.1f}" for module, us in top))
+        if name in LAZY_SCENARIOS:
+            loaded = [m for m in HEAVY_MODULES if m in modules]
+            if loaded:
+                regressions.append((name, loaded))
+    for name, loaded in regressions:
+        print(f"❌ {name} 启动时导入了重量级模块: {', '.join(loaded)}")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
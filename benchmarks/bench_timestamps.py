@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+时间解析微基准：对比旧实现（每次strptime + 异常回退）与 tracegen.utils 的定宽切片 + 缓存 / NumPy整列解析：
+    python benchmarks/bench_timestamps.py --rows 100000
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+
+from synthetic import cpu_short_rows, gfx_rows
+from tracegen.utils import parse_datetime_to_ms, parse_datetime_to_seconds, parse_datetime_column
+
+def legacy_parse_datetime_to_ms(val):
+    """
+    优化前的 parse_datetime_to_ms，作为对照组。
+    """
+    if isinstance(val, (int, float)):
+        return int(val)
+    if isinstance(val, str):
+        for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
+            try:
+                dt = datetime.datetime.strptime(val, fmt)
+                return int(dt.timestamp() * 1000)
+            except Exception:
+                continue
+    return 0
+
+def timed(func):
+    begin = time.perf_counter()
+    result = func()
+    return time.perf_counter() - begin, result
+
+def bench(label, values, repeats):
+    """
+    repeats: 每个值重复解析的次数（cpu_short每行的collect_time会被6个字段+psi各解析一次）
+    """
+    expected = np.array([legacy_parse_datetime_to_ms(v) for v in values], dtype=np.int64)
+    cases = [
+        ('legacy strptime', lambda: [legacy_parse_datetime_to_ms(v) for v in values for _ in range(repeats)]),
+        ('scalar (cold cache)', lambda: (parse_datetime_to_seconds.cache_clear(),
+                                         [parse_datetime_to_ms(v) for v in values for _ in range(repeats)])[1]),
+        ('scalar (warm cache)', lambda: [parse_datetime_to_ms(v) for v in values for _ in range(repeats)]),
+        ('column (numpy)', lambda: parse_datetime_column(values)),
+    ]
+    print(f"\n{label}: {len(values)} 个值 × {repeats} 次")
+    print(f"{'method':<22}{'seconds':>10}{'M/s':>8}{'speedup':>9}")
+    legacy_s = None
+    for name, func in cases:
+        elapsed, result = timed(func)
+        parsed = np.asarray(result, dtype=np.int64)
+        if name != 'column (numpy)':
+            parsed = parsed[::repeats]
+        assert np.array_equal(parsed, expected), f"{name} 结果与旧实现不一致"
+        total = len(values) * (1 if name == 'column (numpy)' else repeats)
+        legacy_s = legacy_s or elapsed
+        print(f"{name:<22}{elapsed:>10.3f}{total / elapsed / 1e6:>8.2f}{legacy_s / elapsed:>8.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+    bench('cpu_short collect_time', [row['collect_time'] for row in cpu_short_rows(args.rows)], repeats=7)
+    bench('gfx create_time（带毫秒）', [row['create_time'] for row in gfx_rows(args.rows)], repeats=1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+packet编码路径对比：protobuf对象（每个packet构建TracePacket再序列化）与 tracegen.perfetto.wire 直接编码字节：
+    PYTHONPATH=. python benchmarks/bench_wire.py --scale 10
+- counters:  纯counter序列（add_counter_series，按列向量化编码），--points 个采样 × --tracks 条track
+- counters+args: 带arguments的counter序列（逐点编码，如降采样输出）
+- short/long/gfx: 合成数据经列式适配器后 from_columnar 写出（端到端写入，不含适配器耗时）
+- standard:  long 的标准格式事件经 from_standard_format 写出（逐条事件）
+每个用例取最快一次，两条路径的输出文件逐字节比较，不一致时以退出码1结束。
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from synthetic import make_rows
+from tracegen.api import COLUMNAR_ADAPTER_MAP, ITER_ADAPTER_MAP
+from tracegen.perfetto.perfetto_trace_manager import PerfettoTraceManager
+
+def counter_series(points, tracks, with_args):
+    rng = np.random.default_rng(0)
+    start_ns = 1748473200 * 10 ** 9
+    series = []
+    for i in range(tracks):
+        timestamps = start_ns + np.arange(points, dtype=np.int64) * 10 ** 9
+        values = rng.random(points) * 100
+        arguments = [{'raw_count': j % 7 + 1} for j in range(points)] if with_args else None
+        series.append((f"proc_{i % 10}", f"track_{i}", timestamps, values, arguments))
+    return series
+
+def write_series(manager, series):
+    count = 0
+    for process_name, track_name, timestamps, values, arguments in series:
+        if arguments is not None or not manager.fast_encode:
+            timestamps, values = timestamps.tolist(), values.tolist()
+        count += manager.add_counter_series(process_name, track_name, track_name, timestamps, values,
+                                            arguments=arguments)
+    return count
+
+def make_cases(args):
+    cases = {
+        'counters': lambda m, s=counter_series(args.points, args.tracks, False): write_series(m, s),
+        'counters+args': lambda m, s=counter_series(args.points // 10, args.tracks, True): write_series(m, s),
+    }
+    for data_type in ('short', 'long', 'gfx'):
+        batches = COLUMNAR_ADAPTER_MAP[data_type](make_rows(data_type, args.scale))
+        cases[data_type] = lambda m, b=batches: m.from_columnar(b)
+    events = list(ITER_ADAPTER_MAP['long'](make_rows('long', args.scale)))
+    cases['standard'] = lambda m, e=events: m.from_standard_format(e)
+    return cases
+
+def run(case, fast_encode, out_path):
+    manager = PerfettoTraceManager(output_path=out_path, intern_strings=True, deterministic=True,
+                                   validation='off', fast_encode=fast_encode)
+    begin = time.perf_counter()
+    count = case(manager)
+    manager.save_to_file()
+    return time.perf_counter() - begin, count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='合成数据规模倍数（见 synthetic.BASE_ROWS）')
+    parser.add_argument('--points', type=int, default=20000, help='counters用例每条track的采样数')
+    parser.add_argument('--tracks', type=int, default=50, help='counters用例的track数')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数（取最快一次）')
+    args = parser.parse_args()
+    mismatches = []
+    print(f"{'case':<15}{'events':>10}{'protobuf_s':>12}{'wire_s':>9}{'speedup':>9}{'wire_eps':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, case in make_cases(args).items():
+            results = {}
+            for fast_encode in (False, True):
+                out_path = os.path.join(tmp_dir, f"{name}_{fast_encode}.perfetto")
+                best = min(run(case, fast_encode, out_path) for _ in range(args.repeat))
+                with open(out_path, 'rb') as f:
+                    results[fast_encode] = best + (f.read(),)
+            (slow_s, count, slow_bytes), (fast_s, _, fast_bytes) = results[False], results[True]
+            if slow_bytes != fast_bytes:
+                mismatches.append(name)
+            print(f"{name:<15}{count:>10}{slow_s:>12.3f}{fast_s:>9.3f}{slow_s / fast_s:>8.1f}x{count / fast_s:>12.0f}")
+    for name in mismatches:
+        print(f"❌ {name}: wire编码输出与protobuf不一致")
+    if not mismatches:
+        print("✅ 各用例输出逐字节一致")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
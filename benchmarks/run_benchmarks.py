@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+离线基准测试：用 synthetic.py 的合成数据测量各适配器与trace写出的性能，并与基线对比。
+    python benchmarks/run_benchmarks.py                       # 1x/10x/100x，全部类型，与baseline.json对比
+    python benchmarks/run_benchmarks.py --scales 1,10 --types long
+    python benchmarks/run_benchmarks.py --save-baseline       # 以本次结果覆盖基线
+（需已安装tracegen，或在仓库根目录下以 PYTHONPATH=. 运行；100x全量约需10分钟）
+每个用例（类型 × 适配器路径 × 规模）记录：
+- adapter_eps:     适配器每秒产出的事件数
+- e2e_eps:         适配器 + PerfettoTraceManager + save_to_file 端到端每秒事件数
+- bytes_per_event: 输出trace文件字节数 / 事件数
+- peak_mem_mb:     端到端过程的tracemalloc峰值（MB，单独一轮测量，不影响计时）
+速度指标低于基线超过容差、体积/内存指标高于基线超过容差时标记为回归，并以退出码1结束。
+速度对比前先用固定的校准负载（calibration_s）归一化，抵消机器快慢与负载波动的影响。
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import make_rows
+from tracegen.api import ADAPTER_MAP, COLUMNAR_ADAPTER_MAP
+from tracegen.perfetto.perfetto_trace_manager import PerfettoTraceManager
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# 指标 -> (方向, 默认容差)；方向1表示越大越好，-1表示越小越好
+METRICS = {
+    'adapter_eps': (1, 0.25),
+    'e2e_eps': (1, 0.25),
+    'bytes_per_event': (-1, 0.05),
+    'peak_mem_mb': (-1, 0.10),
+}
+
+def calibrate(repeat=5):
+    """
+    固定的纯Python负载（JSON编解码 + 时间解析），返回最快一次的耗时（秒），用于归一化速度指标。
+    """
+    payload = json.dumps([{'procName': f'proc_{i}', 'pid': i, 'total': i * 0.5} for i in range(200)])
+    times = [f"2025-05-29 07:{i % 60:02d}:{i * 7 % 60:02d}" for i in range(2000)]
+    def workload():
+        for _ in range(20):
+            json.loads(payload)
+        for value in times:
+            datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    return best_of(repeat, workload)[0]
+
+def run_adapter(data_type, path, rows):
+    """
+    返回 (适配器输出, 事件数)。
+    """
+    if path == 'columnar':
+        batches = COLUMNAR_ADAPTER_MAP[data_type](rows)
+        return batches, sum(len(batch) for batch in batches)
+    events = ADAPTER_MAP[data_type](rows)
+    return events, len(events)
+
+def run_end_to_end(data_type, path, rows, out_path):
+    """
+    适配器 -> PerfettoTraceManager（流式写出，与CLI默认配置一致）-> 文件，返回 (事件数, 文件字节数)。
+    """
+    manager = PerfettoTraceManager(output_path=out_path, intern_strings=True)
+    output, _ = run_adapter(data_type, path, rows)
+    if path == 'columnar':
+        count = manager.from_columnar(output)
+    else:
+        count = manager.from_standard_format(output)
+    manager.add_clock_snapshot()
+    writer = manager.save_to_file(out_path)
+    return count, writer.file_bytes
+
+def best_of(repeat, func):
+    best = None
+    result = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def bench_case(data_type, path, scale, repeat, tmp_dir):
+    rows = make_rows(data_type, scale)
+    out_path = os.path.join(tmp_dir, f"{data_type}_{path}_{scale}x.perfetto")
+    adapter_s, (_, events) = best_of(repeat, lambda: run_adapter(data_type, path, rows))
+    e2e_s, (count, file_bytes) = best_of(repeat, lambda: run_end_to_end(data_type, path, rows, out_path))
+    tracemalloc.start()
+    run_end_to_end(data_type, path, rows, out_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'rows': len(rows),
+        'events': count,
+        'adapter_eps': round(events / adapter_s, 1) if adapter_s else 0.0,
+        'e2e_eps': round(count / e2e_s, 1) if e2e_s else 0.0,
+        'bytes_per_event': round(file_bytes / count, 3) if count else 0.0,
+        'peak_mem_mb': round(peak / 1e6, 3),
+    }
+
+def compare(results, baseline, tolerance=None, speed_factor=1.0):
+    """
+    与基线对比，返回回归列表 [(case, metric, baseline, current, change)]。
+    tolerance不为None时覆盖速度指标的默认容差；
+    speed_factor为本次与基线的校准耗时之比，速度指标乘以该系数后再比较。
+    """
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for metric, (direction, default_tol) in METRICS.items():
+            if metric not in base or not base[metric]:
+                continue
+            value = current[metric]
+            tol = default_tol
+            if metric.endswith('_eps'):
+                value *= speed_factor
+                if tolerance is not None:
+                    tol = tolerance
+            change = (value - base[metric]) / base[metric]
+            if direction * change < -tol:
+                regressions.append((case, metric, base[metric], round(value, 3), change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='1,10,100', help='数据规模倍数，逗号分隔')
+    parser.add_argument('--types', default='short,long,gfx', help='数据类型，逗号分隔')
+    parser.add_argument('--paths', default='standard,columnar', help='适配器路径，逗号分隔')
+    parser.add_argument('--repeat', type=int, default=3, help='计时重复次数（取最快一次），大于10x的规模只跑一轮')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基线文件')
+    parser.add_argument('--save-baseline', action='store_true', help='以本次结果覆盖基线文件')
+    parser.add_argument('--tolerance', type=float, default=None, help='速度指标的回归容差（默认0.25）')
+    parser.add_argument('--json', dest='json_path', default=None, help='将本次结果写入该JSON文件')
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',') if s]
+    types = [t for t in args.types.split(',') if t]
+    paths = [p for p in args.paths.split(',') if p]
+    results = {}
+    calibration_s = calibrate()
+    print(f"校准负载耗时 {calibration_s * 1000:.1f}ms")
+    print(f"{'case':<22}{'rows':>8}{'events':>10}{'adapter_ev/s':>14}{'e2e_ev/s':>12}{'B/event':>9}{'peak_MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            for data_type in types:
+                for path in paths:
+                    case = f"{data_type}/{path}/{scale}x"
+                    r = bench_case(data_type, path, scale, args.repeat if scale <= 10 else 1, tmp_dir)
+                    results[case] = r
+                    print(f"{case:<22}{r['rows']:>8}{r['events']:>10}{r['adapter_eps']:>14.0f}{r['e2e_eps']:>12.0f}"
+                          f"{r['bytes_per_event']:>9.2f}{r['peak_mem_mb']:>9.2f}")
+    report = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(), 'machine': platform.machine(),
+                 'calibration_s': round(calibration_s, 6)},
+        'results': results,
+    }
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"📝 基线已保存到 {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ 基线文件不存在: {args.baseline}，使用 --save-baseline 生成")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    meta = baseline.get('meta', {})
+    if meta.get('machine') != report['meta']['machine']:
+        print(f"⚠️ 基线来自不同的机器架构（{meta.get('machine')}），速度对比仅供参考")
+    speed_factor = calibration_s / meta['calibration_s'] if meta.get('calibration_s') else 1.0
+    regressions = compare(results, baseline.get('results', {}), args.tolerance, speed_factor)
+    if not regressions:
+        print("✅ 未发现性能回归")
+        return 0
+    print(f"❌ 发现 {len(regressions)} 项性能回归：")
+    for case, metric, base, current, change in regressions:
+        print(f"   {case:<22}{metric:<16} 基线 {base:g} -> 当前(归一化) {current:g}（{change:+.1%}）")
+    return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+离线基准测试用的合成原始数据，字段与 crs-data-service 返回的行结构一致：
+- cpu_short: collect_time + soft_irq/total/kernel/irq/nice/user + psi_avg10（JSON字符串）
+- cpu_long:  collect_time + proc_info（JSON字符串，N个进程，进程会随机退出/新启动）
+- gfx:       create_time（带毫秒）+ total_duration + jank_event/window_name + 性能细节字段
+同一seed生成的数据完全一致。
+"""
+import datetime
+import json
+import random
+
+BASE_TIME = datetime.datetime(2025, 5, 29, 7, 0, 0)
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+CPU_SHORT_FIELDS = ["soft_irq", "total", "kernel", "irq", "nice", "user"]
+PSI_KEYS = ["cpu_some", "cpu_full", "memory_some", "memory_full", "io_some", "io_full"]
+JANK_EVENTS = ["FirstFrame", "Jank", "BigJank", "NoJank"]
+WINDOW_NAMES = [
+    "com.lixiang.launcher/.MainActivity", "com.lixiang.map/.NaviActivity",
+    "com.lixiang.media/.PlayerActivity", "com.lixiang.settings/.SettingsActivity",
+    "StatusBar", "NavigationBar",
+]
+
+def _fmt(seconds):
+    return (BASE_TIME + datetime.timedelta(seconds=seconds)).strftime(TIME_FORMAT)
+
+def cpu_short_rows(n, seed=1, interval_s=30):
+    """
+    n行cpu_short数据，采样间隔interval_s秒。
+    """
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        row = {'collect_time': _fmt(i * interval_s)}
+        for field in CPU_SHORT_FIELDS:
+            row[field] = f"{rnd.random() * 100:.2f}"
+        row['psi_avg10'] = json.dumps({key: round(rnd.random() * 20, 2) for key in PSI_KEYS})
+        rows.append(row)
+    return rows
+
+def cpu_long_rows(n, procs=60, seed=2, interval_s=200, churn=0.05):
+    """
+    n行cpu_long数据，每行proc_info约procs个进程；每个采样点约churn比例的进程退出并由新进程替代。
+    """
+    rnd = random.Random(seed)
+    next_pid = 1000
+    alive = []
+    for _ in range(procs):
+        alive.append((f"proc_{next_pid}", next_pid))
+        next_pid += 1
+    rows = []
+    for i in range(n):
+        for idx in range(len(alive)):
+            if rnd.random() < churn:
+                alive[idx] = (f"proc_{next_pid}", next_pid)
+                next_pid += 1
+        proc_info = [{
+            'procName': name,
+            'pid': pid,
+            'total': round(rnd.random() * 50, 2),
+            'system': round(rnd.random() * 10, 2),
+            'user': round(rnd.random() * 40, 2),
+            'cswch': rnd.randint(0, 5000),
+            'nvcswch': rnd.randint(0, 500),
+        } for name, pid in alive]
+        rows.append({'collect_time': _fmt(i * interval_s), 'proc_info': json.dumps(proc_info)})
+    return rows
+
+def gfx_rows(n, seed=3, interval_ms=200):
+    """
+    n行gfx数据，create_time带毫秒，间隔约interval_ms。
+    """
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        create = BASE_TIME + datetime.timedelta(milliseconds=i * interval_ms + rnd.randint(0, interval_ms - 1))
+        total = rnd.randint(8, 400)
+        rows.append({
+            'create_time': create.strftime(TIME_FORMAT) + f".{create.microsecond // 1000:03d}",
+            'total_duration': total,
+            'jank_event': rnd.choice(JANK_EVENTS),
+            'window_name': rnd.choice(WINDOW_NAMES),
+            'mark_animation_time': rnd.randint(0, 5),
+            'ui_draw_time': rnd.randint(0, total),
+            'sync_time': rnd.randint(0, 10),
+            'handle_input_time': rnd.randint(0, 5),
+            'draw_command_time': rnd.randint(0, 20),
+            'perform_traversals_time': rnd.randint(0, 30),
+            'current_frame_index': i,
+            'gpu_slow': rnd.randint(0, 1),
+            'ui_thread_dely': rnd.randint(0, 10),
+            'swap_buffers_and_gpu_draw_time': rnd.randint(0, 20),
+        })
+    return rows
+
+# 1x规模约为一个3小时窗口的数据量
+BASE_ROWS = {
+    'short': 360,
+    'long': 54,
+    'gfx': 3000,
+}
+
+GENERATORS = {
+    'short': cpu_short_rows,
+    'long': cpu_long_rows,
+    'gfx': gfx_rows,
+}
+
+def make_rows(data_type, scale=1, seed=None):
+    """
+    生成data_type在scale倍规模下的原始数据。
+    """
+    n = BASE_ROWS[data_type] * scale
+    if seed is None:
+        return GENERATORS[data_type](n)
+    return GENERATORS[data_type](n, seed=seed)
@@ -29,13 +29,18 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "protobuf>=3.20.0,<4.0.0",
+        "protobuf>=4.25.1",
         "requests",
         "click",
+        "numpy",
     ],
+    extras_require={
+        "zstd": ["zstandard"],
+    },
     entry_points={
         "console_scripts": [
             "tracegen=tracegen.cli:cli",
+            "tracegen-batch=tracegen.cli:batch_cli",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+import datetime
+import gzip
+import json
+import os
+import random
+
+import pytest
+import requests
+
+from tracegen import api
+from tracegen.data_fetcher import row_time_ms
+from tracegen.perfetto import perfetto_trace_pb2 as pftrace
+from tracegen.trace_index import INDEX_VERSION, index_path, load_trace_index, save_trace_index
+from tracegen.utils import parse_datetime_to_ms
+
+VIN = 'TESTVIN0000000001'
+START, MID, END = '2025-05-29 07:00:00', '2025-05-29 08:30:00', '2025-05-29 10:00:00'
+TYPES = ['gfx', 'short', 'long']
+
+def _time_str(seconds):
+    return (datetime.datetime(2025, 5, 29, 7) + datetime.timedelta(seconds=seconds)).strftime('%Y-%m-%d %H:%M:%S')
+
+def _rows():
+    rand = random.Random(7)
+    short = [{'collect_time': _time_str(i * 30),
+              **{f: str(round(rand.random() * 100, 2)) for f in ('soft_irq', 'total', 'kernel', 'irq', 'nice', 'user')},
+              'psi_avg10': json.dumps({'cpu_some': rand.random() * 10, 'mem_some': rand.random() * 5, 'io_full': rand.random()})}
+             for i in range(360)]
+    long = [{'collect_time': _time_str(i * 200),
+             'proc_info': json.dumps([{'procName': f"p{j}", 'pid': 1000 + j, 'total': round(rand.random() * 50, 2),
+                                       'cswch': 1, 'nvcswch': 2, 'system': 1.0, 'user': 2.0}
+                                      for j in range(8) if rand.random() > 0.2])}
+            for i in range(54)]
+    gfx = [{'create_time': f"{_time_str(i * 20)}.{i * 200 % 1000:03d}", 'total_duration': rand.randint(16, 300),
+            'jank_event': rand.choice(['FirstFrame', 'Jank', 'BigJank']), 'window_name': rand.choice(['com.a.Main', 'com.b.Map']),
+            'ui_draw_time': 3, 'sync_time': 1} for i in range(540)]
+    return {'short': short, 'long': long, 'gfx': gfx}
+
+ROWS = _rows()
+
+class _FakeResponse:
+    def __init__(self, body):
+        self.content = body
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for i in range(0, len(self.content), 4096):
+            yield self.content[i:i + 4096]
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    # 按请求的类型与时间窗口（两端包含）返回 ROWS 中的行
+    def post(*args, **kwargs):
+        param = json.loads(kwargs['data'])['param']
+        lo = parse_datetime_to_ms(f"{param['start_date']} {param['start_time']}")
+        hi = parse_datetime_to_ms(f"{param['end_date']} {param['end_time']}")
+        rows = [row for row in ROWS[param['type']] if lo <= row_time_ms(row) <= hi]
+        return _FakeResponse(json.dumps({'code': 0, 'data': rows}).encode())
+    monkeypatch.setattr(requests, 'post', post)
+    monkeypatch.setattr(requests.Session, 'post', lambda self, *args, **kwargs: post(*args, **kwargs))
+
+def _events(path):
+    """
+    解码trace中的事件为与uuid/sequence id/iid无关的集合：(track路径, 时间戳, 类型, 名称, counter值, categories, 参数)。
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.gz'):
+        data = gzip.decompress(data)
+    trace = pftrace.Trace.FromString(data)
+    tracks = {}
+    for packet in trace.packet:
+        if packet.HasField('track_descriptor'):
+            desc = packet.track_descriptor
+            tracks[desc.uuid] = tracks.get(desc.parent_uuid, '') + '/' + (desc.process.process_name or desc.name)
+    interned = {}
+    events = []
+    for packet in trace.packet:
+        if packet.sequence_flags & pftrace.TracePacket.SEQ_INCREMENTAL_STATE_CLEARED:
+            interned = {}
+        for table in ('event_names', 'event_categories', 'debug_annotation_names'):
+            for entry in getattr(packet.interned_data, table):
+                interned[(packet.trusted_packet_sequence_id, table, entry.iid)] = entry.name
+        if not packet.HasField('track_event'):
+            continue
+        event, seq = packet.track_event, packet.trusted_packet_sequence_id
+        # slice end 事件不带名称
+        name = event.name or interned.get((seq, 'event_names', event.name_iid), '')
+        categories = tuple(event.categories) or tuple(interned[(seq, 'event_categories', iid)] for iid in event.category_iids)
+        arguments = tuple(sorted((a.name or interned[(seq, 'debug_annotation_names', a.name_iid)], a.string_value)
+                                 for a in event.debug_annotations))
+        events.append((tracks[event.track_uuid], packet.timestamp, event.type, name,
+                       round(event.double_counter_value, 6), categories, arguments))
+    return sorted(events)
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'intern_strings': True},
+    {'columnar': False},
+    {'lazy': True},
+    {'compress': 'gzip'},
+    {'deterministic': True},
+])
+def test_append_matches_full_generation(fake_server, tmp_path, kwargs):
+    kwargs = dict(kwargs, use_cache=False)
+    full = api.run_trace_convert(VIN, START, END, TYPES, '+0800', str(tmp_path / 'full'), **kwargs)
+    first = api.run_trace_convert(VIN, START, MID, TYPES, '+0800', str(tmp_path / 'inc'), **kwargs)
+    # 追加时 start_time/时区/输出目录取自索引，传入的值被忽略
+    appended = api.run_trace_convert(VIN, 'ignored', END, TYPES, '+0000', '/nowhere', append=first, **kwargs)
+    assert os.path.basename(appended) == os.path.basename(full)
+    assert os.path.dirname(appended) == str(tmp_path / 'inc')
+    assert not os.path.exists(first) and not os.path.exists(index_path(first))
+    expected = _events(full)
+    assert expected
+    assert _events(appended) == expected
+    assert load_trace_index(appended)['end_time'] == END
+
+def test_append_in_two_steps(fake_server, tmp_path):
+    full = api.run_trace_convert(VIN, START, END, TYPES, '+0800', str(tmp_path / 'full'), use_cache=False)
+    path = api.run_trace_convert(VIN, START, '2025-05-29 07:40:00', TYPES, '+0800', str(tmp_path / 'inc'), use_cache=False)
+    for end_time in ('2025-05-29 08:55:00', END):
+        path = api.run_trace_convert(VIN, START, end_time, TYPES, '+0800', None, append=path, use_cache=False)
+    assert _events(path) == _events(full)
+
+def test_append_noop_and_vin_mismatch(fake_server, tmp_path):
+    path = api.run_trace_convert(VIN, START, MID, TYPES, '+0800', str(tmp_path), use_cache=False)
+    assert api.run_trace_convert(VIN, START, MID, TYPES, '+0800', None, append=path, use_cache=False) == path
+    with pytest.raises(ValueError):
+        api.run_trace_convert('OTHERVIN', START, END, TYPES, '+0800', None, append=path, use_cache=False)
+
+def test_append_rejects_truncated_trace(fake_server, tmp_path):
+    path = api.run_trace_convert(VIN, START, MID, TYPES, '+0800', str(tmp_path), use_cache=False)
+    os.truncate(path, os.path.getsize(path) - 1)
+    with pytest.raises(ValueError):
+        api.run_trace_convert(VIN, START, END, TYPES, '+0800', None, append=path, use_cache=False)
+
+INDEX = {'vin': VIN, 'start_time': START, 'end_time': MID, 'types': TYPES, 'options': {'timezone': '+0800'},
+         'file_bytes': 123, 'state': {'sequence_id': 1}, 'watermarks': [['cpu', 'counter', 'total', 5]]}
+
+def test_trace_index_round_trip(tmp_path):
+    trace = str(tmp_path / 'a_trace.perfetto')
+    assert save_trace_index(trace, INDEX) == index_path(trace)
+    assert load_trace_index(trace) == dict(INDEX, version=INDEX_VERSION)
+
+def test_trace_index_errors(tmp_path):
+    trace = str(tmp_path / 'a_trace.perfetto')
+    with pytest.raises(FileNotFoundError):
+        load_trace_index(trace)
+    with open(index_path(trace), 'w', encoding='utf-8') as f:
+        json.dump(dict(INDEX, version=INDEX_VERSION + 1), f)
+    with pytest.raises(ValueError, match='版本'):
+        load_trace_index(trace)
+    index = {k: v for k, v in INDEX.items() if k != 'watermarks'}
+    save_trace_index(trace, index)
+    with pytest.raises(ValueError, match='watermarks'):
+        load_trace_index(trace)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from tracegen.json_stream import iter_json_array_items
+
+VALID = [
+    '{"data":[{"x":"\\u00e9中文"}, {"y":[1,2,{"z":null}]}], "code": 0}',
+    ' {"data" : [ 1 , 2.5e3 , "a\\"b" ] } ',
+    '{"data":[1.5,-0,1e-3]}',
+    '{"a":1,"data":[2],"b":{"c":[3]}}',
+    '{"data":[]}',
+    '{"data":null}',
+    '{"code":0}',
+    '{}',
+    '{ }',
+    '{"data":["表情😀", "\\ud83d\\ude00"]}\n',
+]
+
+INVALID = [
+    '{"data":[1 2]}', '{"data":[1,]}', '{"data":[,1]}', '{"data":[1,,2]}', '{"a":1 "data":[1]}', '{,"data":[1]}',
+    '{"a":1,}', '{"data":[1]', '{"data":[1', '{"data":[1] x', '{"data" [1]}', '{"a":tru,"data":[1]}',
+    '{"data":[1]}x', '{"a":[1 2],"data":[1]}', '{"a":01,"data":[]}', '{"a":{"b":1 "c":2},"data":[]}',
+    '{"a":"x\\q","data":[]}', '{"a":[}],"data":[]}', '', '  ', '{', '{"data":[1]}\n\n{',
+    '{\n"a":1,\n"data":[1\n2]}', '{"data":[1.]}', '{"data":[tru]}', '{"data":[1],}', '{"data":[1] , }',
+]
+
+def _splits(raw):
+    # 所有两段切分，外加逐字节切分（覆盖多字节UTF-8字符被截断的情况）
+    return [[raw[:n], raw[n:]] for n in range(len(raw) + 1)] + [[raw[i:i + 1] for i in range(len(raw))]]
+
+def _error(exc):
+    return exc.msg, exc.pos, exc.lineno, exc.colno, str(exc)
+
+@pytest.mark.parametrize('text', VALID)
+def test_items_match_json_loads_for_every_split(text):
+    expected = json.loads(text).get('data') or []
+    for chunks in _splits(text.encode()):
+        assert list(iter_json_array_items(chunks)) == expected
+
+@pytest.mark.parametrize('text', INVALID)
+def test_errors_match_json_loads_for_every_split(text):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    for chunks in _splits(text.encode()):
+        with pytest.raises(json.JSONDecodeError) as got:
+            list(iter_json_array_items(chunks))
+        assert _error(got.value) == _error(expected.value)
+
+def _large_doc(n):
+    rows = [{'timestamp': 1748473200000 + i, 'value': i * 0.5, 'name': f"信号{i}"} for i in range(n)]
+    return '{"code":0,\n"data":[\n' + ',\n'.join(json.dumps(row, ensure_ascii=False) for row in rows) + '\n]}'
+
+def test_large_document_in_small_chunks():
+    text = _large_doc(20000)
+    raw = text.encode()
+    chunks = [raw[i:i + 4093] for i in range(0, len(raw), 4093)]
+    assert list(iter_json_array_items(chunks)) == json.loads(text)['data']
+
+@pytest.mark.parametrize('broken', [
+    lambda text: text[:-3] + ' 1 2]}',
+    lambda text: text[:-3] + ',]}',
+    lambda text: text[:-20000] + '\n\n  oops',
+])
+def test_large_document_error_position(broken):
+    # 缓冲区前缀被丢弃后，错误位置仍需是整个文档中的行列号
+    text = broken(_large_doc(20000))
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    raw = text.encode()
+    with pytest.raises(json.JSONDecodeError) as got:
+        list(iter_json_array_items(raw[i:i + 1000] for i in range(0, len(raw), 1000)))
+    assert _error(got.value) == _error(expected.value)
+    assert expected.value.pos > 65536
+
+@pytest.mark.parametrize('text, message', [
+    ('[1, 2]', '响应JSON不是字典类型'),
+    ('"data"', '响应JSON不是字典类型'),
+    ('{"data":{"a":1}}', 'data字段不是列表类型'),
+    ('{"data":"x"}', 'data字段不是列表类型'),
+])
+def test_structure_errors(text, message):
+    with pytest.raises(ValueError) as exc_info:
+        list(iter_json_array_items([text.encode()]))
+    assert not isinstance(exc_info.value, json.JSONDecodeError)
+    assert str(exc_info.value) == message
+
+def test_custom_key():
+    assert list(iter_json_array_items([b'{"data":[1],"rows":[2,3]}'], key='rows')) == [2, 3]
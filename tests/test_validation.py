@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from tracegen.events import EVENT_FIELDS
+from tracegen.perfetto.perfetto_trace_manager import PerfettoTraceManager
+from tracegen.validation import EventValidator, compile_schema
+
+VALID = {
+    'event_type': 'counter', 'process_name': 'cpu', 'track_name': 'total', 'event_name': 'total',
+    'timestamp': 1748473200000, 'value': 1.5, 'duration_ns': 0, 'category': 'cpu', 'pid': 1,
+    'message': '', 'arguments': {'a': 1},
+}
+
+def _check(mode='strict', **fields):
+    validator = EventValidator(mode)
+    event = dict(VALID, **fields)
+    return validator.check_for(0)(*(event[f] for f in EVENT_FIELDS))
+
+def test_valid_event_passes():
+    assert _check() is None
+
+@pytest.mark.parametrize('field', ['timestamp', 'value', 'duration_ns', 'pid'])
+@pytest.mark.parametrize('flag', [True, False])
+def test_bool_is_not_a_number(field, flag):
+    # JSON schema 中 boolean 不属于 number/integer，bool 是 int 的子类也不能放行
+    assert _check(**{field: flag}) == f'{field}类型非法'
+
+def test_bool_timestamp_rejected_by_required_check():
+    validator = EventValidator('sample', sample_every=100)
+    event = dict(VALID, timestamp=True)
+    assert validator.check_for(1)(*(event[f] for f in EVENT_FIELDS)) == 'timestamp类型非法'
+
+@pytest.mark.parametrize('fields', [
+    {'timestamp': np.float64(1748473200000.5)},
+    {'timestamp': np.int64(1748473200000)},
+    {'value': np.float32(2.5)},
+    {'value': None},
+    {'pid': np.int32(7)},
+    {'pid': 'com.example'},
+    {'duration_ns': None},
+])
+def test_numeric_subtypes_accepted(fields):
+    assert _check(**fields) is None
+
+@pytest.mark.parametrize('fields, reason', [
+    ({'process_name': ''}, 'process_name缺失'),
+    ({'timestamp': None}, 'timestamp缺失'),
+    ({'timestamp': '1748473200000'}, 'timestamp类型非法'),
+    ({'event_type': 'bogus'}, 'event_type取值非法'),
+    ({'duration_ns': 1.5}, 'duration_ns类型非法'),
+    ({'arguments': [1]}, 'arguments类型非法'),
+])
+def test_invalid_fields(fields, reason):
+    assert _check(**fields) == reason
+
+def test_compile_schema_subset():
+    schema = {'items': {'properties': {'timestamp': {'type': 'number'}, 'value': {'type': 'number'}},
+                        'required': ['timestamp']}}
+    check, source = compile_schema(schema, fields={'timestamp'})
+    assert 'value' not in source.split('\n', 1)[1]
+    event = dict(VALID, value=True)
+    assert check(*(event[f] for f in EVENT_FIELDS)) is None
+    event = dict(VALID, timestamp=False)
+    assert check(*(event[f] for f in EVENT_FIELDS)) == 'timestamp类型非法'
+
+def test_from_standard_format_skips_bool_fields(capsys):
+    manager = PerfettoTraceManager()
+    events = [dict(VALID), dict(VALID, timestamp=True), dict(VALID, value=False), dict(VALID, timestamp=VALID['timestamp'] + 1)]
+    assert manager.from_standard_format(events) == 2
+    out = capsys.readouterr().out
+    assert 'timestamp类型非法 1' in out and 'value类型非法 1' in out
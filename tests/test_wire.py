@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import itertools
+
+import numpy as np
+import pytest
+
+from tracegen.perfetto import perfetto_trace_pb2 as pftrace
+from tracegen.perfetto import wire
+
+TS = 1748473200 * 10 ** 9 + 123456789
+TRACK_UUID = 0x9E3779B97F4A7C15
+SEQ_ID = 4242
+
+def _serialize(**fields):
+    return pftrace.TracePacket(**fields).SerializeToString()
+
+def _frames(packets):
+    return pftrace.Trace(packet=packets).SerializeToString()
+
+@pytest.mark.parametrize('value', [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 0xFFFFFFF, 0x10000000, TS, 2 ** 63, 2 ** 64 - 1])
+def test_timestamp_varint(value):
+    assert wire.PACKET_TIMESTAMP + wire.timestamp_varint(value) == _serialize(timestamp=value)
+    assert wire.PACKET_TIMESTAMP + wire.varint(value) == _serialize(timestamp=value)
+
+@pytest.mark.parametrize('value', [-1, 2 ** 64])
+def test_varint_out_of_range(value):
+    with pytest.raises(ValueError):
+        wire.varint(value)
+
+@pytest.mark.parametrize('event_type', [
+    pftrace.TrackEvent.TYPE_SLICE_BEGIN, pftrace.TrackEvent.TYPE_SLICE_END,
+    pftrace.TrackEvent.TYPE_INSTANT, pftrace.TrackEvent.TYPE_COUNTER,
+])
+@pytest.mark.parametrize('interned', [False, True])
+@pytest.mark.parametrize('annotations', [0, 2])
+def test_track_event_packet(event_type, interned, annotations):
+    if interned:
+        prefix, suffix = wire.event_body_parts(event_type, TRACK_UUID, name_iid=3, category_iid=1)
+        event = pftrace.TrackEvent(type=event_type, track_uuid=TRACK_UUID, name_iid=3, category_iids=[1])
+    else:
+        prefix, suffix = wire.event_body_parts(event_type, TRACK_UUID, name='帧 jank', category='gfx')
+        event = pftrace.TrackEvent(type=event_type, track_uuid=TRACK_UUID, name='帧 jank', categories=['gfx'])
+    body = prefix
+    for i in range(annotations):
+        if interned:
+            head, tail = wire.annotation_name_parts(name_iid=10 + i)
+            event.debug_annotations.add(name_iid=10 + i, string_value=f"值{i}")
+        else:
+            head, tail = wire.annotation_name_parts(name=f"arg{i}")
+            event.debug_annotations.add(name=f"arg{i}", string_value=f"值{i}")
+        body += wire.encoded_annotation(head, f"值{i}", tail)
+    body += suffix
+    counter_value = 12.5 if event_type == pftrace.TrackEvent.TYPE_COUNTER else None
+    if counter_value is not None:
+        event.double_counter_value = counter_value
+    entries = [('event_names', 3, '帧 jank'), ('event_categories', 1, 'gfx')] if interned else []
+    expected = pftrace.TracePacket(timestamp=TS, trusted_packet_sequence_id=SEQ_ID, track_event=event)
+    for field, iid, name in entries:
+        getattr(expected.interned_data, field).add(iid=iid, name=name)
+    flags = 2 if interned else None
+    if flags is not None:
+        expected.sequence_flags = flags
+    packet = wire.track_event_packet(TS, SEQ_ID, body, counter_value, interned=wire.interned_data(entries),
+                                     sequence_flags=flags)
+    assert packet == expected.SerializeToString()
+    assert wire.frame(packet) == _frames([expected])
+
+def test_interned_data_orders_tables_by_field_number():
+    entries = [('debug_annotation_names', 1, 'raw_count'), ('event_names', 2, 'b'), ('event_categories', 1, 'c'),
+               ('event_names', 1, 'a')]
+    expected = pftrace.InternedData()
+    expected.event_categories.add(iid=1, name='c')
+    expected.event_names.add(iid=2, name='b')
+    expected.event_names.add(iid=1, name='a')
+    expected.debug_annotation_names.add(iid=1, name='raw_count')
+    assert wire.interned_data(entries) == expected.SerializeToString()
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'name': 'cpu_short'},
+    {'name': 'total', 'parent_uuid': 7, 'counter_unit': pftrace.CounterDescriptor.UNIT_COUNT},
+    {'process_name': 'surfaceflinger', 'pid': 1234},
+    {'process_name': 'proc'},
+    {'pid': -5},
+])
+def test_track_descriptor_packet(kwargs):
+    descriptor = pftrace.TrackDescriptor(uuid=TRACK_UUID)
+    if 'name' in kwargs:
+        descriptor.name = kwargs['name']
+    if 'parent_uuid' in kwargs:
+        descriptor.parent_uuid = kwargs['parent_uuid']
+    if 'counter_unit' in kwargs:
+        descriptor.counter.unit = kwargs['counter_unit']
+    if 'pid' in kwargs:
+        descriptor.process.pid = kwargs['pid']
+    if 'process_name' in kwargs:
+        descriptor.process.process_name = kwargs['process_name']
+    assert wire.track_descriptor_packet(TRACK_UUID, **kwargs) == _serialize(track_descriptor=descriptor)
+
+def _counter_timestamps(n):
+    # 跨越多个varint长度边界（2^28、2^35、2^56），覆盖分段向量化编码
+    edges = [0, 1, 2 ** 28 - 2, 2 ** 35 - 1, TS, 2 ** 56 + 3]
+    return [edge + i for edge, i in itertools.product(edges, range(n // len(edges) + 1))][:n]
+
+@pytest.mark.parametrize('n', [1, 5, wire.VECTORIZE_MIN_POINTS - 1, wire.VECTORIZE_MIN_POINTS, 500])
+@pytest.mark.parametrize('interned', [False, True])
+@pytest.mark.parametrize('flags', [None, 2])
+def test_counter_packets(n, interned, flags):
+    timestamps = _counter_timestamps(n)
+    values = np.random.default_rng(n).normal(size=n) * 1e6
+    values[0] = -0.0
+    if interned:
+        prefix, suffix = wire.event_body_parts(pftrace.TrackEvent.TYPE_COUNTER, TRACK_UUID, name_iid=2, category_iid=1)
+        fields = dict(name_iid=2, category_iids=[1])
+    else:
+        prefix, suffix = wire.event_body_parts(pftrace.TrackEvent.TYPE_COUNTER, TRACK_UUID, name='psi', category='cpu')
+        fields = dict(name='psi', categories=['cpu'])
+    expected = []
+    for ts, value in zip(timestamps, values.tolist()):
+        packet = pftrace.TracePacket(timestamp=ts, trusted_packet_sequence_id=SEQ_ID, track_event=pftrace.TrackEvent(
+            type=pftrace.TrackEvent.TYPE_COUNTER, track_uuid=TRACK_UUID, double_counter_value=value, **fields))
+        if flags is not None:
+            packet.sequence_flags = flags
+        expected.append(packet)
+    body = prefix + suffix
+    assert wire.counter_packets(timestamps, values, SEQ_ID, body, sequence_flags=flags) == _frames(expected)
+    assert wire.counter_packets(np.asarray(timestamps, dtype=np.uint64), values.tolist(), SEQ_ID, body,
+                                sequence_flags=flags) == _frames(expected)
+
+def test_counter_packets_empty_and_negative():
+    assert wire.counter_packets([], [], SEQ_ID, b'') == b''
+    with pytest.raises(ValueError):
+        wire.counter_packets(np.arange(-1, wire.VECTORIZE_MIN_POINTS), np.zeros(wire.VECTORIZE_MIN_POINTS + 1),
+                             SEQ_ID, b'')
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+class CounterBatch:
+    """
+    一条counter track的列式数据：
+    - timestamps: np.int64 数组，本地时区毫秒时间戳（与标准格式timestamp一致）
+    - values: np.float64 数组
+    - arguments: list[dict] 或 None，每个采样点的Arguments（如降采样后的raw_count）
+    """
+    __slots__ = ('process_name', 'track_name', 'event_name', 'category', 'timestamps', 'values', 'arguments', 'pid')
+    event_type = 'counter'
+
+    def __init__(self, process_name, track_name, event_name, timestamps, values, category='default', pid=None,
+                 arguments=None):
+        self.process_name = process_name
+        self.track_name = track_name
+        self.event_name = event_name
+        self.category = category
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.arguments = arguments
+        self.pid = pid
+
+    def __len__(self):
+        return len(self.timestamps)
+
+class SliceBatch:
+    """
+    一条slice track的列式数据：
+    - timestamps: np.int64 数组，本地时区毫秒时间戳（slice开始时间）
+    - durations_ns: np.int64 数组
+    - names: list[str]，每个slice的event_name
+    - arguments: list[dict] 或 None，每个slice的Arguments
+    """
+    __slots__ = ('process_name', 'track_name', 'category', 'timestamps', 'durations_ns', 'names', 'arguments', 'pid')
+    event_type = 'slice'
+
+    def __init__(self, process_name, track_name, timestamps, durations_ns, names, arguments=None, category='default', pid=None):
+        self.process_name = process_name
+        self.track_name = track_name
+        self.category = category
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.durations_ns = np.asarray(durations_ns, dtype=np.int64)
+        self.names = names
+        self.arguments = arguments
+        self.pid = pid
+
+    def __len__(self):
+        return len(self.timestamps)
+
+def column(rows, getter, dtype=np.float64):
+    """
+    对rows做一次批量遍历，按getter取出一列并转为NumPy数组。
+    """
+    return np.fromiter((getter(row) for row in rows), dtype=dtype, count=len(rows))
+
+def select(batch, keep):
+    """
+    按布尔掩码keep取出批次中的部分采样/slice，返回新的批次（全部保留时返回原批次）。
+    """
+    if keep.all():
+        return batch
+    idx = np.flatnonzero(keep)
+    arguments = [batch.arguments[i] for i in idx] if batch.arguments is not None else None
+    if batch.event_type == 'slice':
+        return SliceBatch(batch.process_name, batch.track_name, batch.timestamps[keep], batch.durations_ns[keep],
+                          [batch.names[i] for i in idx], arguments=arguments, category=batch.category, pid=batch.pid)
+    return CounterBatch(batch.process_name, batch.track_name, batch.event_name, batch.timestamps[keep],
+                        batch.values[keep], category=batch.category, pid=batch.pid, arguments=arguments)
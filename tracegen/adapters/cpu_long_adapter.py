@@ -1,78 +1,139 @@
-from tracegen.utils import parse_datetime_to_ms
+from tracegen.utils import parse_datetime_to_ms, parse_datetime_column
+from tracegen.adapters.columnar import CounterBatch
+from tracegen.events import StandardEvent
 import json
+import numpy as np
 
-def cpu_long_to_standard(json_data):
+class ProcStateTable:
+    """
+    cpu_long 的进程状态表：track_name -> [上次value, pid, 最近出现的采样序号]，只保存当前存活的进程。
+    每个采样时间点只处理本时间点出现的进程；仅当上一个时间点存活的进程没有全部再次出现时，
+    才遍历上一时间点的进程找出真正消失的进程补0（补0后从表中移除）。
+    drop_unchanged=True 时，连续存活且value与上次相同的采样点不再输出（counter在下一个采样点之前保持原值，
+    Perfetto UI中曲线不变；被丢弃采样点的arguments不会写入trace）。
+    """
+    __slots__ = ('drop_unchanged', 'tracks', 'alive', 'tick')
+
+    def __init__(self, drop_unchanged=False):
+        self.drop_unchanged = drop_unchanged
+        self.tracks = {}
+        self.alive = ()  # 上一个时间点存活的track_name
+        self.tick = 0
+
+    def update(self, proc_map):
+        """
+        输入一个采样时间点的 {track_name: proc}，返回需要输出的 [(track_name, value, pid, proc)]，
+        消失补0的项proc为None。
+        """
+        self.tick += 1
+        tick = self.tick
+        tracks = self.tracks
+        out = []
+        carried = 0
+        for track_name, proc in proc_map.items():
+            value = float(proc.get('total', 0))
+            pid = proc.get('pid', '')
+            state = tracks.get(track_name)
+            if state is None:
+                tracks[track_name] = [value, pid, tick]
+                out.append((track_name, value, pid, proc))
+                continue
+            carried += 1
+            state[1] = pid
+            state[2] = tick
+            if self.drop_unchanged and state[0] == value:
+                continue
+            state[0] = value
+            out.append((track_name, value, pid, proc))
+        if carried < len(self.alive):
+            for track_name in self.alive:
+                state = tracks[track_name]
+                if state[2] != tick:
+                    out.append((track_name, 0.0, state[1], None))
+                    del tracks[track_name]
+        self.alive = tuple(proc_map)
+        return out
+
+def _iter_samples(timed_rows):
+    """
+    按时间顺序的 (ts, row) -> 每个采样时间点的 (ts, {track_name: proc})；相邻的多行时间相同时只保留最后一行。
+    """
+    curr_ts = None
+    curr_map = None
+    for ts, item in timed_rows:
+        proc_map = {}
+        for proc in json.loads(item.get('proc_info', '[]')):
+            proc_map[f"{proc.get('procName', '')}({proc.get('pid', '')})"] = proc
+        if curr_map is not None and ts != curr_ts:
+            yield curr_ts, curr_map
+        curr_ts, curr_map = ts, proc_map
+    if curr_map is not None:
+        yield curr_ts, curr_map
+
+def iter_cpu_long_standard(rows, drop_unchanged=False):
+    """
+    cpu_long_to_standard 的生成器版本：单遍扫描，每读完一个采样时间点就产出该时间点的事件，
+    内存中只保留存活进程的状态表（ProcStateTable）。
+    要求rows按collect_time升序（接口按时间顺序返回）；相邻的多行时间相同时只保留最后一行。
+    """
+    table = ProcStateTable(drop_unchanged)
+    timed_rows = ((parse_datetime_to_ms(item.get('collect_time', '')), item) for item in rows)
+    for ts, proc_map in _iter_samples(timed_rows):
+        for track_name, value, pid, proc in table.update(proc_map):
+            if proc is not None:
+                arguments = {
+                    'pid': pid,
+                    'cswch': proc.get('cswch', ''),
+                    'nvcswch': proc.get('nvcswch', ''),
+                    'system': proc.get('system', ''),
+                    'user': proc.get('user', ''),
+                }
+            else:
+                # 进程消失补0，尽量保留上一个时间点的pid
+                arguments = {'pid': pid, 'cswch': '', 'nvcswch': '', 'system': '', 'user': ''}
+            yield StandardEvent(
+                event_type='counter',
+                process_name='proc_cpu_usage_200s',
+                track_name=track_name,
+                event_name=track_name,
+                timestamp=ts,
+                value=value,
+                category='cpu_long',
+                arguments=arguments,
+            )
+
+def cpu_long_to_standard(json_data, drop_unchanged=False):
     """
     将CPU长周期数据转为标准trace格式：
     - process_name统一为'proc_cpu_usage_200s'
     - track_name和event_name为进程名(pid)
-    - 每个采样点每个进程都生成counter事件，缺失补0（对比上一个时间点）
+    - 每个采样点每个进程都生成counter事件，进程消失时补一个0（对比上一个时间点）
     - arguments保留pid/cswch/nvcswch/system/user
     - value为total
+    - drop_unchanged=True 时省略value未变化的采样点
     """
-    timestamps = []
-    time_proc_map = {}
-    all_proc_names = set()
-    for idx, item in enumerate(json_data):
-        ts = parse_datetime_to_ms(item.get('collect_time', ''))
-        timestamps.append(ts)
-        proc_info_list = json.loads(item.get('proc_info', '[]'))
-        proc_map = {}
-        for proc in proc_info_list:
-            proc_name = proc.get('procName', '')
-            pid = proc.get('pid', '')
-            track_key = f"{proc_name}({pid})"
-            all_proc_names.add(track_key)
-            proc_map[track_key] = proc
-        time_proc_map[ts] = proc_map
-    timestamps = sorted(set(timestamps))
-    result = []
-    prev_proc_set = set()
-    for idx, ts in enumerate(timestamps):
-        proc_map = time_proc_map.get(ts, {})
-        curr_proc_set = set(proc_map.keys())
-        # 1. 正常生成当前进程事件
-        for track_name, proc in proc_map.items():
-            value = float(proc.get('total', 0))
-            arguments = {
-                'pid': proc.get('pid', ''),
-                'cswch': proc.get('cswch', ''),
-                'nvcswch': proc.get('nvcswch', ''),
-                'system': proc.get('system', ''),
-                'user': proc.get('user', ''),
-            }
-            event = {
-                'event_type': 'counter',
-                'process_name': 'proc_cpu_usage_200s',
-                'track_name': track_name,
-                'event_name': track_name,
-                'timestamp': ts,
-                'value': value,
-                'category': 'cpu_long',
-                'arguments': arguments
-            }
-            result.append(event)
-        # 2. 对比上一个时间点，缺失的进程补0
-        if idx > 0:
-            lost_procs = prev_proc_set - curr_proc_set
-            for lost_track in lost_procs:
-                # 尽量保留上一个时间点的pid
-                pid = ''
-                if lost_track in prev_proc_pid_map:
-                    pid = prev_proc_pid_map[lost_track]
-                event = {
-                    'event_type': 'counter',
-                    'process_name': 'proc_cpu_usage_200s',
-                    'track_name': lost_track,
-                    'event_name': lost_track,
-                    'timestamp': ts,
-                    'value': 0.0,
-                    'category': 'cpu_long',
-                    'arguments': {'pid': pid, 'cswch': '', 'nvcswch': '', 'system': '', 'user': ''}
-                }
-                result.append(event)
-        # 记录本轮track_name和pid
-        curr_proc_pid_map = {track: proc.get('pid', '') for track, proc in proc_map.items()}
-        prev_proc_set = curr_proc_set
-        prev_proc_pid_map = curr_proc_pid_map
-    return result 
\ No newline at end of file
+    # 按时间稳定排序后复用单遍扫描，同一时间点的多行仍以最后一行为准
+    rows = sorted(json_data, key=lambda item: parse_datetime_to_ms(item.get('collect_time', '')))
+    return list(iter_cpu_long_standard(rows, drop_unchanged))
+
+def cpu_long_to_columnar(json_data, drop_unchanged=False):
+    """
+    cpu_long 的列式版本：每个进程track输出一个 CounterBatch，补0/省略规则与 cpu_long_to_standard 一致。
+    collect_time 整列批量解析。
+    :return: list[CounterBatch]
+    """
+    collect_ms = parse_datetime_column([item.get('collect_time', '') for item in json_data])
+    order = np.argsort(collect_ms, kind='stable').tolist()
+    collect_ms = collect_ms.tolist()
+    table = ProcStateTable(drop_unchanged)
+    # track_name -> ([timestamps], [values])
+    columns = {}
+    for ts, proc_map in _iter_samples((collect_ms[idx], json_data[idx]) for idx in order):
+        for track_name, value, _, _ in table.update(proc_map):
+            ts_list, val_list = columns.setdefault(track_name, ([], []))
+            ts_list.append(ts)
+            val_list.append(value)
+    return [
+        CounterBatch('proc_cpu_usage_200s', track_name, track_name, ts_list, val_list, category='cpu_long')
+        for track_name, (ts_list, val_list) in columns.items()
+    ]
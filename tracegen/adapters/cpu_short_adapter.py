@@ -1,4 +1,7 @@
-from tracegen.utils import parse_offset_str, parse_datetime_to_ms
+from tracegen.utils import parse_offset_str, parse_datetime_to_ms, parse_datetime_column
+from tracegen.adapters.columnar import CounterBatch, column
+from tracegen.events import StandardEvent
+import numpy as np
 import json
 
 def safe_float(val, default=0.0):
@@ -26,18 +29,17 @@ def build_counter_event(item, field, offset_sec_str=None):
     :param item: 单条原始数据
     :param field: 字段名
     :param offset_sec_str: 业务偏移
-    :return: dict 标准事件
+    :return: StandardEvent 标准事件
     """
-    return {
-        "event_type": "counter",
-        "process_name": "cpu_short_30s",
-        "track_name": field,
-        "event_name": field,
-        "timestamp": parse_collect_time_to_ms(item.get("collect_time"), offset_sec_str=offset_sec_str),
-        "value": safe_float(item.get(field, 0)),
-        "category": "cpu_short",
-        "arguments": {}  # 预留，便于后续扩展
-    }
+    return StandardEvent(
+        event_type="counter",
+        process_name="cpu_short_30s",
+        track_name=field,
+        event_name=field,
+        timestamp=parse_collect_time_to_ms(item.get("collect_time"), offset_sec_str=offset_sec_str),
+        value=safe_float(item.get(field, 0)),
+        category="cpu_short",
+    )
 
 def build_psi_avg10_events(item):
     """
@@ -56,19 +58,29 @@ def build_psi_avg10_events(item):
     except Exception:
         return events
     for key, val in psi_dict.items():
-        event = {
-            "event_type": "counter",
-            "process_name": "psi_avg_10s",
-            "track_name": key,
-            "event_name": key,
-            "timestamp": parse_collect_time_to_ms(item.get("collect_time"), offset_sec_str="10s"),
-            "value": safe_float(val),
-            "category": "cpu_short",
-            "arguments": {}
-        }
-        events.append(event)
+        events.append(StandardEvent(
+            event_type="counter",
+            process_name="psi_avg_10s",
+            track_name=key,
+            event_name=key,
+            timestamp=parse_collect_time_to_ms(item.get("collect_time"), offset_sec_str="10s"),
+            value=safe_float(val),
+            category="cpu_short",
+        ))
     return events
 
+def iter_cpu_short_standard(rows):
+    """
+    cpu_short_to_standard 的生成器版本：逐行读取原始数据并逐个产出标准事件，
+    rows可以是任意可迭代对象（如 data_fetcher.iter_data 的流式输出）。
+    """
+    fields = ["soft_irq", "total", "kernel", "irq", "nice", "user"]
+    for item in rows:
+        for field in fields:
+            yield build_counter_event(item, field, offset_sec_str='30s')
+        # 处理psi_avg10
+        yield from build_psi_avg10_events(item)
+
 def cpu_short_to_standard(json_data):
     """
     将 cpu_short 数据转为标准 trace 格式。
@@ -76,11 +88,37 @@ def cpu_short_to_standard(json_data):
     :param json_data: 原始数据列表
     :return: 标准格式事件列表
     """
+    return list(iter_cpu_short_standard(json_data))
+
+def cpu_short_to_columnar(json_data):
+    """
+    cpu_short 的列式版本：每个字段、每个psi key 输出一个 CounterBatch。
+    collect_time 每行只解析一次，偏移量每个适配器只计算一次。
+    :param json_data: 原始数据列表
+    :return: list[CounterBatch]
+    """
     fields = ["soft_irq", "total", "kernel", "irq", "nice", "user"]
-    standard_list = []
-    for item in json_data:
-        for field in fields:
-            standard_list.append(build_counter_event(item, field, offset_sec_str='30s'))
-        # 处理psi_avg10
-        standard_list.extend(build_psi_avg10_events(item))
-    return standard_list 
\ No newline at end of file
+    collect_ms = parse_datetime_column([item.get("collect_time") for item in json_data])
+    field_ts = collect_ms - parse_offset_str('30s') * 1000
+    batches = []
+    for field in fields:
+        values = column(json_data, lambda item: safe_float(item.get(field, 0)))
+        batches.append(CounterBatch("cpu_short_30s", field, field, field_ts, values, category="cpu_short"))
+    # psi_avg10：按key收集 (行号, 值)
+    psi_rows = {}
+    for row_idx, item in enumerate(json_data):
+        psi_str = item.get("psi_avg10", "")
+        if not psi_str:
+            continue
+        try:
+            psi_dict = json.loads(psi_str)
+        except Exception:
+            continue
+        for key, val in psi_dict.items():
+            idxs, vals = psi_rows.setdefault(key, ([], []))
+            idxs.append(row_idx)
+            vals.append(safe_float(val))
+    psi_ts = collect_ms - parse_offset_str('10s') * 1000
+    for key, (idxs, vals) in psi_rows.items():
+        batches.append(CounterBatch("psi_avg_10s", key, key, psi_ts[np.asarray(idxs, dtype=np.int64)], vals, category="cpu_short"))
+    return batches
@@ -1,6 +1,40 @@
 # -*- coding: utf-8 -*-
 from collections import defaultdict
-from tracegen.utils import parse_datetime_to_ms
+from tracegen.utils import parse_datetime_to_ms, parse_datetime_column
+from tracegen.adapters.columnar import SliceBatch, column
+from tracegen.events import StandardEvent
+import numpy as np
+
+# 需要放入arguments的字段
+ARGUMENT_FIELDS = [
+    'mark_animation_time', 'ui_draw_time', 'sync_time', 'handle_input_time',
+    'draw_command_time', 'perform_traversals_time', 'current_frame_index',
+    'gpu_slow', 'ui_thread_dely', 'swap_buffers_and_gpu_draw_time'
+]
+
+def build_gfx_event(item, jank_event):
+    """
+    将单条GFX原始数据转为标准slice事件。
+    """
+    window_name = item.get('window_name', '')
+    # 统一用工具函数转毫秒时间戳
+    create_time_ms = parse_datetime_to_ms(item.get('create_time', ''))
+    total_duration = int(item.get('total_duration', 0))
+    # slice开始时间 = create_time_ms - total_duration
+    timestamp = create_time_ms - total_duration
+    duration_ns = total_duration * 1_000_000
+    # arguments字段收集
+    arguments = {field: item.get(field) for field in ARGUMENT_FIELDS}
+    return StandardEvent(
+        event_type='slice',
+        process_name='gfx_200ms',
+        track_name=jank_event,
+        timestamp=timestamp,
+        duration_ns=duration_ns,
+        event_name=window_name,
+        category='gfx',
+        arguments=arguments,
+    )
 
 def gfx_to_standard(json_data):
     """
@@ -13,12 +47,6 @@ def gfx_to_standard(json_data):
     - duration_ns为total_duration*1_000_000
     - arguments字段包含指定性能细节字段
     """
-    # 需要放入arguments的字段
-    argument_fields = [
-        'mark_animation_time', 'ui_draw_time', 'sync_time', 'handle_input_time',
-        'draw_command_time', 'perform_traversals_time', 'current_frame_index',
-        'gpu_slow', 'ui_thread_dely', 'swap_buffers_and_gpu_draw_time'
-    ]
     result = []
     # 按jank_event分组
     groups = defaultdict(list)
@@ -27,24 +55,32 @@ def gfx_to_standard(json_data):
         groups[jank_event].append(item)
     for jank_event, items in groups.items():
         for item in items:
-            window_name = item.get('window_name', '')
-            # 统一用工具函数转毫秒时间戳
-            create_time_ms = parse_datetime_to_ms(item.get('create_time', ''))
-            total_duration = int(item.get('total_duration', 0))
-            # slice开始时间 = create_time_ms - total_duration
-            timestamp = create_time_ms - total_duration
-            duration_ns = total_duration * 1_000_000
-            # arguments字段收集
-            arguments = {field: item.get(field) for field in argument_fields}
-            event = {
-                'event_type': 'slice',
-                'process_name': 'gfx_200ms',
-                'track_name': jank_event,
-                'timestamp': timestamp,
-                'duration_ns': duration_ns,
-                'event_name': window_name,
-                'category': 'gfx',
-                'arguments': arguments
-            }
-            result.append(event)
-    return result 
\ No newline at end of file
+            result.append(build_gfx_event(item, jank_event))
+    return result
+
+def iter_gfx_standard(rows):
+    """
+    gfx_to_standard 的生成器版本：不分组，按到达顺序逐行产出slice事件
+    （同一track上的事件集合与分组版本一致，只是写出顺序不同）。
+    """
+    for item in rows:
+        yield build_gfx_event(item, item.get('jank_event', 'Unknown'))
+
+def gfx_to_columnar(json_data):
+    """
+    GFX 的列式版本：按jank_event分组，每组输出一个 SliceBatch。
+    create_time 每行只解析一次，开始时间与时长按列批量计算。
+    :return: list[SliceBatch]
+    """
+    groups = defaultdict(list)
+    for item in json_data:
+        groups[item.get('jank_event', 'Unknown')].append(item)
+    batches = []
+    for jank_event, items in groups.items():
+        create_ms = parse_datetime_column([item.get('create_time', '') for item in items])
+        total_duration = column(items, lambda item: int(item.get('total_duration', 0)), dtype=np.int64)
+        names = [item.get('window_name', '') for item in items]
+        arguments = [{field: item.get(field) for field in ARGUMENT_FIELDS} for item in items]
+        batches.append(SliceBatch('gfx_200ms', jank_event, create_ms - total_duration, total_duration * 1_000_000,
+                                  names, arguments, category='gfx'))
+    return batches
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+import importlib
+import threading
+
+# 第三方数据类型通过该entry point组注册适配器，无需修改tracegen：
+#   [project.entry-points."tracegen.adapters"]
+#   mytype = "my_pkg.adapters:ADAPTERS"
+# 加载得到的对象可以是标准格式适配器函数（rows -> 标准事件列表），
+# 或 {'standard': ..., 'columnar': ..., 'iter': ...} 字典，值为函数或 "模块:函数" 字符串。
+ENTRY_POINT_GROUP = 'tracegen.adapters'
+# 适配器种类：standard 标准格式（必需）、columnar 列式批次（可选）、iter 生成器（可选，缺省时由standard包装）
+ADAPTER_KINDS = ('standard', 'columnar', 'iter')
+
+# 内置适配器，以 "模块:函数" 登记，只有用到某个类型时才导入对应模块（及NumPy）
+BUILTIN_ADAPTERS = {
+    'short': {
+        'standard': 'tracegen.adapters.cpu_short_adapter:cpu_short_to_standard',
+        'columnar': 'tracegen.adapters.cpu_short_adapter:cpu_short_to_columnar',
+        'iter': 'tracegen.adapters.cpu_short_adapter:iter_cpu_short_standard',
+    },
+    'gfx': {
+        'standard': 'tracegen.adapters.gfx_adapter:gfx_to_standard',
+        'columnar': 'tracegen.adapters.gfx_adapter:gfx_to_columnar',
+        'iter': 'tracegen.adapters.gfx_adapter:iter_gfx_standard',
+    },
+    'long': {
+        'standard': 'tracegen.adapters.cpu_long_adapter:cpu_long_to_standard',
+        'columnar': 'tracegen.adapters.cpu_long_adapter:cpu_long_to_columnar',
+        'iter': 'tracegen.adapters.cpu_long_adapter:iter_cpu_long_standard',
+    },
+}
+
+def load_object(ref):
+    """
+    "模块:属性"（属性可带点号）-> 对象；非字符串原样返回。
+    """
+    if not isinstance(ref, str):
+        return ref
+    module_name, _, attr = ref.partition(':')
+    obj = importlib.import_module(module_name)
+    for name in filter(None, attr.split('.')):
+        obj = getattr(obj, name)
+    return obj
+
+def _iter_entry_points(group):
+    """
+    返回group下的entry point列表，兼容 Python 3.8/3.9 的 importlib.metadata 接口。
+    """
+    from importlib import metadata
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, ()))
+
+def _iter_from_standard(standard):
+    """
+    没有提供生成器适配器的类型：调用标准格式适配器后逐条产出（不再逐行流式，但可用于lazy模式）。
+    """
+    def adapter(rows, **kwargs):
+        yield from standard(list(rows), **kwargs)
+    return adapter
+
+class AdapterRegistry:
+    """
+    数据类型 -> 适配器 的注册表：
+    - 内置类型与 register() 登记的类型以 "模块:函数" 字符串保存，get() 时才导入对应模块，结果缓存
+    - 第三方类型来自 entry point 组 tracegen.adapters，只有查询到未登记的类型（或列出全部类型）时才扫描，
+      且只加载被请求的那一个；与已登记类型同名的entry point被忽略
+    线程安全。
+    """
+    def __init__(self, adapters=None, group=ENTRY_POINT_GROUP):
+        self._specs = {data_type: dict(spec) for data_type, spec in (adapters or {}).items()}
+        self._entry_points = None
+        self._loaded = {}
+        self._group = group
+        self._lock = threading.RLock()
+
+    def register(self, data_type, standard, columnar=None, iter=None):
+        """
+        登记一个数据类型，各适配器为函数或 "模块:函数" 字符串，同名类型覆盖原有登记。
+        """
+        spec = {'standard': standard, 'columnar': columnar, 'iter': iter}
+        with self._lock:
+            self._specs[data_type] = {kind: ref for kind, ref in spec.items() if ref is not None}
+            self._loaded = {key: fn for key, fn in self._loaded.items() if key[0] != data_type}
+
+    def _discover(self):
+        """
+        扫描entry point（只读取名字，不导入插件模块），每个实例只扫描一次。
+        """
+        if self._entry_points is None:
+            try:
+                eps = _iter_entry_points(self._group)
+            except Exception as e:
+                print(f"[WARN] 读取适配器entry point失败: {e}")
+                eps = []
+            self._entry_points = {ep.name: ep for ep in eps if ep.name not in self._specs}
+        return self._entry_points
+
+    def _spec(self, data_type):
+        with self._lock:
+            spec = self._specs.get(data_type)
+            if spec is not None:
+                return spec
+            ep = self._discover().get(data_type)
+            if ep is None:
+                return None
+            obj = ep.load()
+            spec = dict(obj) if isinstance(obj, dict) else {'standard': obj}
+            if 'standard' not in spec:
+                raise ValueError(f"适配器插件 {ep.name}（{ep.value}）缺少standard适配器")
+            self._specs[data_type] = spec
+            return spec
+
+    def __contains__(self, data_type):
+        return self._spec(data_type) is not None
+
+    def has(self, data_type, kind='standard'):
+        """
+        是否提供该类型的某种适配器（iter总是可用：缺省时由standard包装）。
+        """
+        spec = self._spec(data_type)
+        return spec is not None and (kind in spec or kind == 'iter')
+
+    def get(self, data_type, kind='standard'):
+        """
+        返回适配器函数（首次调用时导入），类型未登记时抛出KeyError。
+        """
+        key = (data_type, kind)
+        fn = self._loaded.get(key)
+        if fn is not None:
+            return fn
+        spec = self._spec(data_type)
+        if spec is None or not (kind in spec or kind == 'iter'):
+            raise KeyError(f"{data_type}/{kind}")
+        with self._lock:
+            if kind in spec:
+                fn = load_object(spec[kind])
+            else:
+                fn = _iter_from_standard(self.get(data_type, 'standard'))
+            self._loaded[key] = fn
+        return fn
+
+    def types(self):
+        """
+        全部可用的数据类型（内置/登记的在前，entry point的按名字排序在后）。
+        """
+        with self._lock:
+            return list(self._specs) + sorted(name for name in self._discover() if name not in self._specs)
+
+    def view(self, kind):
+        """
+        只读的 {数据类型: 适配器} 映射视图，兼容原先的 ADAPTER_MAP 等字典用法（取值时才导入）。
+        """
+        return AdapterView(self, kind)
+
+class AdapterView:
+    """
+    AdapterRegistry 某一种适配器的映射视图，支持 view[type]、type in view、迭代与 get()。
+    """
+    def __init__(self, registry, kind):
+        self._registry = registry
+        self._kind = kind
+
+    def __getitem__(self, data_type):
+        return self._registry.get(data_type, self._kind)
+
+    def __contains__(self, data_type):
+        return self._registry.has(data_type, self._kind)
+
+    def __iter__(self):
+        return iter([t for t in self._registry.types() if self._registry.has(t, self._kind)])
+
+    def get(self, data_type, default=None):
+        return self[data_type] if data_type in self else default
+
+    def keys(self):
+        return list(self)
+
+# 进程内共享的注册表
+ADAPTERS = AdapterRegistry(BUILTIN_ADAPTERS)
+
+def register_adapter(data_type, standard, columnar=None, iter=None):
+    """
+    在进程内注册表中登记数据类型（不打包为插件时使用），参数同 AdapterRegistry.register。
+    """
+    ADAPTERS.register(data_type, standard, columnar=columnar, iter=iter)
@@ -1,19 +1,211 @@
 # -*- coding: utf-8 -*-
-from .adapters.cpu_short_adapter import cpu_short_to_standard
-from .adapters.gfx_adapter import gfx_to_standard
-from .adapters.cpu_long_adapter import cpu_long_to_standard
-from .data_fetcher import fetch_data
-from .perfetto.perfetto_trace_manager import PerfettoTraceManager
+# 只导入轻量模块：适配器、NumPy、requests 与 perfetto_trace_pb2 在真正转换时才导入，
+# tracegen --help 等不转换数据的调用不付出这部分启动开销（见 benchmarks/bench_import.py）
+from .adapters.registry import ADAPTERS, register_adapter
+from .data_fetcher import set_metrics, DEFAULT_CHUNK_MINUTES, DEFAULT_TIMEOUT
+from .data_cache import DataCache, TraceCache, TIME_FORMAT, is_window_complete, trace_content_hash
+from .perfetto.trace_writer import COMPRESSION_SUFFIX, resolve_compression
+from .trace_index import TrackWatermarks, load_trace_index, save_trace_index, move_trace
+from .utils import parse_datetime_to_ms
+from .metrics import PipelineMetrics
+import contextlib
+import datetime
 import os
+import tempfile
+import time
 
-# 适配器映射表，后续可扩展其它类型
-ADAPTER_MAP = {
-    'short': cpu_short_to_standard,
-    'gfx': gfx_to_standard,
-    'long': cpu_long_to_standard,
-}
+# 适配器映射表（tracegen.adapters.registry 的只读视图，取值时才导入对应适配器模块）；
+# 新的数据类型通过entry point组 tracegen.adapters 或 register_adapter() 注册
+ADAPTER_MAP = ADAPTERS.view('standard')
 
-def run_trace_convert(vin, start_time, end_time, types, timezone, output_dir):
+# 列式适配器：输出 CounterBatch/SliceBatch，交给 PerfettoTraceManager.from_columnar
+COLUMNAR_ADAPTER_MAP = ADAPTERS.view('columnar')
+
+# 生成器适配器：逐行消费原始数据、逐个产出标准事件，用于lazy模式
+ITER_ADAPTER_MAP = ADAPTERS.view('iter')
+
+# 并行转换时各分片的自动pid区间：第i个分片从 BASE + i * STRIDE 起分配，避免合并后pid冲突
+SHARD_AUTO_PID_BASE = 10000
+SHARD_AUTO_PID_STRIDE = 1000
+
+# 追加模式向前多拉取的分钟数：适配器依赖前一行的状态（如cpu_long进程消失时补0、drop_unchanged），
+# 这部分数据只用于恢复状态，转换出的事件中上一次已写入的部分按track水位去掉（见 TrackWatermarks）
+APPEND_LOOKBACK_MINUTES = 10
+
+# 支持 drop_unchanged（省略value未变化的counter采样点）的适配器类型
+DROP_UNCHANGED_TYPES = {'long'}
+
+def _count_rows(rows, counter, key):
+    """
+    透传原始数据行，同时在counter[key]中累计行数。
+    """
+    counter[key] = 0
+    for row in rows:
+        counter[key] += 1
+        yield row
+
+def _file_identity(path):
+    """
+    输入文件的 (绝对路径, 大小, 修改时间)，用于trace缓存的内容哈希。
+    """
+    st = os.stat(path)
+    return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+
+def _stage(metrics, stage):
+    return metrics.timer(stage) if metrics is not None else contextlib.nullcontext()
+
+def _decimate(batches, decimate, resolutions, window):
+    """
+    对counter批次降采样，并打印采样点数变化。
+    """
+    from .decimate import decimate_batches
+    raw = sum(len(batch) for batch in batches if batch.event_type == 'counter')
+    batches = decimate_batches(batches, decimate, resolutions, *window)
+    kept = sum(len(batch) for batch in batches if batch.event_type == 'counter')
+    print(f"📉 counter降采样（{decimate}）：{raw} -> {kept} 个采样点")
+    return batches
+
+def _from_standard(manager, events, decimate, resolutions, window, watermarks=None):
+    """
+    标准格式事件写入manager；开启降采样时counter事件按track收集，降采样后以列式批次写入。
+    watermarks: 可选的 TrackWatermarks，事件先经过它过滤并记录各track的水位。
+    """
+    if watermarks is not None:
+        events = watermarks.events(events)
+    if not decimate:
+        return manager.from_standard_format(events)
+    from .decimate import CounterCollector
+    collector = CounterCollector()
+    count = manager.from_standard_format(collector.filter(events))
+    return count + manager.from_columnar(_decimate(collector.batches(), decimate, resolutions, window))
+
+def _convert_types(manager, vin, start_time, end_time, types, stats, metrics, lazy, timeout, chunk_minutes,
+                   use_cache, refresh, columnar, adapter_kwargs, decimate, resolutions, window, watermarks=None):
+    """
+    拉取types中的各数据类型并转换写入manager，返回各类型拉取耗时合计（秒）。
+    有子区间/时间桶拉取失败（被跳过）的类型，错误信息记入 stats['fetch_errors'][data_type]。
+    watermarks: 可选的 TrackWatermarks：记录各track写入的最大结束时间，追加模式下去掉上一次已写入的事件。
+    """
+    from .data_fetcher import fetch_many, iter_data
+    set_metrics(metrics)
+    try:
+        if lazy:
+            # 各类型依次流式拉取：原始行 -> 标准事件 -> packet 全程逐条传递
+            for data_type in types:
+                print(f"🚀 >>>>> 开始流式处理 「{data_type}」 数据 >>>>>")
+                begin = time.perf_counter()
+                fetch_errors = []
+                rows = _count_rows(iter_data(vin, start_time, end_time, data_type, timeout=timeout, errors=fetch_errors),
+                                   stats['rows'], data_type)
+                if metrics is not None:
+                    metrics.begin_type(data_type)
+                    rows = metrics.timed_iter(rows, 'json_decode')
+                events = ITER_ADAPTER_MAP[data_type](rows, **adapter_kwargs[data_type])
+                if metrics is not None:
+                    events = metrics.timed_iter(events, 'adapter')
+                try:
+                    with _stage(metrics, 'packet_build'):
+                        event_count = _from_standard(manager, events, decimate, resolutions, window, watermarks)
+                    stats['events'][data_type] = event_count
+                    print(f"✅ <<<<< {data_type} 数据处理完成，共 {stats['rows'][data_type]} 行原始数据、{event_count} 条标准事件。 <<<<<")
+                except Exception as e:
+                    print(f"❌ <<<<< {data_type} 数据处理失败，已跳过。原因: {e} <<<<<")
+                if fetch_errors:
+                    stats['fetch_errors'][data_type] = fetch_errors
+                stats['fetch_seconds'][data_type] = time.perf_counter() - begin
+                if metrics is not None:
+                    metrics.add_count(data_type, rows=stats['rows'].get(data_type, 0), events=stats['events'].get(data_type, 0))
+                    metrics.end_type(data_type)
+            return sum(stats['fetch_seconds'].values())
+        # 所有类型并发拉取，按types顺序依次转换（转换当前类型时其余类型仍在后台拉取）
+        cache = DataCache() if use_cache else None
+        fetch_elapsed_sum = 0.0
+        for data_type, raw_data, elapsed in fetch_many(vin, start_time, end_time, types,
+                                                          chunk_minutes=chunk_minutes, timeout=timeout,
+                                                          cache=cache, refresh=refresh, errors=stats['fetch_errors']):
+            fetch_elapsed_sum += elapsed
+            stats['rows'][data_type] = len(raw_data)
+            stats['fetch_seconds'][data_type] = elapsed
+            print(f"🚀 >>>>> 开始处理 「{data_type}」 数据（拉取耗时 {elapsed:.2f}s） >>>>>")
+            if metrics is not None:
+                metrics.begin_type(data_type)
+            try:
+                if columnar and data_type in COLUMNAR_ADAPTER_MAP:
+                    with _stage(metrics, 'adapter'):
+                        batches = COLUMNAR_ADAPTER_MAP[data_type](raw_data, **adapter_kwargs[data_type])
+                        if watermarks is not None:
+                            batches = watermarks.batches(batches)
+                    if decimate:
+                        with _stage(metrics, 'decimate'):
+                            batches = _decimate(batches, decimate, resolutions, window)
+                    with _stage(metrics, 'packet_build'):
+                        event_count = manager.from_columnar(batches)
+                else:
+                    with _stage(metrics, 'adapter'):
+                        standard_data = ADAPTER_MAP[data_type](raw_data, **adapter_kwargs[data_type])
+                    with _stage(metrics, 'packet_build'):
+                        event_count = _from_standard(manager, standard_data, decimate, resolutions, window, watermarks)
+                stats['events'][data_type] = event_count
+                print(f"✅ <<<<< {data_type} 数据处理完成，共 {event_count} 条标准事件。 <<<<<")
+            except Exception as e:
+                print(f"❌ <<<<< {data_type} 数据处理失败，已跳过。原因: {e} <<<<<")
+            finally:
+                if metrics is not None:
+                    metrics.add_count(data_type, rows=len(raw_data), events=stats['events'].get(data_type, 0))
+                    metrics.end_type(data_type)
+        return fetch_elapsed_sum
+    finally:
+        set_metrics(None)
+
+def _convert_shard(shard_path, vin, start_time, end_time, data_type, auto_pid_base, manager_kwargs, profile, options):
+    """
+    工作进程：单个数据类型拉取、转换并写出未压缩的分片文件（不含时钟快照），
+    使用独立的trusted_packet_sequence_id、track uuid命名空间（数据类型）与自动pid区间。
+    返回 (stats, 分类型指标 或 None)，只有普通对象跨进程传递。
+    """
+    from .perfetto.perfetto_trace_manager import PerfettoTraceManager
+    stats = {'rows': {}, 'events': {}, 'fetch_seconds': {}, 'fetch_errors': {}}
+    metrics = PipelineMetrics() if profile else None
+    manager = PerfettoTraceManager(output_path=shard_path, auto_pid_base=auto_pid_base, uuid_namespace=data_type,
+                                   **manager_kwargs)
+    manager.metrics = metrics
+    _convert_types(manager, vin, start_time, end_time, [data_type], stats, metrics, **options)
+    with _stage(metrics, 'serialize'):
+        manager.save_to_file()
+    return stats, metrics.to_dict()['types'] if metrics is not None else None
+
+def _convert_parallel(manager, vin, start_time, end_time, types, stats, metrics, output_dir, manager_kwargs, options):
+    """
+    每个数据类型在独立进程中转换为分片，按types顺序把分片字节拼接到manager的输出，返回各类型拉取耗时合计（秒）。
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with tempfile.TemporaryDirectory(prefix='.tracegen-shards-', dir=output_dir) as shard_dir:
+        with ProcessPoolExecutor(max_workers=min(len(types), os.cpu_count() or 1)) as executor:
+            futures = []
+            for idx, data_type in enumerate(types):
+                shard_path = os.path.join(shard_dir, f"{idx}_{data_type}.perfetto")
+                futures.append((data_type, shard_path, executor.submit(
+                    _convert_shard, shard_path, vin, start_time, end_time, data_type,
+                    SHARD_AUTO_PID_BASE + idx * SHARD_AUTO_PID_STRIDE, manager_kwargs, metrics is not None, options)))
+            for data_type, shard_path, future in futures:
+                try:
+                    shard_stats, shard_metrics = future.result()
+                except Exception as e:
+                    print(f"❌ <<<<< {data_type} 工作进程失败，已跳过。原因: {e} <<<<<")
+                    continue
+                for key in ('rows', 'events', 'fetch_seconds', 'fetch_errors'):
+                    stats[key].update(shard_stats[key])
+                if shard_metrics is not None:
+                    metrics.merge_types(shard_metrics)
+                with _stage(metrics, 'serialize'):
+                    manager.append_shard(shard_path)
+    return sum(stats['fetch_seconds'].values())
+
+def run_trace_convert(vin, start_time, end_time, types, timezone, output_dir, stream=True,
+                      chunk_minutes=DEFAULT_CHUNK_MINUTES, timeout=DEFAULT_TIMEOUT, use_cache=True, refresh=False,
+                      columnar=True, intern_strings=False, delta_timestamps=False, compress=None, lazy=False, drop_unchanged=False, decimate=None, resolutions=None,
+                      parallel=False, deterministic=False, logcat_files=None, validation='strict', fast_encode=True,
+                      append=None, write_index=True, name_suffix=None, stats=None, metrics=None):
     """
     主流程API，可直接调用。
     vin: 车辆VIN
@@ -22,30 +214,207 @@ def run_trace_convert(vin, start_time, end_time, types, timezone, output_dir):
     types: list[str]，如['short', 'gfx']
     timezone: 时区字符串，如'+0800'，影响所有trace事件的时间戳
     output_dir: 输出文件夹，默认~/Downloads
+    stream: 是否流式写出trace，开启后每个packet生成即写盘，峰值内存不随trace大小增长
+    chunk_minutes: 按该分钟数切分时间窗口并行拉取，0表示不切分
+    timeout: 单次请求超时（秒）
+    use_cache: 是否使用本地原始数据缓存（~/.cache/tracegen），只拉取未缓存的时间桶
+    refresh: 忽略已有缓存，重新拉取并覆盖
+    columnar: 使用列式适配器（NumPy按列批量处理），否则走逐条dict的标准格式
+    intern_strings: 事件名/category/参数名写入interned_data并按iid引用，减小trace体积（默认关闭，需显式开启）
+    delta_timestamps: 事件时间戳按增量时钟写为差值（需在保存时排序，事件packet会缓存到最后再写出）
+    compress: 输出压缩格式，None/'gzip'/'zstd'，文件名追加.gz/.zst后缀
+    lazy: 流式管道，响应边下载边解析，原始行经生成器适配器逐条转换并写入，峰值内存不随数据量增长；
+          各类型依次拉取，不切分时间窗口、不使用缓存（chunk_minutes/use_cache/columnar不生效）
+    drop_unchanged: cpu_long的counter只在value变化时输出采样点（进程消失仍补0），显著减少事件数
+    decimate: counter降采样模式，None/'none'不降采样，'lttb'/'minmax'/'avg' 见 tracegen.decimate；
+              minmax/lttb保留全局峰值点（avg在arguments中记录桶内min/max），每个输出点的arguments记录所在时间桶的原始采样数raw_count
+    resolutions: 降采样分辨率，list[str]，如 ['psi_avg_10s=1m', '5m']（按process_name指定，不带名字为默认值），
+                 未指定时按时间窗口自动选择（每条track约2000个时间桶）
+    parallel: 每个数据类型在独立进程中拉取并转换，各自写出分片（独立的sequence id、track uuid与自动pid区间），
+              最后按types顺序字节拼接为一个trace，多类型转换可利用多核；分片不压缩，拼接时再按compress压缩
+    deterministic: 确定性输出：track uuid、sequence id、自动pid与时钟快照均由输入决定，同样的输入生成字节一致的trace；
+                   同时启用输出trace缓存（按 vin/时间窗口/类型/schema版本/输出选项 的内容哈希，use_cache=False时不使用，
+                   refresh=True时重新生成并覆盖），命中时直接复制缓存的trace，跳过拉取与转换
+    logcat_files: 可选的logcat文件路径列表（threadtime格式，可为.gz），流式解析后批量写入trace，
+                  每个文件一条log track；行内不带年份时取start_time的年份
+    validation: 标准格式事件的schema校验模式（编译自 configs/standard_trace_schema.json，见 tracegen.validation）：
+                'strict' 每条完整校验，'sample' 每条只校验必填字段、每100条完整校验一次，'off' 不校验；
+                不通过的事件按原因计数后跳过，每个类型处理完成后汇总输出一行（列式路径由内置适配器生成，不经过校验）
+    fast_encode: 流式输出（stream=True）且未开启delta_timestamps时，track描述符与counter/slice/instant事件packet
+                 直接编码为protobuf字节（tracegen.perfetto.wire），不构建TracePacket对象，输出字节不变
+    append: 已有trace文件的路径（须有索引 <trace>.idx.json，见write_index），把时间窗口延长到end_time：
+            只拉取索引记录的结束时间之后的数据（向前多取APPEND_LOOKBACK_MINUTES分钟恢复适配器状态，已写入的事件按track水位去掉），沿用原trace的sequence id、track注册表、pid与interned表把新packet
+            追加到文件末尾（Perfetto中各track前后连续），完成后重命名为新的时间窗口并更新索引。
+            start_time与output_dir被忽略，vin须与索引一致，时区/intern/增量时间戳/压缩/确定性选项取自索引，不支持parallel；
+            logcat_files原样导入，不按时间去重
+    write_index: 在输出trace旁写出索引 <trace>.idx.json（track注册表、sequence id、interned表等），供之后追加；
+                 多类型parallel模式下各分片的注册表不在主进程中，不写出索引
+    name_suffix: 可选的文件名后缀，输出为 VIN_开始时间_结束时间_<name_suffix>_trace.perfetto，
+                 用于区分同一VIN/时间窗口的多个输出（如批量模式下类型不同的任务）
+    stats: 可选dict，填入各类型的原始行数(rows)、事件数(events)、拉取耗时(fetch_seconds)、
+           拉取失败被跳过的子区间/时间桶错误信息(fetch_errors，只含有失败的类型)及输出字节数(file_bytes)
+    metrics: 可选的 tracegen.metrics.PipelineMetrics，记录各类型的分阶段耗时
+             （network/cache/json_decode/adapter/packet_build/serialize）、行数、事件数、收发字节数与峰值RSS
     """
+    from .decimate import parse_resolutions
+    from .logcat import iter_logcat_file
+    from .perfetto.perfetto_trace_manager import PerfettoTraceManager
+    if stats is None:
+        stats = {}
+    stats.update(rows={}, events={}, fetch_seconds={}, fetch_errors={}, file_bytes=0)
+    index = None
+    if append:
+        index = load_trace_index(append)
+        if index['vin'] != vin:
+            raise ValueError(f"VIN {vin} 与trace索引中的 {index['vin']} 不一致: {append}")
+        if parse_datetime_to_ms(end_time) <= parse_datetime_to_ms(index['end_time']):
+            print(f"✅ {append} 已包含 {index['end_time']} 之前的数据，无需追加")
+            return append
+        if parallel:
+            print("[WARN] 追加模式不支持parallel，改为在当前进程中转换")
+            parallel = False
+        # 输出格式沿用原trace，只拉取上次结束时间之后的数据
+        output_options = index['options']
+        timezone, intern_strings = output_options['timezone'], output_options['intern_strings']
+        delta_timestamps, compress = output_options['delta_timestamps'], output_options['compress']
+        deterministic = output_options['deterministic']
+        start_time = index['end_time']
+        output_dir = os.path.dirname(os.path.abspath(append))
+    trace_start = index['start_time'] if index is not None else start_time
     if output_dir is None:
         output_dir = os.path.expanduser('~/Downloads')
+    output_dir = os.path.expanduser(output_dir)
     os.makedirs(output_dir, exist_ok=True)
-    manager = PerfettoTraceManager(timezone=timezone)
+    # 输出文件名: VIN_开始时间_结束时间[_后缀]_trace.perfetto
+    start_str = trace_start.replace(':', '-').replace(' ', '-').strip()
+    end_str = end_time.replace(':', '-').replace(' ', '-').strip()
+    suffix_str = f"_{name_suffix}" if name_suffix else ''
+    compress = resolve_compression(compress)
+    out_name = f"{vin}_{start_str}_{end_str}{suffix_str}_trace.perfetto{COMPRESSION_SUFFIX[compress]}"
+    out_path = os.path.join(output_dir, out_name)
+    if decimate == 'none':
+        decimate = None
+    resolutions = parse_resolutions(resolutions)
+    window = (parse_datetime_to_ms(start_time), parse_datetime_to_ms(end_time))
+    fetch_start = start_time
+    if index is not None:
+        fetch_start = (datetime.datetime.strptime(start_time, TIME_FORMAT)
+                       - datetime.timedelta(minutes=APPEND_LOOKBACK_MINUTES)).strftime(TIME_FORMAT)
+    valid_types = []
+    adapter_kwargs = {}
     for data_type in types:
-        if data_type not in ADAPTER_MAP:
+        try:
+            supported = data_type in ADAPTER_MAP
+        except Exception as e:
+            print(f"❌ 数据类型 {data_type} 的适配器插件加载失败: {e}")
+            continue
+        if not supported:
             print(f"❌ 暂不支持的数据类型: {data_type}")
             continue
-        print(f"🚀 >>>>> 开始处理 「{data_type}」 数据 >>>>>")
+        valid_types.append(data_type)
+        adapter_kwargs[data_type] = {'drop_unchanged': True} if drop_unchanged and data_type in DROP_UNCHANGED_TYPES else {}
+    parallel = parallel and len(valid_types) > 1
+    trace_cache = cache_key = None
+    if deterministic and use_cache and index is None:
+        trace_cache = TraceCache()
+        cache_key = trace_content_hash(vin, start_time, end_time, valid_types, {
+            'timezone': timezone, 'columnar': columnar, 'intern_strings': intern_strings,
+            'delta_timestamps': delta_timestamps, 'compress': compress, 'lazy': lazy, 'drop_unchanged': drop_unchanged,
+            'decimate': decimate, 'resolutions': resolutions, 'parallel': parallel,
+            'logcat_files': [_file_identity(path) for path in logcat_files or ()],
+            'validation': validation,
+        })
+        cached = None if refresh else trace_cache.get(cache_key, out_path)
+        if cached is not None:
+            stats.update(rows=cached['rows'], events=cached['events'], file_bytes=cached['file_bytes'])
+            if write_index and cached.get('index') is not None:
+                save_trace_index(out_path, cached['index'])
+            if metrics is not None:
+                metrics.finish(file_bytes=cached['file_bytes'])
+            print(f"♻️ 命中trace缓存（{cache_key[:12]}），跳过拉取与转换")
+            print(f"🎉 已生成 {out_path}，可用 Perfetto UI 打开查看。")
+            return out_path
+    resume_state = None
+    if index is not None:
+        size = os.path.getsize(append)
+        if size < index['file_bytes']:
+            raise ValueError(f"trace文件小于索引记录的 {index['file_bytes']} 字节，可能已损坏: {append}")
+        if size > index['file_bytes']:
+            # 上一次追加中途失败留下的不完整packet，截断到索引记录的位置
+            print(f"[WARN] 丢弃 {append} 末尾 {size - index['file_bytes']} 字节未完成的追加数据")
+            os.truncate(append, index['file_bytes'])
+        if os.path.abspath(append) != os.path.abspath(out_path):
+            move_trace(append, out_path)
+        resume_state = index['state']
+        print(f"➕ 追加 {start_time} ~ {end_time} 的数据到 {out_path}")
+    manager = PerfettoTraceManager(timezone=timezone, output_path=out_path if stream else None,
+                                   intern_strings=intern_strings, delta_timestamps=delta_timestamps,
+                                   compress=compress, deterministic=deterministic, validation=validation,
+                                   fast_encode=fast_encode, resume_state=resume_state)
+    manager.metrics = metrics
+    options = dict(lazy=lazy, timeout=timeout, chunk_minutes=chunk_minutes, use_cache=use_cache, refresh=refresh,
+                   columnar=columnar, adapter_kwargs=adapter_kwargs, decimate=decimate, resolutions=resolutions,
+                   window=window)
+    watermarks = None
+    if (write_index or index is not None) and not parallel:
+        watermarks = options['watermarks'] = TrackWatermarks(index['watermarks'] if index is not None else None)
+    fetch_begin = time.perf_counter()
+    if parallel:
+        manager_kwargs = dict(timezone=timezone, intern_strings=intern_strings, delta_timestamps=delta_timestamps,
+                              deterministic=deterministic, validation=validation, fast_encode=fast_encode)
+        fetch_elapsed_sum = _convert_parallel(manager, vin, fetch_start, end_time, valid_types, stats, metrics,
+                                              output_dir, manager_kwargs, options)
+    else:
+        fetch_elapsed_sum = _convert_types(manager, vin, fetch_start, end_time, valid_types, stats, metrics, **options)
+    for path in logcat_files or ():
+        print(f"🚀 >>>>> 开始导入 logcat 「{path}」 >>>>>")
+        if metrics is not None:
+            metrics.begin_type('logcat')
         try:
-            raw_data = fetch_data(vin, start_time, end_time, data_type)
-            standard_data = ADAPTER_MAP[data_type](raw_data)
-            manager.from_standard_format(standard_data)
-            print(f"✅ <<<<< {data_type} 数据处理完成，共 {len(standard_data)} 条标准事件。 <<<<<")
+            with _stage(metrics, 'packet_build'):
+                log_count = manager.add_log_lines(iter_logcat_file(path), track_name=os.path.basename(path),
+                                                  year=start_time[:4])
+            stats['events']['logcat'] = stats['events'].get('logcat', 0) + log_count
+            print(f"✅ <<<<< logcat 导入完成，共 {log_count} 条日志。 <<<<<")
         except Exception as e:
-            print(f"❌ <<<<< {data_type} 数据处理失败，已跳过。原因: {e} <<<<<")
-            continue
-    manager.add_clock_snapshot()
-    # 输出文件名: VIN_开始时间_结束时间_trace.perfetto
-    start_str = start_time.replace(':', '-').replace(' ', '-').strip()
-    end_str = end_time.replace(':', '-').replace(' ', '-').strip()
-    out_name = f"{vin}_{start_str}_{end_str}_trace.perfetto"
-    out_path = os.path.join(output_dir, out_name)
-    manager.save_to_file(out_path)
+            print(f"❌ <<<<< logcat 导入失败，已跳过。原因: {e} <<<<<")
+        finally:
+            if metrics is not None:
+                metrics.add_count('logcat', events=stats['events'].get('logcat', 0))
+                metrics.end_type('logcat')
+    if valid_types:
+        print(f"⏱️ 数据拉取与转换总耗时 {time.perf_counter() - fetch_begin:.2f}s，各类型拉取耗时合计 {fetch_elapsed_sum:.2f}s")
+    with _stage(metrics, 'serialize'):
+        # 确定性模式下时钟快照取时间窗口结束时间（UTC纳秒），不随生成时刻变化
+        manager.add_clock_snapshot(manager._to_utc_ms(window[1]) * 1_000_000 if deterministic else None)
+        writer = manager.save_to_file(out_path)
+    stats['file_bytes'] = writer.file_bytes
+    trace_index = None
+    if write_index and not parallel:
+        trace_index = {
+            'vin': vin, 'start_time': trace_start, 'end_time': end_time,
+            'types': list(dict.fromkeys((index['types'] if index is not None else []) + valid_types)),
+            'options': {'timezone': timezone, 'intern_strings': intern_strings, 'delta_timestamps': delta_timestamps,
+                        'compress': compress, 'deterministic': deterministic},
+            'file_bytes': writer.file_bytes,
+            'state': manager.export_state(),
+            'watermarks': watermarks.to_list(),
+        }
+        save_trace_index(out_path, trace_index)
+    # 只缓存全部类型都拉取完整、转换成功，且时间窗口已结束的结果（拉取失败的部分按空数据写入了trace）
+    if trace_cache is not None and stats['fetch_errors']:
+        print(f"[WARN] {', '.join(stats['fetch_errors'])} 有数据拉取失败，结果不完整，不写入trace缓存")
+    if (trace_cache is not None and not stats['fetch_errors'] and all(t in stats['events'] for t in valid_types)
+            and is_window_complete(end_time)):
+        trace_cache.put(cache_key, out_path, {'rows': stats['rows'], 'events': stats['events'],
+                                              'file_bytes': writer.file_bytes, 'index': trace_index})
+    if metrics is not None:
+        metrics.finish(bytes_written=writer.bytes_written, file_bytes=writer.file_bytes)
+    written = writer.file_bytes - writer.initial_bytes
+    total = f"，文件共 {writer.file_bytes} 字节" if writer.initial_bytes else ''
+    if compress:
+        print(f"📦 写出 {written} 字节（压缩前 {writer.bytes_written} 字节，{compress} 压缩比 {writer.compression_ratio:.2f}）{total}")
+    else:
+        print(f"📦 写出 {written} 字节{total}")
     print(f"🎉 已生成 {out_path}，可用 Perfetto UI 打开查看。")
     return out_path 
\ No newline at end of file
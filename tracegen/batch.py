@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import os
+import re
+import time
+
+from .api import run_trace_convert
+from .data_fetcher import set_request_limiter
+
+DEFAULT_TYPES = ['gfx', 'short', 'long']
+DEFAULT_FETCH_CONCURRENCY = 8
+
+def _split_types(value):
+    if isinstance(value, (list, tuple)):
+        return [t for t in value if t]
+    for sep in ('|', ';', ','):
+        value = value.replace(sep, ' ')
+    return value.split()
+
+def load_manifest(path):
+    """
+    读取批量任务清单，返回 [{'vin', 'start_time', 'end_time', 'types'}, ...]。
+    - .json: 对象列表，字段同上，types为列表或以 | ; , 空格分隔的字符串
+    - 其它按CSV读取，表头 vin,start_time,end_time,types（types可省略，默认全部类型）
+    """
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            rows = [row for row in csv.DictReader(f) if row.get('vin')]
+    jobs = []
+    for idx, row in enumerate(rows):
+        for field in ('vin', 'start_time', 'end_time'):
+            if not row.get(field):
+                raise ValueError(f"清单第{idx + 1}条缺少字段: {field}")
+        jobs.append({
+            'vin': row['vin'].strip(),
+            'start_time': row['start_time'].strip(),
+            'end_time': row['end_time'].strip(),
+            'types': _split_types(row.get('types') or '') or list(DEFAULT_TYPES),
+        })
+    return jobs
+
+def _name_suffixes(jobs):
+    """
+    为输出路径相同（VIN与时间窗口相同）的任务分配文件名后缀，返回与jobs一一对应的列表，无冲突的任务为None。
+    冲突任务以类型名（- 连接）区分，类型也相同时再追加任务序号；否则多个进程会同时写同一个文件。
+    """
+    groups = {}
+    for idx, job in enumerate(jobs):
+        groups.setdefault((job['vin'], job['start_time'], job['end_time']), []).append(idx)
+    suffixes = [None] * len(jobs)
+    for indexes in groups.values():
+        if len(indexes) < 2:
+            continue
+        names = [re.sub(r'[^\w.-]+', '_', '-'.join(jobs[idx]['types'])) for idx in indexes]
+        for idx, name in zip(indexes, names):
+            suffixes[idx] = name if names.count(name) == 1 else f"{name}_{idx + 1}"
+        print(f"[WARN] 清单第{'、'.join(str(idx + 1) for idx in indexes)}条任务的VIN与时间窗口相同，"
+              f"输出文件名分别追加后缀 {', '.join(suffixes[idx] for idx in indexes)}")
+    return suffixes
+
+def _init_worker(limiter):
+    set_request_limiter(limiter)
+
+def _run_job(job, name_suffix, convert_kwargs):
+    """
+    在工作进程中执行单个任务，返回汇总行（不抛异常）。
+    name_suffix: 输出文件名后缀，见 _name_suffixes
+    """
+    stats = {}
+    begin = time.perf_counter()
+    result = dict(job, out_path=None, status='ok', error='')
+    try:
+        result['out_path'] = run_trace_convert(job['vin'], job['start_time'], job['end_time'], job['types'],
+                                               name_suffix=name_suffix, stats=stats, **convert_kwargs)
+    except Exception as e:
+        result.update(status='failed', error=str(e))
+    result['seconds'] = time.perf_counter() - begin
+    result['events'] = sum(stats.get('events', {}).values())
+    result['rows'] = sum(stats.get('rows', {}).values())
+    result['file_bytes'] = stats.get('file_bytes', 0)
+    return result
+
+def run_batch(jobs, jobs_parallel=None, fetch_concurrency=DEFAULT_FETCH_CONCURRENCY, **convert_kwargs):
+    """
+    批量模式：多个VIN/时间窗口在一次调用中用进程池并行生成trace，每个任务输出独立文件
+    （VIN与时间窗口相同的任务在文件名中追加类型后缀区分，见 _name_suffixes）。
+    jobs: load_manifest的返回值
+    jobs_parallel: 进程数，默认CPU核数
+    fetch_concurrency: 所有进程合计同时进行的HTTP请求数上限
+    其余关键字参数透传给run_trace_convert（timezone/output_dir/compress等）。
+    返回各任务的汇总行列表（与jobs顺序一致），并打印汇总表。
+    """
+    # 进程池与跨进程信号量只在批量模式用到，按需导入（不拖慢 tracegen 单次命令的启动）
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    limiter = multiprocessing.BoundedSemaphore(fetch_concurrency) if fetch_concurrency else None
+    suffixes = _name_suffixes(jobs)
+    begin = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs_parallel or os.cpu_count(),
+                             initializer=_init_worker, initargs=(limiter,)) as executor:
+        futures = [executor.submit(_run_job, job, suffix, convert_kwargs) for job, suffix in zip(jobs, suffixes)]
+        results = [future.result() for future in futures]
+    print_summary(results, time.perf_counter() - begin)
+    return results
+
+def print_summary(results, total_seconds):
+    print()
+    print(f"{'#':>3}  {'vin':<18} {'start_time':<19} {'end_time':<19} {'types':<14} {'status':<6} "
+          f"{'seconds':>8} {'rows':>9} {'events':>9} {'bytes':>11}")
+    for idx, r in enumerate(results, 1):
+        print(f"{idx:>3}  {r['vin']:<18} {r['start_time']:<19} {r['end_time']:<19} {','.join(r['types']):<14} "
+              f"{r['status']:<6} {r['seconds']:>8.2f} {r['rows']:>9} {r['events']:>9} {r['file_bytes']:>11}")
+        if r['error']:
+            print(f"     ❌ {r['error']}")
+    ok = sum(1 for r in results if r['status'] == 'ok')
+    print(f"🎉 批量完成 {ok}/{len(results)} 个任务，总耗时 {total_seconds:.2f}s，"
+          f"任务耗时合计 {sum(r['seconds'] for r in results):.2f}s")
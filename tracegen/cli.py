@@ -1,5 +1,8 @@
 import click
 from .api import run_trace_convert
+from .data_fetcher import DEFAULT_CHUNK_MINUTES, DEFAULT_TIMEOUT
+from .batch import load_manifest, run_batch, DEFAULT_FETCH_CONCURRENCY
+from .metrics import PipelineMetrics, profile_session
 
 DEFAULT_VIN = 'HLX33B127R1035023'
 DEFAULT_START_TIME = '2025-05-29 07:00:00'
@@ -12,12 +15,64 @@ DEFAULT_OUTPUT = '~/Downloads'
 @click.option('-v', '--vin', default=DEFAULT_VIN, help='车辆VIN码')
 @click.option('-s', '--start-time', default=DEFAULT_START_TIME, help='开始时间，格式YYYY-MM-DD HH:MM:SS')
 @click.option('-e', '--end-time', default=DEFAULT_END_TIME, help='结束时间，格式YYYY-MM-DD HH:MM:SS')
-@click.option('-t', '--type', 'types', multiple=True, default=DEFAULT_TYPES, help='数据类型，可多次指定，如 -t short -t gfx')
+@click.option('-t', '--type', 'types', multiple=True, default=DEFAULT_TYPES, help='数据类型，可多次指定，如 -t short -t gfx（内置short/gfx/long，其它类型由entry point tracegen.adapters 的插件提供）')
 @click.option('--timezone', default=DEFAULT_TIMEZONE, help='时区，格式如+0800/-0600，影响所有trace事件的时间戳')
 @click.option('-o', '--output', default=DEFAULT_OUTPUT, show_default=True, help='输出文件夹，默认~/Downloads')
-def cli(vin, start_time, end_time, types, timezone, output):
+@click.option('--stream/--no-stream', default=True, show_default=True, help='流式写出trace，每个packet生成即写盘，降低峰值内存')
+@click.option('--chunk-minutes', default=DEFAULT_CHUNK_MINUTES, show_default=True, type=int, help='按分钟切分时间窗口并行拉取，0表示不切分')
+@click.option('--timeout', default=DEFAULT_TIMEOUT, show_default=True, type=float, help='单次请求超时（秒）')
+@click.option('--no-cache', is_flag=True, default=False, help='不使用本地原始数据缓存')
+@click.option('--refresh', is_flag=True, default=False, help='忽略已有缓存，重新拉取并覆盖')
+@click.option('--columnar/--no-columnar', default=True, show_default=True, help='使用列式适配器（NumPy按列批量处理）')
+@click.option('--intern/--no-intern', 'intern_strings', default=False, show_default=True, help='事件名/category/参数名按iid引用（interned_data），减小trace体积')
+@click.option('--delta-timestamps', is_flag=True, default=False, help='事件时间戳按增量时钟写为差值，进一步减小trace体积（事件需缓存到最后排序写出）')
+@click.option('--compress', type=click.Choice(['none', 'gzip', 'zstd']), default='none', show_default=True, help='输出压缩格式（gzip可直接用Perfetto UI打开；zstd需安装zstandard）')
+@click.option('--lazy', is_flag=True, default=False, help='流式管道：响应边下载边解析并逐条转换写入，峰值内存不随数据量增长（不切分、不使用缓存）')
+@click.option('--drop-unchanged', is_flag=True, default=False, help='cpu_long只在value变化时输出counter采样点，显著减少事件数')
+@click.option('--decimate', type=click.Choice(['none', 'lttb', 'minmax', 'avg']), default='none', show_default=True, help='counter降采样模式，保留峰值点，arguments记录原始采样数raw_count')
+@click.option('--resolution', 'resolutions', multiple=True, help='降采样分辨率，可多次指定：5m（默认）、psi_avg_10s=1m（按process_name）、auto（按窗口自动，约2000点/track）')
+@click.option('--parallel', is_flag=True, default=False, help='每个数据类型在独立进程中转换为分片，最后拼接为一个trace（多类型时利用多核）')
+@click.option('--deterministic', is_flag=True, default=False, help='确定性输出：同样的输入生成字节一致的trace，并启用输出trace缓存（--no-cache关闭，--refresh重新生成）')
+@click.option('--logcat', 'logcat_files', multiple=True, type=click.Path(exists=True, dir_okay=False), help='导入logcat文件（threadtime格式，可为.gz，可多次指定），流式解析并批量写入trace')
+@click.option('--validation', type=click.Choice(['off', 'sample', 'strict']), default='strict', show_default=True, help='标准格式事件的schema校验：strict逐条完整校验，sample只校验必填字段并抽样完整校验，off不校验；非法事件按原因汇总输出')
+@click.option('--fast-encode/--no-fast-encode', default=True, show_default=True, help='流式输出时直接编码packet字节（不构建protobuf对象，输出字节不变）；--delta-timestamps/--no-stream时不生效')
+@click.option('--append', 'append', type=click.Path(exists=True, dir_okay=False), default=None, help='把已有trace（带.idx.json索引）延长到--end-time：只拉取新增的时间段并追加packet，track保持连续，完成后按新的时间窗口重命名（忽略--start-time/-o，输出格式选项沿用原trace）')
+@click.option('--index/--no-index', 'write_index', default=True, show_default=True, help='在输出trace旁写出索引<trace>.idx.json（track注册表、sequence id等），供之后--append')
+@click.option('--profile', is_flag=True, default=False, help='打印各数据类型的分阶段耗时、行数/事件数、收发字节数与峰值RSS')
+@click.option('--profile-json', type=click.Path(dir_okay=False), default=None, help='将分阶段指标以JSON写入该文件（隐含--profile）')
+@click.option('--cprofile', type=click.Path(dir_okay=False), default=None, help='保存cProfile统计到该文件（python -m pstats 查看）')
+@click.option('--tracemalloc', 'tracemalloc_path', type=click.Path(dir_okay=False), default=None, help='开启tracemalloc，将内存分配最多的代码行写入该文件')
+def cli(vin, start_time, end_time, types, timezone, output, stream, chunk_minutes, timeout, no_cache, refresh, columnar,
+        intern_strings, delta_timestamps, compress, lazy, drop_unchanged, decimate, resolutions, parallel, deterministic, logcat_files, validation, fast_encode, append, write_index, profile, profile_json, cprofile, tracemalloc_path):
     """命令行入口"""
-    run_trace_convert(vin, start_time, end_time, types, timezone=timezone, output_dir=output)
+    metrics = PipelineMetrics() if profile or profile_json else None
+    with profile_session(cprofile_path=cprofile, tracemalloc_path=tracemalloc_path):
+        run_trace_convert(vin, start_time, end_time, types, timezone=timezone, output_dir=output, stream=stream,
+                          chunk_minutes=chunk_minutes, timeout=timeout, use_cache=not no_cache, refresh=refresh,
+                          columnar=columnar, intern_strings=intern_strings, delta_timestamps=delta_timestamps,
+                          compress=compress, lazy=lazy, drop_unchanged=drop_unchanged,
+                          decimate=decimate, resolutions=resolutions, parallel=parallel,
+                          deterministic=deterministic, logcat_files=logcat_files,
+                          validation=validation, fast_encode=fast_encode, append=append,
+                          write_index=write_index, metrics=metrics)
+    if metrics is not None:
+        metrics.report()
+        if profile_json:
+            metrics.dump_json(profile_json)
+            print(f"📝 分阶段指标已保存到 {profile_json}")
+
+@click.command(name="tracegen-batch", help="批量模式：按清单（CSV/JSON，字段 vin,start_time,end_time,types）用进程池批量生成 Perfetto trace 文件")
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.option('-j', '--jobs', default=None, type=int, help='并行进程数，默认CPU核数')
+@click.option('--fetch-concurrency', default=DEFAULT_FETCH_CONCURRENCY, show_default=True, type=int, help='所有进程合计同时进行的HTTP请求数上限')
+@click.option('--timezone', default=DEFAULT_TIMEZONE, help='时区，格式如+0800/-0600，影响所有trace事件的时间戳')
+@click.option('-o', '--output', default=DEFAULT_OUTPUT, show_default=True, help='输出文件夹，默认~/Downloads')
+@click.option('--no-cache', is_flag=True, default=False, help='不使用本地原始数据缓存')
+@click.option('--compress', type=click.Choice(['none', 'gzip', 'zstd']), default='none', show_default=True, help='输出压缩格式')
+def batch_cli(manifest, jobs, fetch_concurrency, timezone, output, no_cache, compress):
+    """批量命令行入口"""
+    run_batch(load_manifest(manifest), jobs_parallel=jobs, fetch_concurrency=fetch_concurrency,
+              timezone=timezone, output_dir=output, use_cache=not no_cache, compress=compress)
 
 if __name__ == "__main__":
     cli() 
\ No newline at end of file
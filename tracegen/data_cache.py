@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get('TRACEGEN_CACHE_DIR', '~/.cache/tracegen')
+DEFAULT_BUCKET_MINUTES = 60
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL = 24 * 3600
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_TRACE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DEFAULT_TRACE_TTL = DEFAULT_TTL
+# 输出trace的格式版本：生成逻辑变化导致同样输入的输出不同时递增，使旧的trace缓存失效
+TRACE_SCHEMA_VERSION = 1
+
+def _evict_lru(directory, max_bytes, suffix, lock):
+    """
+    目录内以suffix结尾的文件总大小超过max_bytes时，按最近访问时间从旧到新删除，返回被删除的路径列表。
+    """
+    with lock:
+        entries = []
+        total = 0
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_atime, st.st_size, entry.path))
+            total += st.st_size
+        removed = []
+        if total <= max_bytes:
+            return removed
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed.append(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return removed
+
+def is_window_complete(end_time):
+    """
+    结束时间已过去的时间窗口才可缓存，避免缓存仍在上传中的数据。
+    """
+    return datetime.datetime.strptime(end_time, TIME_FORMAT) <= datetime.datetime.now()
+
+class DataCache:
+    """
+    原始数据本地缓存：按 (vin, data_type, sub_type, 时间桶) 存储fetch回来的data列表。
+    - 时间桶按bucket_minutes对齐（如整点），每个桶一个gzip压缩的紧凑JSON文件
+    - 文件mtime为写入时间，超过ttl秒视为过期
+    - 文件atime为最近访问时间，总大小超过max_bytes时按LRU淘汰
+    不依赖索引文件，多线程/多进程同时读写同一缓存目录是安全的（写入为临时文件+原子rename）。
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 ttl=DEFAULT_TTL, bucket_minutes=DEFAULT_BUCKET_MINUTES):
+        self.cache_dir = os.path.join(os.path.expanduser(cache_dir), 'raw')
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bucket_minutes = bucket_minutes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def bucket_bounds(self, start_time, end_time):
+        """
+        返回覆盖 [start_time, end_time] 的对齐时间桶列表 [(bucket_start, bucket_end), ...]。
+        """
+        begin = datetime.datetime.strptime(start_time, TIME_FORMAT)
+        end = datetime.datetime.strptime(end_time, TIME_FORMAT)
+        step = datetime.timedelta(minutes=self.bucket_minutes)
+        day = begin.replace(hour=0, minute=0, second=0, microsecond=0)
+        cursor = day + step * ((begin - day) // step)
+        buckets = []
+        while cursor < end or not buckets:
+            buckets.append((cursor.strftime(TIME_FORMAT), (cursor + step).strftime(TIME_FORMAT)))
+            cursor += step
+        return buckets
+
+    def is_complete(self, bucket_end):
+        """
+        桶的结束时间已过去才可缓存，避免缓存仍在上传中的数据。
+        """
+        return is_window_complete(bucket_end)
+
+    def _path(self, vin, data_type, sub_type, bucket_start):
+        key = f"{vin}|{data_type}|{sub_type or ''}|{bucket_start}|{self.bucket_minutes}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json.gz")
+
+    def get(self, vin, data_type, sub_type, bucket_start):
+        """
+        命中返回data列表，未命中或已过期返回None。
+        """
+        path = self._path(vin, data_type, sub_type, bucket_start)
+        try:
+            mtime = os.path.getmtime(path)
+            if time.time() - mtime > self.ttl:
+                os.remove(path)
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+            # 更新atime作为LRU的访问时间，保留mtime作为写入时间
+            os.utime(path, (time.time(), mtime))
+            return data
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"[cache] 缓存文件损坏，已忽略: {path}: {e}")
+            return None
+
+    def put(self, vin, data_type, sub_type, bucket_start, data):
+        path = self._path(vin, data_type, sub_type, bucket_start)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """
+        总大小超过max_bytes时，按最近访问时间从旧到新删除缓存文件。
+        """
+        _evict_lru(self.cache_dir, self.max_bytes, '.json.gz', self._lock)
+
+def trace_content_hash(vin, start_time, end_time, types, options):
+    """
+    生成trace的内容哈希：由 (vin, 时间窗口, 数据类型及顺序, TRACE_SCHEMA_VERSION, 影响输出的选项) 决定。
+    options: 可JSON序列化的dict，如时区、压缩格式、降采样配置等。
+    """
+    payload = {
+        'schema_version': TRACE_SCHEMA_VERSION,
+        'vin': vin,
+        'window': [start_time, end_time],
+        'types': list(types),
+        'options': options,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+class TraceCache:
+    """
+    输出trace缓存：按 trace_content_hash 存储确定性模式下生成的trace文件，
+    每个条目为 <hash>.trace（trace字节，与生成结果一致）+ <hash>.json（原始行数/事件数等统计）。
+    命中时直接复制到输出路径，跳过拉取与转换。
+    - trace文件mtime为写入时间，超过ttl秒视为过期（与 DataCache 相同）
+    - trace文件atime为最近访问时间，总大小超过max_bytes时按LRU淘汰
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_TRACE_MAX_BYTES, ttl=DEFAULT_TRACE_TTL):
+        self.cache_dir = os.path.join(os.path.expanduser(cache_dir), 'traces')
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.trace", f"{base}.json"
+
+    def get(self, key, out_path):
+        """
+        命中时把缓存的trace复制到out_path并返回统计dict，未命中或已过期返回None。
+        """
+        trace_path, meta_path = self._paths(key)
+        try:
+            mtime = os.path.getmtime(trace_path)
+            if time.time() - mtime > self.ttl:
+                self._remove(key)
+                return None
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            tmp_path = f"{out_path}.{os.getpid()}.tmp"
+            shutil.copyfile(trace_path, tmp_path)
+            os.replace(tmp_path, out_path)
+            # 更新atime作为LRU的访问时间，保留mtime作为写入时间
+            os.utime(trace_path, (time.time(), mtime))
+            return meta
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"[cache] trace缓存损坏，已忽略: {trace_path}: {e}")
+            return None
+
+    def put(self, key, trace_path, meta):
+        """
+        缓存trace_path处的trace文件及其统计meta（可JSON序列化的dict）。
+        先写trace再写meta，meta存在即表示条目完整。
+        """
+        cached_path, meta_path = self._paths(key)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(trace_path, cached_path + suffix)
+        os.replace(cached_path + suffix, cached_path)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_path + suffix, meta_path)
+        self.evict()
+
+    def _remove(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        for path in _evict_lru(self.cache_dir, self.max_bytes, '.trace', self._lock):
+            self._remove(os.path.basename(path)[:-len('.trace')])
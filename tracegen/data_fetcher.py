@@ -1,25 +1,99 @@
-import requests
 import json
 import logging
+import threading
+import time
+import datetime
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from tracegen.utils import parse_datetime_to_ms
+from tracegen.json_stream import iter_json_array_items
 
-def fetch_data(vin, start_time, end_time, data_type, sub_type=None):
+URLS = [
+    'https://crs-data-service.dev.k8s.lixiang.com/common/req',
+    'https://crs-data-service.prod.k8s.lixiang.com/common/req',
+]
+DEFAULT_TIMEOUT = 10
+DEFAULT_CHUNK_MINUTES = 60
+DEFAULT_CHUNK_WORKERS = 8
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+# 流式读取响应时每次从socket读取的字节数
+STREAM_CHUNK_SIZE = 64 * 1024
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+# 原始数据中的时间字段，按顺序取第一个存在的（cpu_short/cpu_long为collect_time，gfx为create_time）
+TIME_FIELDS = ('collect_time', 'create_time')
+
+# requests（连同urllib3/certifi）导入约0.1s，在第一次创建Session时才导入，见 _requests()
+requests = None
+_session = None
+_session_lock = threading.Lock()
+# 限制同时进行的HTTP请求数（批量模式下为跨进程共享的信号量）
+_request_limiter = contextlib.nullcontext()
+# 分阶段指标（tracegen.metrics.PipelineMetrics），None表示不统计
+_metrics = None
+
+def set_request_limiter(limiter):
     """
-    通过HTTP POST请求从多个节点获取原始数据，返回第一个成功节点的data字段内容。
-    参数：
-        vin: 车辆VIN码
-        start_time: 开始时间，格式 'YYYY-MM-DD HH:MM:SS'
-        end_time: 结束时间，格式 'YYYY-MM-DD HH:MM:SS'
-        data_type: 数据类型，如 'short', 'gfx' 等
-    返回：
-        data: list，原始数据列表（只要有一个节点返回即返回）
-    节点说明：
-        依次尝试多个服务节点，只要有一个节点成功返回数据即视为成功。
+    设置HTTP请求并发限制，limiter为支持with语句的对象（如multiprocessing.BoundedSemaphore），
+    None表示不限制。流式请求从发出请求起占用一个限额，直到响应关闭（读完或被放弃）才释放，
+    因此限制的是同时进行的下载数，而不只是同时等待响应头的请求数。
+    """
+    global _request_limiter
+    _request_limiter = limiter if limiter is not None else contextlib.nullcontext()
+
+def set_metrics(metrics):
+    """
+    设置分阶段指标收集器（PipelineMetrics），None表示关闭统计。
+    """
+    global _metrics
+    _metrics = metrics
+
+def _stage(stage, data_type):
+    """
+    统计开启时返回对应阶段的计时器，否则返回空上下文。
+    """
+    if _metrics is None:
+        return contextlib.nullcontext()
+    return _metrics.timer(stage, data_type)
+
+def _metered(chunks, data_type):
+    """
+    统计开启时记录逐块读取响应的网络耗时与字节数。
+    """
+    if _metrics is None:
+        return chunks
+    def counted():
+        for chunk in _metrics.timed_iter(chunks, 'network', data_type):
+            _metrics.add_count(data_type, bytes_received=len(chunk))
+            yield chunk
+    return counted()
+
+def _requests():
+    """
+    按需导入requests并返回该模块。
     """
-    urls = [
-        'https://crs-data-service.dev.k8s.lixiang.com/common/req',
-        'https://crs-data-service.prod.k8s.lixiang.com/common/req',
-    ]
-    payload = {
+    global requests
+    if requests is None:
+        import requests as module
+        requests = module
+    return requests
+
+def get_session():
+    """
+    返回进程内共享的requests.Session（带连接池，keep-alive复用TCP/TLS连接）。
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = _requests().Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=len(URLS), pool_maxsize=32)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+def build_payload(vin, start_time, end_time, data_type, sub_type=None):
+    return {
         "identify": f"sci_vin_detail_data_out",
         "param": {
             "type": data_type,
@@ -31,37 +105,367 @@ def fetch_data(vin, start_time, end_time, data_type, sub_type=None):
             "vin": vin
         }
     }
+
+class NodeError(Exception):
+    """单个节点请求失败，message为失败原因"""
+
+class FetchError(Exception):
+    """所有节点均请求失败"""
+
+def fetch_data(vin, start_time, end_time, data_type, sub_type=None, timeout=DEFAULT_TIMEOUT, session=None):
+    """
+    通过HTTP POST请求从多个节点获取原始数据，返回第一个成功节点的data字段内容。
+    参数：
+        vin: 车辆VIN码
+        start_time: 开始时间，格式 'YYYY-MM-DD HH:MM:SS'
+        end_time: 结束时间，格式 'YYYY-MM-DD HH:MM:SS'
+        data_type: 数据类型，如 'short', 'gfx' 等
+        timeout: 单个节点的请求超时（秒）
+        session: requests.Session，默认使用进程内共享的连接池
+    返回：
+        data: list，原始数据列表（只要有一个节点返回即返回）
+    节点说明：
+        同时向所有服务节点发起流式请求，第一个读到非空data的节点胜出，其余节点的连接被关闭。
+    """
+    try:
+        return _race_nodes(vin, start_time, end_time, data_type, sub_type, timeout=timeout, session=session)
+    except FetchError as e:
+        logging.error(str(e))
+        return []
+
+def _hold_request_slot(response, limiter):
+    """
+    response关闭时才释放limiter的限额（只释放一次，可在任意线程调用close），返回response。
+    """
+    lock = threading.Lock()
+    released = []
+    close = response.close
+    def close_and_release():
+        try:
+            close()
+        finally:
+            with lock:
+                if released:
+                    return
+                released.append(True)
+            limiter.__exit__(None, None, None)
+    response.close = close_and_release
+    return response
+
+def _open_node_stream(session, url, payload, timeout):
+    """
+    以流式方式请求单个节点，读到data的第一行后返回 (response, first_row, rows)，
+    rows为剩余行的迭代器；data为空时返回 (None, None, None)。失败抛出NodeError。
+    请求占用的并发限额在response关闭时释放（见 _hold_request_slot），调用方读完或放弃响应后必须close。
+    """
     headers = {'Content-Type': 'application/json'}
-    errors = []
-    for url in urls:
+    data_type = payload['param']['type']
+    response = None
+    try:
+        limiter = _request_limiter
+        limiter.__enter__()
         try:
-            response = requests.post(url, data=json.dumps(payload), headers=headers, timeout=10)
-            response.raise_for_status()
-            try:
-                resp_json = response.json()
-            except json.JSONDecodeError as e:
-                logging.error(f"[{url}] 响应内容不是有效的JSON: {e}\n响应内容: {response.text}")
-                errors.append(f"[{url}] JSON解析失败: {e}")
-                continue
-            if not isinstance(resp_json, dict):
-                logging.error(f"[{url}] 响应JSON不是字典类型: {resp_json}")
-                errors.append(f"[{url}] 响应JSON不是字典类型")
-                continue
-            data = resp_json.get('data', [])
-            if not isinstance(data, list):
-                logging.error(f"[{url}] data字段不是列表类型: {data}")
-                errors.append(f"[{url}] data字段不是列表类型")
+            with _stage('network', data_type):
+                response = session.post(url, data=json.dumps(payload), headers=headers, timeout=timeout, stream=True)
+        except BaseException:
+            limiter.__exit__(None, None, None)
+            raise
+        _hold_request_slot(response, limiter)
+        response.raise_for_status()
+        rows = iter_json_array_items(_metered(response.iter_content(STREAM_CHUNK_SIZE), data_type))
+        with _stage('json_decode', data_type):
+            first_row = next(rows, None)
+        if first_row is None:
+            logging.warning(f"[{url}] data字段为空列表")
+            response.close()
+            return None, None, None
+        return response, first_row, rows
+    except _requests().RequestException as e:
+        if response is not None:
+            response.close()
+        logging.error(f"[{url}] 网络请求失败: {e}")
+        raise NodeError(f"[{url}] 网络请求失败: {e}")
+    except ValueError as e:
+        if response is not None:
+            response.close()
+        logging.error(f"[{url}] 响应内容不是有效的JSON: {e}")
+        raise NodeError(f"[{url}] JSON解析失败: {e}")
+    except Exception as e:
+        if response is not None:
+            response.close()
+        logging.error(f"[{url}] 未知错误: {e}")
+        raise NodeError(f"[{url}] 未知错误: {e}")
+
+def _close_stream(future):
+    """
+    落败节点的请求完成后关闭其连接，不再读取剩余响应。
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    response = future.result()[0]
+    if response is not None:
+        response.close()
+
+def _race_streams(session, payload, data_type, timeout):
+    """
+    同时以流式方式请求所有节点，第一个读到非空data的节点胜出，返回 (胜出结果 或 None, 错误列表, 是否有节点返回空data)。
+    胜出结果为 _open_node_stream 的返回值，由调用方读完并关闭response；
+    落败节点读到第一行（或请求完成）后立即关闭连接，不再下载、解析剩余响应体，连接与并发限额随之释放。
+    """
+    errors = []
+    empty = False
+    winner = None
+    executor = ThreadPoolExecutor(max_workers=len(URLS), thread_name_prefix='tracegen-node')
+    try:
+        pending = {executor.submit(_open_node_stream, session, url, payload, timeout) for url in URLS}
+        while pending and winner is None:
+            with _stage('network', data_type):
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except NodeError as e:
+                    errors.append(str(e))
+                    continue
+                if result[0] is None:
+                    empty = True
+                    continue
+                if winner is None:
+                    winner = result
+                else:
+                    result[0].close()
+        for other in pending:
+            other.add_done_callback(_close_stream)
+    finally:
+        executor.shutdown(wait=False)
+    return winner, errors, empty
+
+def _race_nodes(vin, start_time, end_time, data_type, sub_type=None, timeout=DEFAULT_TIMEOUT, session=None):
+    """
+    同时向所有服务节点发起流式请求，第一个读到非空data的节点胜出并读完其响应，其余节点的连接被关闭（见 _race_streams）。
+    所有节点都只返回空列表时返回[]；所有节点均失败、或胜出节点的响应读取中途出错时抛出FetchError。
+    """
+    session = session or get_session()
+    payload = build_payload(vin, start_time, end_time, data_type, sub_type)
+    winner, errors, empty = _race_streams(session, payload, data_type, timeout)
+    if winner is None:
+        if empty:
+            return []
+        raise FetchError(f"所有节点均请求失败，错误信息: {errors}")
+    response, first_row, rows = winner
+    try:
+        with _stage('json_decode', data_type):
+            data = [first_row]
+            data.extend(rows)
+        return data
+    except (_requests().RequestException, ValueError) as e:
+        raise FetchError(f"[{data_type} {start_time}~{end_time}] 读取响应失败: {e}")
+    finally:
+        response.close()
+
+def iter_data(vin, start_time, end_time, data_type, sub_type=None, timeout=DEFAULT_TIMEOUT, session=None, errors=None):
+    """
+    fetch_data 的流式版本：逐行产出data中的原始数据，响应体边下载边解析，
+    内存中不保留完整的响应与data列表。
+    同时向所有节点发起请求，第一个读到非空data的节点胜出，其余节点的连接被关闭。
+    所有节点均失败或均为空时不产出任何行；读取过程中出错时记录错误并提前结束。
+    errors: 可选list，拉取失败（所有节点均失败、读取中途出错）时追加错误信息，供调用方区分失败与空数据。
+    不做时间窗口切分、重试与缓存。
+    """
+    session = session or get_session()
+    payload = build_payload(vin, start_time, end_time, data_type, sub_type)
+    winner, node_errors, _ = _race_streams(session, payload, data_type, timeout)
+    if winner is None:
+        if node_errors and len(node_errors) == len(URLS):
+            logging.error(f"所有节点均请求失败，错误信息: {node_errors}")
+            if errors is not None:
+                errors.append(f"所有节点均请求失败，错误信息: {node_errors}")
+        return
+    response, first_row, rows = winner
+    try:
+        yield first_row
+        yield from rows
+    except (_requests().RequestException, ValueError) as e:
+        logging.error(f"[{data_type} {start_time}~{end_time}] 流式读取响应失败，已提前结束: {e}")
+        if errors is not None:
+            errors.append(f"[{data_type} {start_time}~{end_time}] 流式读取响应失败: {e}")
+    finally:
+        response.close()
+
+def split_time_window(start_time, end_time, chunk_minutes):
+    """
+    将 [start_time, end_time] 按chunk_minutes切分为首尾相接的子区间列表 [(start, end), ...]。
+    chunk_minutes<=0 时不切分。
+    """
+    if not chunk_minutes or chunk_minutes <= 0:
+        return [(start_time, end_time)]
+    begin = datetime.datetime.strptime(start_time, TIME_FORMAT)
+    end = datetime.datetime.strptime(end_time, TIME_FORMAT)
+    step = datetime.timedelta(minutes=chunk_minutes)
+    chunks = []
+    while begin < end:
+        chunk_end = min(begin + step, end)
+        chunks.append((begin.strftime(TIME_FORMAT), chunk_end.strftime(TIME_FORMAT)))
+        begin = chunk_end
+    return chunks or [(start_time, end_time)]
+
+def row_time_ms(row):
+    """
+    取原始数据行的时间戳（毫秒），用于排序和边界去重。
+    """
+    for field in TIME_FIELDS:
+        if field in row:
+            return parse_datetime_to_ms(row[field])
+    return 0
+
+def _row_key(row):
+    return json.dumps(row, sort_keys=True, ensure_ascii=False)
+
+def merge_chunks(chunks, bounds):
+    """
+    按时间顺序拼接各子区间的数据，并去除相邻子区间边界上重复返回的行。
+    chunks: 各子区间的data列表，与bounds一一对应
+    bounds: 各子区间的 (start, end)
+    """
+    merged = []
+    prev_edge_rows = set()
+    for idx, data in enumerate(chunks):
+        boundary_ms = parse_datetime_to_ms(bounds[idx][0])
+        next_boundary_ms = parse_datetime_to_ms(bounds[idx + 1][0]) if idx + 1 < len(bounds) else None
+        edge_rows = set()
+        for row in data:
+            ts = row_time_ms(row)
+            # 只有落在边界上的行才可能被相邻两个子区间重复返回
+            if prev_edge_rows and ts <= boundary_ms and _row_key(row) in prev_edge_rows:
                 continue
-            if data:
-                return data
-            else:
-                logging.warning(f"[{url}] data字段为空列表")
-                errors.append(f"[{url}] data字段为空列表")
-        except requests.RequestException as e:
-            logging.error(f"[{url}] 网络请求失败: {e}")
-            errors.append(f"[{url}] 网络请求失败: {e}")
-        except Exception as e:
-            logging.error(f"[{url}] 未知错误: {e}")
-            errors.append(f"[{url}] 未知错误: {e}")
-    logging.error(f"所有节点均请求失败，错误信息: {errors}")
-    return [] 
\ No newline at end of file
+            if next_boundary_ms is not None and ts >= next_boundary_ms:
+                edge_rows.add(_row_key(row))
+            merged.append((ts, row))
+        prev_edge_rows = edge_rows
+    merged.sort(key=lambda pair: pair[0])
+    return [row for _, row in merged]
+
+def fetch_with_retry(vin, start_time, end_time, data_type, sub_type=None,
+                     retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, **kwargs):
+    """
+    拉取单个时间区间，所有节点均失败时按指数退避（backoff * 2^n 秒）重试retries次。
+    重试耗尽后抛出FetchError。
+    """
+    for attempt in range(retries + 1):
+        try:
+            return _race_nodes(vin, start_time, end_time, data_type, sub_type, **kwargs)
+        except FetchError as e:
+            if attempt >= retries:
+                raise
+            delay = backoff * (2 ** attempt)
+            logging.warning(f"[{data_type} {start_time}~{end_time}] 第{attempt + 1}次请求失败，{delay:.1f}s后重试: {e}")
+            time.sleep(delay)
+
+def fetch_data_chunked(vin, start_time, end_time, data_type, sub_type=None,
+                       chunk_minutes=DEFAULT_CHUNK_MINUTES, max_workers=DEFAULT_CHUNK_WORKERS,
+                       retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, errors=None, **kwargs):
+    """
+    将时间窗口按chunk_minutes切分为子区间并行拉取，每个子区间独立重试，
+    结果按时间顺序拼接并去除边界重复行。总耗时约等于最慢的一个子区间。
+    某个子区间重试耗尽后记录错误并跳过，其余子区间的数据照常返回；
+    传入errors（list）时同时把错误信息追加到其中，调用方据此判断结果是否完整。
+    其余关键字参数（timeout/session）透传给单次请求。
+    """
+    bounds = split_time_window(start_time, end_time, chunk_minutes)
+    if len(bounds) == 1:
+        try:
+            return fetch_with_retry(vin, start_time, end_time, data_type, sub_type,
+                                    retries=retries, backoff=backoff, **kwargs)
+        except FetchError as e:
+            logging.error(str(e))
+            if errors is not None:
+                errors.append(str(e))
+            return []
+    def fetch_chunk(bound):
+        try:
+            return fetch_with_retry(vin, bound[0], bound[1], data_type, sub_type,
+                                    retries=retries, backoff=backoff, **kwargs)
+        except FetchError as e:
+            logging.error(f"[{data_type} {bound[0]}~{bound[1]}] 子区间拉取失败，已跳过: {e}")
+            if errors is not None:
+                errors.append(f"[{data_type} {bound[0]}~{bound[1]}] {e}")
+            return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(bounds)), thread_name_prefix='tracegen-chunk') as executor:
+        chunks = list(executor.map(fetch_chunk, bounds))
+    return merge_chunks(chunks, bounds)
+
+def fetch_data_cached(vin, start_time, end_time, data_type, sub_type=None, cache=None, refresh=False,
+                      max_workers=DEFAULT_CHUNK_WORKERS, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                      chunk_minutes=None, errors=None, **kwargs):
+    """
+    带本地缓存的拉取：时间窗口按缓存桶切分，已缓存且未过期的桶直接读盘，
+    只并行拉取缺失的桶并写回缓存，最后按时间拼接、去除边界重复行并裁剪到 [start_time, end_time]。
+    refresh=True 时忽略已有缓存，全部重新拉取并覆盖。
+    启用缓存时请求按缓存桶切分，chunk_minutes不生效。
+    某个桶重试耗尽后记录错误并跳过，传入errors（list）时同时把错误信息追加到其中。
+    """
+    bounds = cache.bucket_bounds(start_time, end_time)
+    chunks = [None] * len(bounds)
+    missing = []
+    for idx, (bucket_start, _) in enumerate(bounds):
+        if not refresh:
+            with _stage('cache', data_type):
+                chunks[idx] = cache.get(vin, data_type, sub_type, bucket_start)
+        if chunks[idx] is None:
+            missing.append(idx)
+    if len(missing) < len(bounds):
+        logging.info(f"[cache] {data_type}: 命中 {len(bounds) - len(missing)}/{len(bounds)} 个时间桶")
+    def fetch_bucket(idx):
+        bucket_start, bucket_end = bounds[idx]
+        try:
+            data = fetch_with_retry(vin, bucket_start, bucket_end, data_type, sub_type,
+                                    retries=retries, backoff=backoff, **kwargs)
+        except FetchError as e:
+            logging.error(f"[{data_type} {bucket_start}~{bucket_end}] 时间桶拉取失败，已跳过: {e}")
+            if errors is not None:
+                errors.append(f"[{data_type} {bucket_start}~{bucket_end}] {e}")
+            return []
+        # 空结果可能是数据尚未上传，不写缓存
+        if data and cache.is_complete(bucket_end):
+            with _stage('cache', data_type):
+                cache.put(vin, data_type, sub_type, bucket_start, data)
+        return data
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing)), thread_name_prefix='tracegen-bucket') as executor:
+            for idx, data in zip(missing, executor.map(fetch_bucket, missing)):
+                chunks[idx] = data
+    start_ms = parse_datetime_to_ms(start_time)
+    end_ms = parse_datetime_to_ms(end_time)
+    return [row for row in merge_chunks(chunks, bounds) if start_ms <= row_time_ms(row) <= end_ms]
+
+def fetch_many(vin, start_time, end_time, data_types, max_workers=None, cache=None, refresh=False, errors=None, **kwargs):
+    """
+    并发拉取多种数据类型，按data_types顺序依次产出 (data_type, data, elapsed)。
+    所有类型同时发起请求，调用方处理前一个类型时，后续类型仍在后台拉取。
+    elapsed为该类型从发起请求到拿到数据的墙钟耗时（秒）。
+    传入cache（DataCache）时走本地缓存，否则直接分片拉取。
+    errors: 可选dict，拉取失败（被跳过）的子区间/时间桶的错误信息按类型记入 errors[data_type]（list），没有失败的类型不出现。
+    其余关键字参数透传给fetch_data_cached/fetch_data_chunked。
+    """
+    data_types = list(data_types)
+    if not data_types:
+        return
+    def timed_fetch(data_type):
+        begin = time.perf_counter()
+        type_errors = []
+        if cache is not None:
+            data = fetch_data_cached(vin, start_time, end_time, data_type, cache=cache, refresh=refresh,
+                                     errors=type_errors, **kwargs)
+        else:
+            data = fetch_data_chunked(vin, start_time, end_time, data_type, errors=type_errors, **kwargs)
+        if type_errors and errors is not None:
+            errors[data_type] = type_errors
+        return data, time.perf_counter() - begin
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(data_types), thread_name_prefix='tracegen-fetch')
+    try:
+        futures = [(data_type, executor.submit(timed_fetch, data_type)) for data_type in data_types]
+        for data_type, future in futures:
+            data, elapsed = future.result()
+            yield data_type, data, elapsed
+    finally:
+        executor.shutdown(wait=False)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import math
+
+import numpy as np
+
+from tracegen.adapters.columnar import CounterBatch
+from tracegen.events import as_events
+from tracegen.utils import parse_offset_str
+
+DECIMATE_MODES = ('lttb', 'minmax', 'avg')
+# 未指定分辨率时，按时间窗口自动选择，使每条counter track约保留该数量的时间桶
+DEFAULT_TARGET_BUCKETS = 2000
+
+def parse_resolutions(specs):
+    """
+    解析降采样分辨率配置，返回 {process_name: 秒}，'*' 为默认值（None表示按窗口自动选择）。
+    specs: 可迭代的字符串，如 ['5m', 'psi_avg_10s=1m', 'cpu_short_30s=10m']；不带 = 的项为默认分辨率，'auto' 表示自动。
+    """
+    resolutions = {'*': None}
+    for spec in specs or ():
+        name, _, value = spec.rpartition('=')
+        name = name.strip() or '*'
+        value = value.strip()
+        if value == 'auto':
+            resolutions[name] = None
+            continue
+        seconds = parse_offset_str(value)
+        if seconds <= 0:
+            raise ValueError(f"降采样分辨率非法: {spec}")
+        resolutions[name] = seconds
+    return resolutions
+
+def auto_resolution(start_ms, end_ms, target_buckets=DEFAULT_TARGET_BUCKETS):
+    """
+    按时间窗口长度选择分辨率（秒），使窗口被切为约target_buckets个时间桶。
+    """
+    return max(1, math.ceil((end_ms - start_ms) / 1000 / target_buckets))
+
+def _buckets(timestamps, bucket_ms):
+    """
+    按时间桶切分（timestamps已升序），返回 (每个桶的起始下标, 每个桶的采样数)。
+    """
+    bucket_ids = (timestamps - timestamps[0]) // bucket_ms
+    starts = np.flatnonzero(np.r_[True, bucket_ids[1:] != bucket_ids[:-1]])
+    counts = np.diff(np.r_[starts, len(timestamps)])
+    return starts, counts
+
+def _minmax(timestamps, values, starts, counts):
+    """
+    每个桶保留最小值和最大值两个原始采样点（按原时间顺序），返回选中的下标与各点所在桶的采样数。
+    """
+    bucket_of = np.repeat(np.arange(len(starts)), counts)
+    order = np.lexsort((values, bucket_of))
+    min_idx = order[starts]
+    max_idx = order[starts + counts - 1]
+    idx = np.unique(np.concatenate([min_idx, max_idx]))
+    return idx, counts[bucket_of[idx]]
+
+def _lttb(timestamps, values, starts, counts):
+    """
+    Largest-Triangle-Three-Buckets：首尾采样点固定保留，每个桶选出与前一个选中点、
+    下一个桶均值点构成三角形面积最大的采样点。再补上全局最大/最小值点，保证峰值不丢失。
+    """
+    n_buckets = len(starts)
+    x = timestamps.astype(np.float64)
+    selected = [0]
+    prev = 0
+    for b in range(n_buckets):
+        lo = starts[b]
+        hi = lo + counts[b]
+        if b == 0:
+            lo = 1
+        if b == n_buckets - 1:
+            hi -= 1
+        if lo >= hi:
+            continue
+        if b + 1 < n_buckets:
+            next_lo = starts[b + 1]
+            next_hi = next_lo + counts[b + 1]
+            avg_x = x[next_lo:next_hi].mean()
+            avg_y = values[next_lo:next_hi].mean()
+        else:
+            avg_x = x[-1]
+            avg_y = values[-1]
+        area = np.abs((x[prev] - avg_x) * (values[lo:hi] - values[prev])
+                      - (x[prev] - x[lo:hi]) * (avg_y - values[prev]))
+        prev = lo + int(np.argmax(area))
+        selected.append(prev)
+    selected.append(len(timestamps) - 1)
+    selected.extend((int(np.argmax(values)), int(np.argmin(values))))
+    idx = np.unique(np.asarray(selected, dtype=np.int64))
+    bucket_of = np.repeat(np.arange(n_buckets), counts)
+    return idx, counts[bucket_of[idx]]
+
+def decimate_batch(batch, bucket_ms, mode):
+    """
+    对单条counter track降采样，返回新的CounterBatch（采样点数不多于时间桶数时原样返回）。
+    - minmax: 每个时间桶保留最小、最大两个原始采样点
+    - lttb:   每个时间桶保留一个视觉上最重要的原始采样点，并保留全局峰值点
+    - avg:    每个时间桶一个点，取桶内第一个采样时间，value为均值；另外保留全局最大/最小值的原始采样点，
+              峰值不被均值抹平（采样时间与桶的第一个采样时间相同时，直接替换该桶的均值点）
+    每个输出点的arguments记录 raw_count（所在时间桶的原始采样数），avg模式另记录桶内 min/max。
+    """
+    if mode not in DECIMATE_MODES:
+        raise ValueError(f"Unknown decimate mode: {mode}")
+    n = len(batch)
+    if n < 3:
+        return batch
+    timestamps = batch.timestamps
+    values = batch.values
+    if np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        values = values[order]
+    starts, counts = _buckets(timestamps, bucket_ms)
+    if len(starts) * (2 if mode == 'minmax' else 1) >= n:
+        return batch
+    if mode == 'avg':
+        sums = np.add.reduceat(values, starts)
+        mins = np.minimum.reduceat(values, starts)
+        maxs = np.maximum.reduceat(values, starts)
+        arguments = [{'raw_count': c, 'min': lo, 'max': hi}
+                     for c, lo, hi in zip(counts.tolist(), mins.tolist(), maxs.tolist())]
+        new_values = sums / counts
+        new_timestamps = timestamps[starts]
+        extra = []
+        for peak in sorted({int(np.argmax(values)), int(np.argmin(values))}):
+            b = int(np.searchsorted(starts, peak, side='right')) - 1
+            if timestamps[peak] == new_timestamps[b]:
+                new_values[b] = values[peak]
+            else:
+                extra.append((peak, b))
+        if extra:
+            peaks = np.asarray([peak for peak, _ in extra], dtype=np.int64)
+            all_timestamps = np.concatenate([new_timestamps, timestamps[peaks]])
+            order = np.argsort(all_timestamps, kind='stable')
+            new_timestamps = all_timestamps[order]
+            new_values = np.concatenate([new_values, values[peaks]])[order]
+            all_arguments = arguments + [dict(arguments[b]) for _, b in extra]
+            arguments = [all_arguments[i] for i in order.tolist()]
+    else:
+        if mode == 'minmax':
+            idx, raw_counts = _minmax(timestamps, values, starts, counts)
+        else:
+            idx, raw_counts = _lttb(timestamps, values, starts, counts)
+        arguments = [{'raw_count': c} for c in raw_counts.tolist()]
+        new_values = values[idx]
+        new_timestamps = timestamps[idx]
+    return CounterBatch(batch.process_name, batch.track_name, batch.event_name, new_timestamps, new_values,
+                        category=batch.category, pid=batch.pid, arguments=arguments)
+
+def decimate_batches(batches, mode, resolutions, start_ms=None, end_ms=None):
+    """
+    对适配器输出的批次做降采样：CounterBatch按其process_name对应的分辨率处理，其它批次原样返回。
+    resolutions: parse_resolutions 的返回值；分辨率为None（auto）时按 [start_ms, end_ms] 自动选择，
+    未提供窗口时按各track自身的时间跨度选择。
+    """
+    result = []
+    for batch in batches:
+        if batch.event_type != 'counter' or not len(batch):
+            result.append(batch)
+            continue
+        seconds = resolutions.get(batch.process_name, resolutions.get('*'))
+        if seconds is None:
+            if start_ms is not None and end_ms is not None:
+                seconds = auto_resolution(start_ms, end_ms)
+            else:
+                seconds = auto_resolution(int(batch.timestamps.min()), int(batch.timestamps.max()))
+        result.append(decimate_batch(batch, seconds * 1000, mode))
+    return result
+
+class CounterCollector:
+    """
+    标准格式事件流中的counter事件收集器：filter() 透传非counter事件（dict输入转为StandardEvent），
+    counter事件按 (process_name, track_name, event_name, category, pid) 收集为列，
+    之后由 batches() 输出 CounterBatch 交给降采样与 PerfettoTraceManager.from_columnar。
+    只收集必填字段合法、value可转为数值的counter事件，其余透传给 from_standard_format 按schema校验并计数。
+    """
+    def __init__(self):
+        self.columns = {}
+        self.count = 0
+
+    def filter(self, events):
+        for item in as_events(events):
+            ts = item.timestamp
+            pname = item.process_name
+            tname = item.track_name
+            if (item.event_type != "counter" or not pname or not isinstance(pname, str)
+                    or not tname or not isinstance(tname, str) or ts is None or not isinstance(ts, (int, float))):
+                yield item
+                continue
+            try:
+                value = float(item.value)
+            except Exception:
+                yield item
+                continue
+            key = (pname, tname, item.event_name, item.category, item.pid)
+            ts_list, val_list = self.columns.setdefault(key, ([], []))
+            ts_list.append(ts)
+            val_list.append(value)
+            self.count += 1
+
+    def batches(self):
+        return [
+            CounterBatch(process_name, track_name, event_name, ts_list, val_list, category=category, pid=pid)
+            for (process_name, track_name, event_name, category, pid), (ts_list, val_list) in self.columns.items()
+        ]
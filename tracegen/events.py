@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import sys
+
+# 标准格式事件的字段（见 configs/standard_trace_schema.json）
+EVENT_FIELDS = ('event_type', 'process_name', 'track_name', 'event_name', 'timestamp', 'value',
+                'duration_ns', 'category', 'pid', 'message', 'arguments')
+
+class StandardEvent:
+    """
+    紧凑的标准格式事件记录，替代每条事件一个dict：
+    - __slots__ 存储，无实例dict，单条事件的内存约为等价dict的三分之一
+    - process_name/track_name/event_name/category 经 sys.intern，同名字符串全局只存一份
+    - arguments 为空时存None，不再为每条事件分配空dict
+    提供与dict相同的 get()/[] 读取接口，PerfettoTraceManager.from_standard_format 等消费方可同时接受dict与记录；
+    需要dict（如JSON导出）时用 to_dict()，已有的dict可用 from_dict() 转为记录。
+    """
+    __slots__ = EVENT_FIELDS
+
+    def __init__(self, event_type=None, process_name=None, track_name=None, event_name=None, timestamp=None, value=0,
+                 duration_ns=0, category='default', pid=None, message='', arguments=None,
+                 _str=str, _intern=sys.intern):
+        # 逐条事件调用，intern判断内联（_str/_intern为局部绑定，调用方不传）
+        self.event_type = event_type
+        self.process_name = _intern(process_name) if type(process_name) is _str else process_name
+        self.track_name = _intern(track_name) if type(track_name) is _str else track_name
+        self.event_name = _intern(event_name) if type(event_name) is _str else event_name
+        self.timestamp = timestamp
+        self.value = value
+        self.duration_ns = duration_ns
+        self.category = _intern(category) if type(category) is _str else category
+        self.pid = pid
+        self.message = message
+        self.arguments = arguments or None
+
+    def get(self, key, default=None):
+        """
+        与 dict.get 兼容；字段未设置时返回构造函数中的缺省值（与标准格式dict缺少该键时的处理一致）。
+        """
+        return getattr(self, key, default) if key in EVENT_FIELDS else default
+
+    def __getitem__(self, key):
+        if key not in EVENT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in EVENT_FIELDS
+
+    def to_dict(self):
+        """
+        转为标准格式dict（arguments为空时为{}）。
+        """
+        result = {field: getattr(self, field) for field in EVENT_FIELDS}
+        result['arguments'] = dict(self.arguments) if self.arguments else {}
+        return result
+
+    @classmethod
+    def from_dict(cls, item):
+        """
+        标准格式dict -> 记录，缺少的字段取缺省值，多余的键忽略。
+        """
+        return cls(**{field: item[field] for field in EVENT_FIELDS if field in item})
+
+    def __repr__(self):
+        fields = ', '.join(f"{field}={getattr(self, field)!r}" for field in EVENT_FIELDS
+                           if getattr(self, field) not in (None, '', 0) or field == 'timestamp')
+        return f"StandardEvent({fields})"
+
+def as_events(items):
+    """
+    把标准格式dict的可迭代对象逐条转为StandardEvent（记录原样透传），用于兼容旧的dict输入。
+    """
+    for item in items:
+        yield item if type(item) is StandardEvent else StandardEvent.from_dict(item)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import codecs
+import json
+
+_WHITESPACE = ' \t\r\n'
+
+class _Buffer:
+    """
+    增量解码的文本缓冲区：按需从字节块迭代器读取，已消费的前缀定期丢弃。
+    offset/lines/line_start 记录已丢弃前缀的字符数、换行数与最后一行的起始位置，用于报告错误在整个文档中的位置。
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+        self.offset = 0
+        self.lines = 0
+        self.line_start = 0
+
+    def fill(self) -> bool:
+        """
+        读入下一个字节块，返回是否读到了新数据。
+        """
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            # 多字节字符被截断时本块可能解码为空串，继续读下一块
+            decoded = self._decoder.decode(chunk)
+            if not decoded:
+                continue
+            if self.pos > 65536:
+                newline = self.text.rfind('\n', 0, self.pos)
+                if newline >= 0:
+                    self.lines += self.text.count('\n', 0, self.pos)
+                    self.line_start = self.offset + newline + 1
+                self.offset += self.pos
+                self.text = self.text[self.pos:]
+                self.pos = 0
+            self.text += decoded
+            return True
+        self.text += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """
+        跳过空白，返回下一个非空白字符（EOF时返回''），不消费。
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def error(self, msg, pos=None):
+        """
+        构造与 json.loads 相同的 json.JSONDecodeError：pos为缓冲区内的位置（默认当前位置），
+        报告的 pos/lineno/colno 换算为整个文档中的位置。
+        """
+        pos = self.pos if pos is None else pos
+        doc_pos = self.offset + pos
+        lineno = self.lines + self.text.count('\n', 0, pos) + 1
+        newline = self.text.rfind('\n', 0, pos)
+        colno = pos - newline if newline >= 0 else doc_pos - self.line_start + 1
+        err = json.JSONDecodeError(msg, self.text, pos)
+        err.args = (f"{msg}: line {lineno} column {colno} (char {doc_pos})",)
+        err.pos, err.lineno, err.colno = doc_pos, lineno, colno
+        return err
+
+    def decode_value(self, decoder):
+        """
+        跳过空白后从当前位置解码一个完整的JSON值，数据不完整时继续读入。
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            # 数字可能被字节块截断（如 1.|5、12|34），非EOF时需确认值后紧跟分隔符
+            if not self.eof:
+                nxt = end
+                while nxt < len(self.text) and self.text[nxt] in _WHITESPACE:
+                    nxt += 1
+                if (nxt >= len(self.text) or self.text[nxt] not in ',]}:') and self.fill():
+                    continue
+            self.pos = end
+            return value
+
+def _iter_array(buf, decoder):
+    """
+    逐个产出当前位置（'[' 之后）数组的元素，消费到 ']' 为止；分隔符错误与 json.loads 报错一致。
+    """
+    if buf.peek() == ']':
+        buf.pos += 1
+        return
+    while True:
+        yield buf.decode_value(decoder)
+        ch = buf.peek()
+        if ch == ']':
+            buf.pos += 1
+            return
+        if ch != ',':
+            raise buf.error("Expecting ',' delimiter")
+        buf.pos += 1
+
+def iter_json_array_items(chunks, key='data'):
+    """
+    从字节块迭代器（如 response.iter_content()）增量解析形如 {"...": ..., "data": [ {...}, ... ]} 的JSON，
+    逐个产出顶层对象中 key 字段数组的元素，不在内存中保留完整响应（其它字段的值解码后丢弃）。
+    key字段不存在或为null时不产出任何元素；顶层不是对象或key字段不是列表时抛出ValueError；
+    JSON格式错误时抛出与 json.loads 相同的 json.JSONDecodeError（ValueError的子类，位置为整个文档中的位置），
+    数组之后的内容同样校验，错误在产出最后一个元素之后抛出。
+    """
+    buf = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+    if buf.peek() != '{':
+        buf.decode_value(decoder)
+        raise ValueError("响应JSON不是字典类型")
+    buf.pos += 1
+    if buf.peek() == '}':
+        buf.pos += 1
+    else:
+        while True:
+            if buf.peek() != '"':
+                raise buf.error("Expecting property name enclosed in double quotes")
+            name = buf.decode_value(decoder)
+            if buf.peek() != ':':
+                raise buf.error("Expecting ':' delimiter")
+            buf.pos += 1
+            if name == key and buf.peek() == '[':
+                buf.pos += 1
+                yield from _iter_array(buf, decoder)
+            elif buf.decode_value(decoder) is not None and name == key:
+                raise ValueError(f"{key}字段不是列表类型")
+            ch = buf.peek()
+            if ch not in (',', '}'):
+                raise buf.error("Expecting ',' delimiter")
+            buf.pos += 1
+            if ch == '}':
+                break
+    if buf.peek() != '':
+        raise buf.error("Extra data")
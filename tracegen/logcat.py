@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import gzip
+
+from tracegen.utils import parse_datetime_to_seconds
+
+# logcat threadtime 格式（年份可选，-v year 时带年份）：
+#   2025-05-29 07:00:00.123  1234  5678 I ActivityManager: message
+#        05-29 07:00:00.123  1234  5678 I ActivityManager: message
+
+# logcat优先级 -> AndroidLogPriority 枚举值（A/assert 记为 FATAL）
+LOG_PRIORITIES = {'V': 2, 'D': 3, 'I': 4, 'W': 5, 'E': 6, 'F': 7, 'A': 7}
+
+def parse_logcat_lines(lines, year=None):
+    """
+    逐行解析logcat，产出 (本地毫秒时间戳, pid, tid, prio, tag, message)，无法解析的行产出None（便于调用方计数）。
+    year: 行内不带年份时使用的年份（字符串或int）。
+    每行只做一次 split(None, 5) 切出 日期/时间/pid/tid/优先级/「tag: message」，message内的空白原样保留；
+    同一秒内的连续多行只解析一次时间，毫秒部分直接相加。
+    """
+    priorities = LOG_PRIORITIES
+    default_year = str(year) if year is not None else None
+    last_date = last_hms = None
+    last_ms = None
+    for line in lines:
+        parts = line.split(None, 5)
+        try:
+            date, clock, pid, tid, level, rest = parts
+            tag, message = rest.split(': ', 1)
+            hms = clock[:8]
+            if date != last_date or hms != last_hms:
+                if len(date) == 5:
+                    date_str = f"{default_year}-{date}" if default_year else None
+                else:
+                    date_str = date
+                seconds = parse_datetime_to_seconds(f"{date_str} {hms}") if date_str else None
+                last_date, last_hms = date, hms
+                last_ms = int(seconds) * 1000 if seconds is not None else None
+            if last_ms is None or len(clock) != 12 or clock[8] != '.':
+                yield None
+                continue
+            yield (last_ms + int(clock[9:]), int(pid), int(tid), priorities[level],
+                   tag.rstrip(), message.rstrip('\r\n'))
+        except (ValueError, KeyError):
+            yield None
+
+def iter_logcat_file(path, encoding='utf-8'):
+    """
+    流式逐行读取logcat文件（.gz 自动解压），非法编码的字节替换为U+FFFD。
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding=encoding, errors='replace', newline='') as f:
+        yield from f
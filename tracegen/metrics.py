@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import cProfile
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+try:
+    import resource
+except ImportError:  # Windows 无 resource 模块，不统计峰值RSS
+    resource = None
+
+# 流水线各阶段，报告按此顺序输出（未列出的阶段排在后面）
+STAGES = ('network', 'cache', 'json_decode', 'adapter', 'decimate', 'packet_build', 'serialize')
+# 不属于某个数据类型的耗时（如最终写出）记在该名下
+OUTPUT_TYPE = 'output'
+
+def peak_rss_bytes():
+    """
+    返回当前进程迄今为止的峰值RSS（字节），不支持的平台返回None。
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux单位为KB，macOS为字节
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class _StageTimer:
+    """
+    阶段计时器：记录独占耗时，嵌套在内层的计时从外层扣除，
+    因此生成器串成的流水线（网络 -> JSON解析 -> 适配器 -> packet）各阶段耗时互不重复。
+    """
+    __slots__ = ('_metrics', '_stage', '_data_type', '_begin')
+
+    def __init__(self, metrics, stage, data_type):
+        self._metrics = metrics
+        self._stage = stage
+        self._data_type = data_type
+
+    def __enter__(self):
+        self._metrics._stack().append(0.0)
+        self._begin = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._begin
+        stack = self._metrics._stack()
+        child = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        self._metrics.add_time(self._stage, elapsed - child, self._data_type)
+
+class PipelineMetrics:
+    """
+    转换流水线的分阶段指标，按数据类型汇总：
+    - stages: 各阶段累计耗时（秒）；多线程并发的阶段（如多个节点/时间桶同时请求）按线程耗时累加，可能大于墙钟耗时
+    - rows/events: 原始行数与写入的事件数
+    - bytes_received: 从服务端读取的响应字节数（含竞速落败节点）
+    - peak_rss_bytes: 该类型处理完成时进程的峰值RSS
+    线程安全，可在拉取线程中记录。
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.current_type = None
+        self.types = defaultdict(lambda: {'stages': defaultdict(float), 'rows': 0, 'events': 0,
+                                          'bytes_received': 0, 'peak_rss_bytes': None})
+        self.wall_seconds = 0.0
+        self.bytes_written = 0
+        self.file_bytes = 0
+        self.tracemalloc_peak_bytes = None
+        self._begin = time.perf_counter()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def timer(self, stage, data_type=None):
+        """
+        with metrics.timer('adapter'): ... 记录一段代码的独占耗时，data_type默认为current_type。
+        """
+        return _StageTimer(self, stage, data_type)
+
+    def timed_iter(self, iterable, stage, data_type=None):
+        """
+        包装迭代器，把每次取下一个元素的耗时记入stage（扣除上游嵌套阶段的耗时）。
+        """
+        it = iter(iterable)
+        while True:
+            with _StageTimer(self, stage, data_type):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def add_time(self, stage, seconds, data_type=None):
+        with self._lock:
+            self.types[data_type or self.current_type or OUTPUT_TYPE]['stages'][stage] += seconds
+
+    def add_count(self, data_type, rows=0, events=0, bytes_received=0):
+        with self._lock:
+            entry = self.types[data_type]
+            entry['rows'] += rows
+            entry['events'] += events
+            entry['bytes_received'] += bytes_received
+
+    def merge_types(self, types):
+        """
+        合并其它进程记录的分类型指标（to_dict()['types'] 的格式），用于并行转换时汇总各工作进程。
+        """
+        with self._lock:
+            for data_type, other in types.items():
+                entry = self.types[data_type]
+                for stage, seconds in other['stages'].items():
+                    entry['stages'][stage] += seconds
+                entry['rows'] += other['rows']
+                entry['events'] += other['events']
+                entry['bytes_received'] += other['bytes_received']
+                if other['peak_rss_bytes'] is not None:
+                    entry['peak_rss_bytes'] = max(entry['peak_rss_bytes'] or 0, other['peak_rss_bytes'])
+
+    def begin_type(self, data_type):
+        """
+        开始处理某个数据类型，此后未指定类型的计时记在该类型下。
+        """
+        self.current_type = data_type
+
+    def end_type(self, data_type):
+        self.types[data_type]['peak_rss_bytes'] = peak_rss_bytes()
+        self.current_type = None
+
+    def finish(self, bytes_written=0, file_bytes=0):
+        """
+        转换结束时调用，记录总墙钟耗时与输出字节数。
+        """
+        self.wall_seconds = time.perf_counter() - self._begin
+        self.bytes_written = bytes_written
+        self.file_bytes = file_bytes
+        if tracemalloc.is_tracing():
+            self.tracemalloc_peak_bytes = tracemalloc.get_traced_memory()[1]
+
+    def stage_names(self):
+        names = {stage for entry in self.types.values() for stage in entry['stages']}
+        return [s for s in STAGES if s in names] + sorted(names - set(STAGES))
+
+    def to_dict(self):
+        return {
+            'wall_seconds': round(self.wall_seconds, 6),
+            'bytes_written': self.bytes_written,
+            'file_bytes': self.file_bytes,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'tracemalloc_peak_bytes': self.tracemalloc_peak_bytes,
+            'types': {
+                data_type: {
+                    'stages': {stage: round(sec, 6) for stage, sec in entry['stages'].items()},
+                    'rows': entry['rows'],
+                    'events': entry['events'],
+                    'bytes_received': entry['bytes_received'],
+                    'peak_rss_bytes': entry['peak_rss_bytes'],
+                }
+                for data_type, entry in self.types.items()
+            },
+        }
+
+    def dump_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def report(self):
+        """
+        打印各数据类型的分阶段耗时与计数。
+        """
+        stages = self.stage_names()
+        print()
+        print(f"{'type':<8}" + ''.join(f"{stage:>13}" for stage in stages)
+              + f"{'rows':>10}{'events':>10}{'recv_MB':>10}{'rss_MB':>9}")
+        for data_type, entry in self.types.items():
+            rss = entry['peak_rss_bytes']
+            print(f"{data_type:<8}" + ''.join(f"{entry['stages'].get(stage, 0.0):>12.3f}s" for stage in stages)
+                  + f"{entry['rows']:>10}{entry['events']:>10}{entry['bytes_received'] / 1e6:>10.2f}"
+                  + (f"{rss / 1e6:>9.1f}" if rss is not None else f"{'-':>9}"))
+        rss = peak_rss_bytes()
+        print(f"⏱️ 总耗时 {self.wall_seconds:.2f}s，写出 {self.bytes_written} 字节（文件 {self.file_bytes} 字节）"
+              + (f"，峰值RSS {rss / 1e6:.1f}MB" if rss is not None else "")
+              + (f"，tracemalloc峰值 {self.tracemalloc_peak_bytes / 1e6:.1f}MB" if self.tracemalloc_peak_bytes else ""))
+
+@contextlib.contextmanager
+def profile_session(cprofile_path=None, tracemalloc_path=None, top=30):
+    """
+    可选的深度剖析：
+    - cprofile_path: 保存cProfile统计（可用 python -m pstats 或 snakeviz 查看）
+    - tracemalloc_path: 开启tracemalloc，结束时把按代码行汇总的内存分配前top项写入文本文件
+    """
+    profiler = cProfile.Profile() if cprofile_path else None
+    if tracemalloc_path:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+            print(f"📝 cProfile统计已保存到 {cprofile_path}")
+        if tracemalloc_path:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(tracemalloc_path, 'w', encoding='utf-8') as f:
+                f.write(f"current={current} peak={peak}\n")
+                for stat in snapshot.statistics('lineno')[:top]:
+                    f.write(f"{stat}\n")
+            print(f"📝 tracemalloc统计已保存到 {tracemalloc_path}")
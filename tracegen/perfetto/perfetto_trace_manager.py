@@ -1,38 +1,183 @@
 # -*- coding: utf-8 -*-
 from tracegen.perfetto import perfetto_trace_pb2 as pftrace
+from tracegen.perfetto import wire
+from tracegen.perfetto.trace_writer import PacketWriter, resolve_compression
+from tracegen.events import StandardEvent
+from tracegen.logcat import parse_logcat_lines
+from tracegen.validation import EventValidator, VALIDATION_MODES
+import hashlib
+import os
+import shutil
 import uuid
 import time
-from typing import Dict, Tuple, Optional, List
-import datetime
+from typing import Dict, Tuple, Optional, List, Iterable
+import itertools
+from operator import attrgetter
+from functools import lru_cache
+
+SEQ_INCREMENTAL_STATE_CLEARED = pftrace.TracePacket.SequenceFlags.SEQ_INCREMENTAL_STATE_CLEARED
+SEQ_NEEDS_INCREMENTAL_STATE = pftrace.TracePacket.SequenceFlags.SEQ_NEEDS_INCREMENTAL_STATE
+# 每个android_log packet打包的LogEvent条数上限
+LOG_EVENTS_PER_PACKET = 1000
+# fast_encode逐点编码时，每批拼接写出的packet数
+ENCODE_BATCH_PACKETS = 4096
+# 序列内自定义时钟id须在64~127之间
+DELTA_CLOCK_ID = 64
+
+@lru_cache(maxsize=None)
+def parse_timezone_offset(tz_str):
+    """
+    解析+0800/-0600为秒数，结果按字符串缓存，逐条事件调用时不再重复解析。
+    """
+    if not tz_str or len(tz_str) != 5:
+        return 0
+    sign = 1 if tz_str[0] == '+' else -1
+    try:
+        hours = int(tz_str[1:3])
+        mins = int(tz_str[3:5])
+        return sign * (hours * 3600 + mins * 60)
+    except Exception:
+        return 0
+
+TRACK_TYPES = ('counter', 'instant', 'slice', 'log')
 
 def uuid64():
     return uuid.uuid4().int >> 64
 
+def track_uuid64(*key: str) -> int:
+    """
+    由key确定性地生成64位非零track uuid（blake2b），同样的key每次运行结果一致。
+    """
+    digest = hashlib.blake2b('\x00'.join(key).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
 class PerfettoTraceManager:
-    def __init__(self, timezone='+0800'):
-        self.trace = pftrace.Trace()
-        self.trusted_packet_sequence_id = uuid64() >> 32
-        self.process_tracks: Dict[str, Tuple[pftrace.TracePacket, int, int]] = {}  # process_name -> (track, uuid, pid)
-        self.instant_tracks: Dict[Tuple[str, str], Tuple[pftrace.TracePacket, int]] = {}
-        self.slice_tracks: Dict[Tuple[str, str], Tuple[pftrace.TracePacket, int]] = {}
-        self.counter_tracks: Dict[Tuple[str, str], Tuple[pftrace.TracePacket, int]] = {}
-        self.log_tracks: Dict[Tuple[str, str], Tuple[pftrace.TracePacket, int]] = {}
-        self._auto_pid = 10000  # 起始自动分配pid
+    def __init__(self, timezone='+0800', output_path: Optional[str] = None, intern_strings: bool = False,
+                 delta_timestamps: bool = False, delta_unit_ns: int = 1, compress: Optional[str] = None,
+                 auto_pid_base: int = 10000, uuid_namespace: str = '', deterministic: bool = False,
+                 validation: str = 'strict', fast_encode: bool = False, resume_state: Optional[dict] = None):
+        """
+        timezone: 时区字符串，如'+0800'
+        output_path: 指定后启用流式输出，每个packet生成后立即写入该文件，
+            不再在内存中保留完整的Trace消息；为None时沿用内存模式，最终由save_to_file一次性写出。
+        intern_strings: 事件名/category/参数名只在首次出现时写入interned_data，
+            之后的packet通过iid引用（依赖序列的增量状态），显著减小文件体积与序列化耗时。
+        delta_timestamps: 注册序列内的增量时钟，事件packet的timestamp写为与上一个packet的差值（小varint）。
+            事件需按时间排序后写出，因此该模式下事件packet会缓存到save_to_file/flush_events时再输出。
+        delta_unit_ns: 增量时钟的单位（纳秒），数据精度为毫秒时可设为1_000_000进一步缩小varint。
+        compress: 输出压缩格式，None/'gzip'/'zstd'（zstd需安装zstandard，否则回退gzip），写出时边写边压缩。
+        auto_pid_base: 未指定pid的进程从该值起自动分配pid；多个manager的输出合并为一个trace时应错开。
+        uuid_namespace: track uuid由 (namespace, process_name, track_type, track_name) 哈希得到，同样的输入每次生成相同的uuid；
+            多个manager的输出合并为一个trace时用不同的namespace区分。
+        deterministic: trusted_packet_sequence_id同样由uuid_namespace哈希得到（否则随机），
+            配合 add_clock_snapshot 传入由数据决定的时间戳，同样的输入生成字节一致的trace。
+        validation: from_standard_format 的schema校验模式，'off'/'sample'/'strict'（见 tracegen.validation）。
+        fast_encode: track描述符与counter/slice/instant事件packet由 tracegen.perfetto.wire 直接编码为字节，
+            不构建TracePacket对象（输出与protobuf序列化字节一致），counter序列按列向量化编码。
+            只在流式输出且未开启delta_timestamps时生效（这两种情况需要packet对象），否则沿用protobuf路径。
+        resume_state: 继续写同一个trace：由 export_state() 的结果恢复sequence id、进程/track注册表、自动pid与interned表，
+            输出追加到已有文件末尾。其余格式选项（intern_strings/delta_timestamps/compress等）须与原trace一致。
+        """
+        self.compress = resolve_compression(compress)
+        self.append = resume_state is not None
+        self.writer = PacketWriter(output_path, compress=self.compress, append=self.append) if output_path else None
+        self.trace = pftrace.Trace() if self.writer is None else None
+        if deterministic:
+            self.trusted_packet_sequence_id = (track_uuid64('sequence', uuid_namespace) >> 32) or 1
+        else:
+            self.trusted_packet_sequence_id = uuid64() >> 32
+        self.uuid_namespace = uuid_namespace
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {validation}")
+        self.validation = validation
+        self.process_tracks: Dict[str, Tuple[int, int]] = {}  # process_name -> (uuid, pid)
+        # track注册表：(process_name, track_type, track_name) -> 句柄，句柄为track_uuids的下标
+        self.tracks: Dict[Tuple[str, str, str], int] = {}
+        self.track_uuids: List[int] = []
+        self._auto_pid = auto_pid_base  # 起始自动分配pid
         self.timezone = timezone
+        self.intern_strings = intern_strings
+        self._interned: Dict[str, Dict[str, int]] = {
+            'event_names': {},
+            'event_categories': {},
+            'debug_annotation_names': {},
+        }
+        self._incremental_state_cleared = False
+        self.delta_timestamps = delta_timestamps
+        self.fast_encode = fast_encode and self.writer is not None and not delta_timestamps
+        # fast_encode的编码缓存：(类型, track uuid, 事件名, category) -> 事件固定字段；参数名 -> 编码
+        self._event_templates: Dict[Tuple[int, int, Optional[str], str], Tuple[bytes, bytes]] = {}
+        self._annotation_names: Dict[str, Tuple[bytes, bytes]] = {}
+        self.delta_unit_ns = delta_unit_ns
+        self._pending: List[pftrace.TracePacket] = []
+        # 分阶段指标（tracegen.metrics.PipelineMetrics），设置后流式写出的序列化耗时计入'serialize'
+        self.metrics = None
+        if resume_state is not None:
+            self._restore_state(resume_state)
+
+    def export_state(self) -> dict:
+        """
+        导出继续写同一个trace所需的状态（可JSON序列化）：sequence id、进程/track注册表、自动pid与interned表。
+        由 resume_state 恢复后，新的packet沿用原有的track uuid、pid与iid，Perfetto中各track前后连续。
+        """
+        return {
+            'sequence_id': self.trusted_packet_sequence_id,
+            'uuid_namespace': self.uuid_namespace,
+            'auto_pid': self._auto_pid,
+            'process_tracks': [[name, track_uuid, pid] for name, (track_uuid, pid) in self.process_tracks.items()],
+            # 按句柄顺序保存，恢复后句柄不变
+            'tracks': [[*key, self.track_uuids[handle]] for key, handle in self.tracks.items()],
+            'interned': {field: dict(table) for field, table in self._interned.items()},
+            'incremental_state_cleared': self._incremental_state_cleared,
+        }
+
+    def _restore_state(self, state: dict):
+        self.trusted_packet_sequence_id = state['sequence_id']
+        self.uuid_namespace = state['uuid_namespace']
+        self._auto_pid = state['auto_pid']
+        self.process_tracks = {name: (track_uuid, pid) for name, track_uuid, pid in state['process_tracks']}
+        for process_name, track_type, track_name, track_uuid in state['tracks']:
+            self.tracks[(process_name, track_type, track_name)] = len(self.track_uuids)
+            self.track_uuids.append(track_uuid)
+        for field, table in state['interned'].items():
+            self._interned[field].update(table)
+        self._incremental_state_cleared = state['incremental_state_cleared']
+
+    def _emit(self, packet: pftrace.TracePacket):
+        """
+        输出一个packet：流式模式直接写文件，内存模式追加到self.trace。
+        增量时间戳模式下，使用默认时钟的带时间戳packet先缓存，由flush_events排序后按增量写出。
+        """
+        if self.delta_timestamps and packet.HasField('timestamp') and not packet.HasField('timestamp_clock_id'):
+            self._pending.append(packet)
+            return
+        self._write(packet)
+
+    def _write(self, packet: pftrace.TracePacket):
+        if self.writer is not None:
+            if self.metrics is not None:
+                with self.metrics.timer('serialize'):
+                    self.writer.write_packet(packet)
+            else:
+                self.writer.write_packet(packet)
+        else:
+            self.trace.packet.append(packet)
+
+    def _write_bytes(self, data: bytes, count: int = 1):
+        """
+        fast_encode：写出count个已编码、已加Trace.packet字段头的packet。
+        """
+        if self.metrics is not None:
+            with self.metrics.timer('serialize'):
+                self.writer.write_framed(data, count)
+        else:
+            self.writer.write_framed(data, count)
 
     def _parse_timezone_offset(self, tz_str):
         """
         解析+0800/-0600为秒数
         """
-        if not tz_str or len(tz_str) != 5:
-            return 0
-        sign = 1 if tz_str[0] == '+' else -1
-        try:
-            hours = int(tz_str[1:3])
-            mins = int(tz_str[3:5])
-            return sign * (hours * 3600 + mins * 60)
-        except Exception:
-            return 0
+        return parse_timezone_offset(tz_str)
 
     def _to_utc_ms(self, ts):
         """
@@ -42,41 +187,172 @@ class PerfettoTraceManager:
         return int(ts) - offset * 1000
 
     def ensure_process_track(self, process_name: str, pid: Optional[int] = None) -> Tuple[int, int]:
-        if process_name not in self.process_tracks:
-            process_track = pftrace.TracePacket()
-            process_track_uuid = uuid64()
-            process_track.track_descriptor.uuid = process_track_uuid
-            process_track.track_descriptor.process.process_name = process_name
+        entry = self.process_tracks.get(process_name)
+        if entry is None:
+            process_track_uuid = track_uuid64(self.uuid_namespace, process_name)
             # 自动分配pid
             if pid is None or pid == 0:
                 pid = self._auto_pid
                 self._auto_pid += 1
-            process_track.track_descriptor.process.pid = pid
-            self.trace.packet.append(process_track)
-            self.process_tracks[process_name] = (process_track, process_track_uuid, pid)
-        return self.process_tracks[process_name][2], self.process_tracks[process_name][1]
+            if self.fast_encode:
+                self._write_bytes(wire.frame(wire.track_descriptor_packet(
+                    process_track_uuid, process_name=process_name, pid=pid if pid is not None and pid != 0 else None)))
+            else:
+                process_track, _ = create_process_track(pid, process_name, track_uuid=process_track_uuid)
+                self._emit(process_track)
+            entry = self.process_tracks[process_name] = (process_track_uuid, pid)
+        return entry[1], entry[0]
 
-    def ensure_track(self, process_name: str, track_type: str, track_name: str, pid: Optional[int] = None) -> int:
-        if track_type == 'counter':
-            key = (process_name, track_name)
-            tracks_map = self.counter_tracks
-        elif track_type == 'instant':
-            key = (process_name, track_name)
-            tracks_map = self.instant_tracks
-        elif track_type == 'slice':
-            key = (process_name, track_name)
-            tracks_map = self.slice_tracks
-        elif track_type == 'log':
-            key = (process_name, track_name)
-            tracks_map = self.log_tracks
-        else:
-            raise ValueError(f"Unknown track_type: {track_type}")
-        if key not in tracks_map:
+    def track_handle(self, process_name: str, track_type: str, track_name: str, pid: Optional[int] = None) -> int:
+        """
+        返回track的整数句柄（首次出现时写出track_descriptor），可由 track_uuids[handle] 取得uuid。
+        批量写入同一track时解析一次句柄即可复用。
+        """
+        key = (process_name, track_type, track_name)
+        handle = self.tracks.get(key)
+        if handle is None:
+            if track_type not in TRACK_TYPES:
+                raise ValueError(f"Unknown track_type: {track_type}")
             _, process_uuid = self.ensure_process_track(process_name, pid=pid)
-            track, uuid = create_track(process_uuid, track_name, track_type)
-            self.trace.packet.append(track)
-            tracks_map[key] = (track, uuid)
-        return tracks_map[key][1]
+            uuid = track_uuid64(self.uuid_namespace, process_name, track_type, track_name)
+            if self.fast_encode:
+                counter_unit = pftrace.CounterDescriptor.Unit.UNIT_COUNT if track_type == 'counter' else None
+                self._write_bytes(wire.frame(wire.track_descriptor_packet(uuid, name=track_name, parent_uuid=process_uuid,
+                                                                          counter_unit=counter_unit)))
+            else:
+                track, _ = create_track(process_uuid, track_name, track_type, track_uuid=uuid)
+                self._emit(track)
+            handle = self.tracks[key] = len(self.track_uuids)
+            self.track_uuids.append(uuid)
+        return handle
+
+    def ensure_track(self, process_name: str, track_type: str, track_name: str, pid: Optional[int] = None) -> int:
+        """
+        返回track的uuid，track不存在时创建。
+        """
+        handle = self.tracks.get((process_name, track_type, track_name))
+        if handle is None:
+            handle = self.track_handle(process_name, track_type, track_name, pid=pid)
+        return self.track_uuids[handle]
+
+    def _sequence_flags(self) -> int:
+        """
+        引用了interned数据的packet需要的sequence_flags；本序列第一个这样的packet同时声明增量状态已清空。
+        """
+        if not self._incremental_state_cleared:
+            self._incremental_state_cleared = True
+            return SEQ_INCREMENTAL_STATE_CLEARED | SEQ_NEEDS_INCREMENTAL_STATE
+        return SEQ_NEEDS_INCREMENTAL_STATE
+
+    def _intern(self, packet: pftrace.TracePacket, field: str, value: str) -> int:
+        """
+        返回字符串在本序列interned表中的iid；首次出现时分配iid并随当前packet写出interned_data。
+        field: 'event_names' / 'event_categories' / 'debug_annotation_names'
+        """
+        table = self._interned[field]
+        iid = table.get(value)
+        if iid is None:
+            iid = len(table) + 1
+            table[value] = iid
+            entry = getattr(packet.interned_data, field).add()
+            entry.iid = iid
+            entry.name = value
+        return iid
+
+    def _intern_entry(self, field: str, value: str, entries: list) -> int:
+        """
+        同 _intern，供fast_encode使用：首次出现的字符串以 (field, iid, value) 追加到entries，随当前packet编码。
+        """
+        table = self._interned[field]
+        iid = table.get(value)
+        if iid is None:
+            iid = len(table) + 1
+            table[value] = iid
+            entries.append((field, iid, value))
+        return iid
+
+    def _set_event_strings(self, packet: pftrace.TracePacket, event_name: Optional[str], category: str):
+        """
+        设置track_event的name/categories：普通模式直接写字符串，intern模式写iid。
+        """
+        event = packet.track_event
+        if not self.intern_strings:
+            if event_name is not None:
+                event.name = event_name
+            event.categories.append(category)
+            return
+        if event_name is not None:
+            event.name_iid = self._intern(packet, 'event_names', event_name)
+        event.category_iids.append(self._intern(packet, 'event_categories', category))
+        packet.sequence_flags |= self._sequence_flags()
+
+    def _add_arguments(self, packet: pftrace.TracePacket, arguments: Optional[Dict[str, str]]):
+        """
+        Arguments映射为debug_annotations，intern模式下参数名写iid。
+        """
+        if not arguments:
+            return
+        for k, v in arguments.items():
+            ann = packet.track_event.debug_annotations.add()
+            if self.intern_strings:
+                ann.name_iid = self._intern(packet, 'debug_annotation_names', str(k))
+                packet.sequence_flags |= self._sequence_flags()
+            else:
+                ann.name = str(k)
+            ann.string_value = str(v)
+
+    def _new_event_packet(self, timestamp: int, track_uuid: int, event_type: int,
+                          event_name: Optional[str], category: str) -> pftrace.TracePacket:
+        packet = pftrace.TracePacket()
+        packet.timestamp = timestamp
+        packet.trusted_packet_sequence_id = self.trusted_packet_sequence_id
+        packet.track_event.type = event_type
+        packet.track_event.track_uuid = track_uuid
+        self._set_event_strings(packet, event_name, category)
+        return packet
+
+    def _encode_event(self, timestamp: int, track_uuid: int, event_type: int, event_name: Optional[str],
+                      category: str, value: Optional[float] = None,
+                      arguments: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        fast_encode：编码一个track_event packet（已加Trace.packet字段头），字段与 _new_event_packet + _add_arguments 构建的packet一致。
+        同一 (类型, track, 事件名, category) 的固定字段只编码一次，之后逐packet只编码时间戳、counter值与arguments。
+        """
+        entries = []
+        key = (event_type, track_uuid, event_name, category)
+        parts = self._event_templates.get(key)
+        if parts is None:
+            if self.intern_strings:
+                name_iid = self._intern_entry('event_names', event_name, entries) if event_name is not None else None
+                category_iid = self._intern_entry('event_categories', category, entries)
+                parts = wire.event_body_parts(event_type, track_uuid, name_iid=name_iid, category_iid=category_iid)
+            else:
+                parts = wire.event_body_parts(event_type, track_uuid, name=event_name, category=category)
+            self._event_templates[key] = parts
+        prefix, suffix = parts
+        body = prefix + self._encode_annotations(arguments, entries) + suffix if arguments else prefix + suffix
+        packet = wire.track_event_packet(timestamp, self.trusted_packet_sequence_id, body, value,
+                                         wire.interned_data(entries) if entries else b'',
+                                         self._sequence_flags() if self.intern_strings else None)
+        return wire.frame(packet)
+
+    def _encode_annotations(self, arguments: Dict[str, str], entries: list) -> bytes:
+        """
+        fast_encode：arguments编码为debug_annotations，参数名部分按键缓存（intern模式下首次出现时追加到entries）。
+        """
+        names = self._annotation_names
+        encoded = []
+        for k, v in arguments.items():
+            name_parts = names.get(k)
+            if name_parts is None:
+                if self.intern_strings:
+                    name_parts = wire.annotation_name_parts(
+                        name_iid=self._intern_entry('debug_annotation_names', str(k), entries))
+                else:
+                    name_parts = wire.annotation_name_parts(name=str(k))
+                names[k] = name_parts
+            encoded.append(wire.encoded_annotation(name_parts[0], str(v), name_parts[1]))
+        return b''.join(encoded)
 
     def add_instant_event(self, 
         process_name: str, 
@@ -87,14 +363,14 @@ class PerfettoTraceManager:
         pid: Optional[int] = None, 
         arguments: Optional[Dict[str, str]] = None):
         track_uuid = self.ensure_track(process_name, 'instant', track_name, pid=pid)
-        packet = add_event(timestamp, track_uuid, event_name, category, self.trusted_packet_sequence_id, 'instant')
+        if self.fast_encode:
+            self._write_bytes(self._encode_event(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_INSTANT,
+                                                 event_name, category, arguments=arguments))
+            return
+        packet = self._new_event_packet(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_INSTANT, event_name, category)
         # 支持Arguments（debug_annotations）
-        if arguments:
-            for k, v in arguments.items():
-                ann = packet.track_event.debug_annotations.add()
-                ann.name = str(k)
-                ann.string_value = str(v)
-        self.trace.packet.append(packet)
+        self._add_arguments(packet, arguments)
+        self._emit(packet)
 
     def add_slice_event(self, 
         process_name: str, 
@@ -106,113 +382,354 @@ class PerfettoTraceManager:
         pid: Optional[int] = None,
         arguments: Optional[Dict[str, str]] = None):
         track_uuid = self.ensure_track(process_name, 'slice', track_name, pid=pid)
-        start_packet = add_event(timestamp, track_uuid, event_name, category, self.trusted_packet_sequence_id, 'slice', duration_ns)
+        if self.fast_encode:
+            self._write_bytes(self._encode_event(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_SLICE_BEGIN,
+                                                 event_name, category, arguments=arguments))
+            self._write_bytes(self._encode_event(timestamp + duration_ns, track_uuid,
+                                                 pftrace.TrackEvent.Type.TYPE_SLICE_END, None, category))
+            return
+        start_packet = self._new_event_packet(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_SLICE_BEGIN, event_name, category)
         # 支持Arguments（debug_annotations）
-        if arguments:
-            for k, v in arguments.items():
-                ann = start_packet.track_event.debug_annotations.add()
-                ann.name = str(k)
-                ann.string_value = str(v)
-        self.trace.packet.append(start_packet)
-        end_packet = pftrace.TracePacket()
-        end_packet.timestamp = timestamp + duration_ns
-        end_packet.trusted_packet_sequence_id = self.trusted_packet_sequence_id
-        end_packet.track_event.type = pftrace.TrackEvent.Type.TYPE_SLICE_END
-        end_packet.track_event.track_uuid = track_uuid
-        end_packet.track_event.categories.append(category)
-        self.trace.packet.append(end_packet)
+        self._add_arguments(start_packet, arguments)
+        self._emit(start_packet)
+        end_packet = self._new_event_packet(timestamp + duration_ns, track_uuid, pftrace.TrackEvent.Type.TYPE_SLICE_END, None, category)
+        self._emit(end_packet)
 
     def add_counter_event(self, process_name: str, track_name: str, event_name: str, timestamp: int, value: float, *, category: str = "default", pid: Optional[int] = None):
         track_uuid = self.ensure_track(process_name, 'counter', track_name, pid=pid)
-        packet = pftrace.TracePacket()
-        packet.timestamp = timestamp
-        packet.trusted_packet_sequence_id = self.trusted_packet_sequence_id
-        packet.track_event.type = pftrace.TrackEvent.Type.TYPE_COUNTER
-        packet.track_event.track_uuid = track_uuid
-        packet.track_event.name = event_name
-        packet.track_event.categories.append(category)
+        if self.fast_encode:
+            self._write_bytes(self._encode_event(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_COUNTER,
+                                                 event_name, category, value=float(value)))
+            return
+        packet = self._new_event_packet(timestamp, track_uuid, pftrace.TrackEvent.Type.TYPE_COUNTER, event_name, category)
         packet.track_event.double_counter_value = float(value)
-        self.trace.packet.append(packet)
+        self._emit(packet)
 
-    def add_log_event(self, process_name: str, track_name: str, log_lines: List[str], category: str = "default", pid: Optional[int] = None):
-        track_uuid = self.ensure_track(process_name, 'log', track_name, pid=pid)
-        for line in log_lines:
-            try:
-                msg_time = line[:23]
-                dt = datetime.datetime.strptime(msg_time, "%Y-%m-%d %H:%M:%S.%f")
-                stamp = datetime.datetime.timestamp(dt)
-                rest = line[23:].strip()
-                parts = rest.split()
-                pid_val = int(parts[0])
-                tid = int(parts[1])
-                level = parts[2]
-                tag_and_msg = " ".join(parts[3:])
-                tag, msg = tag_and_msg.split(": ", 1)
+    def add_counter_series(self, process_name: str, track_name: str, event_name: str,
+                           timestamps: Iterable[int], values: Iterable[float], *,
+                           category: str = "default", pid: Optional[int] = None,
+                           arguments: Optional[Iterable[Optional[Dict[str, str]]]] = None) -> int:
+        """
+        批量写入同一counter track的一组采样：timestamps为UTC纳秒，与values、arguments（可选）一一对应。
+        track只解析一次，逐点只构建packet。返回写入的采样数。
+        fast_encode时timestamps/values可直接传NumPy数组，没有arguments的采样按列向量化编码。
+        """
+        track_uuid = self.ensure_track(process_name, 'counter', track_name, pid=pid)
+        if self.fast_encode:
+            return self._encode_counter_series(track_uuid, event_name, category, timestamps, values, arguments)
+        seq_id = self.trusted_packet_sequence_id
+        counter_type = pftrace.TrackEvent.Type.TYPE_COUNTER
+        new_packet = pftrace.TracePacket
+        set_strings = self._set_event_strings
+        add_arguments = self._add_arguments
+        emit = self._emit
+        if arguments is None:
+            arguments = itertools.repeat(None)
+        count = 0
+        for ts, value, args in zip(timestamps, values, arguments):
+            packet = new_packet()
+            packet.timestamp = ts
+            packet.trusted_packet_sequence_id = seq_id
+            event = packet.track_event
+            event.type = counter_type
+            event.track_uuid = track_uuid
+            set_strings(packet, event_name, category)
+            event.double_counter_value = value
+            add_arguments(packet, args)
+            emit(packet)
+            count += 1
+        return count
+
+    def _encode_counter_series(self, track_uuid: int, event_name: str, category: str,
+                               timestamps, values, arguments) -> int:
+        """
+        fast_encode的counter序列：第一个采样单独编码（随之写出interned数据与首个sequence_flags），
+        此后各packet只有timestamp与值不同，整列交给 wire.counter_packets 向量化编码；
+        带arguments的采样逐点编码，按 ENCODE_BATCH_PACKETS 个packet一批写出。
+        """
+        counter_type = pftrace.TrackEvent.Type.TYPE_COUNTER
+        if arguments is not None:
+            encode = self._encode_event
+            return self._write_batched(encode(ts, track_uuid, counter_type, event_name, category, value, args)
+                                       for ts, value, args in zip(timestamps, values, arguments))
+        if not hasattr(timestamps, '__len__'):
+            timestamps = list(timestamps)
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        n = min(len(timestamps), len(values))
+        if n == 0:
+            return 0
+        self._write_bytes(self._encode_event(int(timestamps[0]), track_uuid, counter_type, event_name, category,
+                                             float(values[0])))
+        if n > 1:
+            prefix, suffix = self._event_templates[(counter_type, track_uuid, event_name, category)]
+            flags = self._sequence_flags() if self.intern_strings else None
+            data = wire.counter_packets(timestamps[1:n], values[1:n], self.trusted_packet_sequence_id,
+                                        prefix + suffix, flags)
+            self._write_bytes(data, count=n - 1)
+        return n
+
+    def _write_batched(self, packets: Iterable[bytes]) -> int:
+        """
+        fast_encode：已编码的packet每 ENCODE_BATCH_PACKETS 个拼接后写出一次，返回packet数。
+        """
+        batch = []
+        count = 0
+        for packet in packets:
+            batch.append(packet)
+            if len(batch) >= ENCODE_BATCH_PACKETS:
+                self._write_bytes(b''.join(batch), count=len(batch))
+                count += len(batch)
+                batch = []
+        if batch:
+            self._write_bytes(b''.join(batch), count=len(batch))
+            count += len(batch)
+        return count
+
+    def add_slice_batch(self, process_name: str, track_name: str,
+                        timestamps: Iterable[int], durations_ns: Iterable[int], names: Iterable[str], *,
+                        category: str = "default", pid: Optional[int] = None,
+                        arguments: Optional[Iterable[Optional[Dict[str, str]]]] = None) -> int:
+        """
+        批量写入同一slice track的一组slice：timestamps为UTC纳秒开始时间，
+        与durations_ns、names、arguments（可选）一一对应。返回写入的slice数。
+        """
+        track_uuid = self.ensure_track(process_name, 'slice', track_name, pid=pid)
+        if arguments is None:
+            arguments = itertools.repeat(None)
+        if self.fast_encode:
+            encode = self._encode_event
+            begin_type = pftrace.TrackEvent.Type.TYPE_SLICE_BEGIN
+            end_type = pftrace.TrackEvent.Type.TYPE_SLICE_END
+            return self._write_batched(
+                encode(ts, track_uuid, begin_type, name, category, arguments=args)
+                + encode(ts + dur, track_uuid, end_type, None, category)
+                for ts, dur, name, args in zip(timestamps, durations_ns, names, arguments)) 
+        seq_id = self.trusted_packet_sequence_id
+        begin_type = pftrace.TrackEvent.Type.TYPE_SLICE_BEGIN
+        end_type = pftrace.TrackEvent.Type.TYPE_SLICE_END
+        new_packet = pftrace.TracePacket
+        set_strings = self._set_event_strings
+        add_arguments = self._add_arguments
+        emit = self._emit
+        count = 0
+        for ts, dur, name, args in zip(timestamps, durations_ns, names, arguments):
+            start_packet = new_packet()
+            start_packet.timestamp = ts
+            start_packet.trusted_packet_sequence_id = seq_id
+            start_packet.track_event.type = begin_type
+            start_packet.track_event.track_uuid = track_uuid
+            set_strings(start_packet, name, category)
+            add_arguments(start_packet, args)
+            emit(start_packet)
+            end_packet = new_packet()
+            end_packet.timestamp = ts + dur
+            end_packet.trusted_packet_sequence_id = seq_id
+            end_packet.track_event.type = end_type
+            end_packet.track_event.track_uuid = track_uuid
+            set_strings(end_packet, None, category)
+            emit(end_packet)
+            count += 1
+        return count
+
+    def add_log_lines(self, log_lines: Iterable[str], process_name: str = "logcat", track_name: str = "logcat",
+                      category: str = "default", pid: Optional[int] = None, year: Optional[int] = None,
+                      batch_size: int = LOG_EVENTS_PER_PACKET) -> int:
+        """
+        批量写入logcat（threadtime格式，见 tracegen.logcat）：log_lines可为任意行迭代器（如 iter_logcat_file），
+        逐行流式解析，每batch_size条LogEvent打包为一个android_log packet。
+        时间戳按self.timezone转为UTC，与其它事件一致。无法解析的行跳过并汇总告警。返回写入的日志条数。
+        """
+        self.ensure_track(process_name, 'log', track_name, pid=pid)
+        offset_ms = self._parse_timezone_offset(self.timezone) * 1000
+        seq_id = self.trusted_packet_sequence_id
+        count = 0
+        errors = 0
+        packet = None
+        add = None
+        in_packet = 0
+        for parsed in parse_logcat_lines(log_lines, year=year):
+            if parsed is None:
+                errors += 1
+                continue
+            ts_ms, pid_val, tid, prio, tag, message = parsed
+            timestamp = (ts_ms - offset_ms) * 1_000_000
+            if packet is None:
                 packet = pftrace.TracePacket()
-                packet.timestamp = int((stamp + 3600 * 8) * 1e9)
-                packet.trusted_packet_sequence_id = self.trusted_packet_sequence_id
-                log_event = pftrace.AndroidLogPacket.LogEvent()
-                log_event.timestamp = int((stamp + 3600 * 8) * 1e9)
-                log_event.pid = pid_val
-                log_event.tid = tid
-                log_event.tag = tag
-                log_event.message = msg
-                # level 映射
-                if level == "V":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_VERBOSE
-                elif level == "D":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_DEBUG
-                elif level == "I":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_INFO
-                elif level == "W":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_WARN
-                elif level == "E":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_ERROR
-                elif level == "F":
-                    log_event.prio = pftrace.AndroidLogPriority.PRIO_FATAL
-                packet.android_log.events.append(log_event)
-                self.trace.packet.append(packet)
-            except Exception as e:
-                print(f"log parse error: {line}", e)
+                packet.timestamp = timestamp
+                packet.trusted_packet_sequence_id = seq_id
+                add = packet.android_log.events.add
+                in_packet = 0
+            # 逐字段赋值比 add(**kwargs) 快
+            event = add()
+            event.timestamp = timestamp
+            event.pid = pid_val
+            event.tid = tid
+            event.prio = prio
+            event.tag = tag
+            event.message = message
+            in_packet += 1
+            if in_packet >= batch_size:
+                count += in_packet
+                self._emit(packet)
+                packet = None
+        if packet is not None:
+            count += in_packet
+            self._emit(packet)
+        if errors:
+            print(f"[WARN] {errors} 行日志无法解析，已跳过")
+        return count
+
+    def add_log_event(self, process_name: str, track_name: str, log_lines: List[str], category: str = "default", pid: Optional[int] = None):
+        """
+        写入一组logcat行，见 add_log_lines。
+        """
+        return self.add_log_lines(log_lines, process_name=process_name, track_name=track_name, category=category, pid=pid)
+
+    def append_shard(self, path: str):
+        """
+        把其它manager（通常在工作进程中）写出的未压缩分片文件原样拼接到输出。
+        分片使用各自的trusted_packet_sequence_id与track uuid，interned数据按序列独立，拼接后互不影响。
+        """
+        self.flush_events()
+        if self.writer is not None:
+            self.writer.write_trace_file(path)
+        else:
+            with open(path, 'rb') as f:
+                self.trace.MergeFromString(f.read())
 
     def add_clock_snapshot(self, timestamp: int = None):
         if timestamp is None:
             timestamp = int((time.time() + 3600 * 8) * 1e9)
         clock_packet = add_clock_snapshot(timestamp, self.trusted_packet_sequence_id)
-        self.trace.packet.append(clock_packet)
+        if self.delta_timestamps:
+            # 序列默认时钟为增量时钟，绝对时间戳需显式指定时钟
+            clock_packet.timestamp_clock_id = pftrace.BuiltinClock.BUILTIN_CLOCK_BOOTTIME
+        self._emit(clock_packet)
 
-    def save_to_file(self, filename: str):
-        with open(filename, "wb") as f:
-            f.write(self.trace.SerializeToString())
+    def flush_events(self):
+        """
+        增量时间戳模式：将缓存的事件packet按时间排序，先写出一个清空增量状态的头packet
+        （注册增量时钟、设置TracePacketDefaults.timestamp_clock_id、携带全部interned数据），
+        再把每个packet的timestamp改写为与上一个packet的差值（单位delta_unit_ns）写出。
+        非增量模式下为空操作。
+        """
+        if not self._pending:
+            return
+        pending = sorted(self._pending, key=attrgetter('timestamp'))
+        self._pending = []
+        unit = self.delta_unit_ns
+        base_units = pending[0].timestamp // unit
+        header = pftrace.TracePacket()
+        header.timestamp = base_units * unit
+        header.timestamp_clock_id = pftrace.BuiltinClock.BUILTIN_CLOCK_BOOTTIME
+        header.trusted_packet_sequence_id = self.trusted_packet_sequence_id
+        header.sequence_flags = SEQ_INCREMENTAL_STATE_CLEARED
+        header.trace_packet_defaults.timestamp_clock_id = DELTA_CLOCK_ID
+        delta_clock = header.clock_snapshot.clocks.add()
+        delta_clock.clock_id = DELTA_CLOCK_ID
+        delta_clock.timestamp = base_units
+        delta_clock.is_incremental = True
+        if unit != 1:
+            delta_clock.unit_multiplier_ns = unit
+        boot_clock = header.clock_snapshot.clocks.add()
+        boot_clock.clock_id = pftrace.BuiltinClock.BUILTIN_CLOCK_BOOTTIME
+        boot_clock.timestamp = base_units * unit
+        # 增量状态已清空，重新声明全部interned数据，事件packet上的interned_data随之去掉
+        for field, table in self._interned.items():
+            entries = getattr(header.interned_data, field)
+            for value, iid in table.items():
+                entry = entries.add()
+                entry.iid = iid
+                entry.name = value
+        self._write(header)
+        prev_units = base_units
+        for packet in pending:
+            ts_units = packet.timestamp // unit
+            packet.timestamp = ts_units - prev_units
+            packet.sequence_flags = SEQ_NEEDS_INCREMENTAL_STATE
+            packet.ClearField('interned_data')
+            prev_units = ts_units
+            self._write(packet)
+
+    def save_to_file(self, filename: Optional[str] = None) -> PacketWriter:
+        """
+        内存模式：逐个packet序列化写出（不构建完整的序列化副本），按self.compress边写边压缩；resume_state时追加到filename末尾。
+        流式模式：packet已写入文件，这里只负责flush并关闭；filename与流式输出路径不同时移动过去。
+        返回已关闭的PacketWriter，可读取 bytes_written / file_bytes / compression_ratio。
+        """
+        self.flush_events()
+        if self.writer is not None:
+            self.writer.close()
+            if filename and os.path.abspath(filename) != os.path.abspath(self.writer.filename):
+                shutil.move(self.writer.filename, filename)
+                self.writer.filename = filename
+            return self.writer
+        with PacketWriter(filename, compress=self.compress, append=self.append) as writer:
+            for packet in self.trace.packet:
+                writer.write_packet(packet)
+        return writer
 
     def from_standard_format(self, data_list):
+        """
+        标准格式输入：data_list为标准事件的可迭代对象（列表或适配器生成器），元素可以是
+        tracegen.events.StandardEvent 记录或标准格式dict，逐条消费、逐条写入，不会整体物化。
+        连续的log事件（同一process/track）攒批后由 add_log_lines 打包写出。
+        事件按 self.validation 模式做schema校验（见 tracegen.validation），不通过的跳过，结束时汇总输出一行。
+        返回通过校验并写入的事件数。
+        """
+        validator = EventValidator(self.validation)
+        check_for = validator.check_for if validator.mode != 'off' else None
+        count = 0
+        log_key = None
+        log_lines = []
         for idx, item in enumerate(data_list):
-            # 标准化校验
-            etype = item.get("event_type")
-            pname = item.get("process_name")
-            tname = item.get("track_name")
-            ename = item.get("event_name")
-            ts = item.get("timestamp")
-            # 必填字段校验
-            if etype not in ("counter", "slice", "instant", "log"):
-                print(f"[WARN] idx={idx} event_type非法: {etype}, 跳过该条")
-                continue
-            if not pname or not isinstance(pname, str):
-                print(f"[WARN] idx={idx} process_name非法: {pname}, 跳过该条")
-                continue
-            if not tname or not isinstance(tname, str):
-                print(f"[WARN] idx={idx} track_name非法: {tname}, 跳过该条")
+            if type(item) is StandardEvent:
+                etype = item.event_type
+                pname = item.process_name
+                tname = item.track_name
+                ename = item.event_name
+                ts = item.timestamp
+                category = item.category
+                pid = item.pid
+                value = item.value
+                duration_ns = item.duration_ns
+                message = item.message
+                arguments = item.arguments
+            else:
+                etype = item.get("event_type")
+                pname = item.get("process_name")
+                tname = item.get("track_name")
+                ename = item.get("event_name")
+                ts = item.get("timestamp")
+                category = item.get("category", "default")
+                pid = item.get("pid")
+                value = item.get("value", 0)
+                duration_ns = item.get("duration_ns", 0)
+                message = item.get("message", "")
+                arguments = item.get("arguments", None)
+            # schema校验（编译自 configs/standard_trace_schema.json），不通过的按原因计数、跳过
+            check = check_for(idx) if check_for is not None else None
+            if check is not None:
+                reason = check(etype, pname, tname, ename, ts, value, duration_ns, category, pid, message, arguments)
+                if reason is not None:
+                    validator.reject(reason)
+                    continue
+            count += 1
+            if etype == "log":
+                key = (pname, tname, category, pid)
+                if key != log_key or len(log_lines) >= LOG_EVENTS_PER_PACKET:
+                    if log_key is not None:
+                        self.add_log_lines(log_lines, *log_key)
+                    log_key = key
+                    log_lines = []
+                if message:
+                    log_lines.append(str(message))
                 continue
-            if ts is None or not isinstance(ts, (int, float)):
-                print(f"[WARN] idx={idx} timestamp非法: {ts}, 跳过该条")
-                continue
-            # 其它字段类型校验
-            category = item.get("category", "default")
-            pid = item.get("pid")
-            value = item.get("value", 0)
-            duration_ns = item.get("duration_ns", 0)
-            message = item.get("message", "")
-            arguments = item.get("arguments", None)
+            if log_key is not None:
+                self.add_log_lines(log_lines, *log_key)
+                log_key = None
+                log_lines = []
             # 统一时区处理
             timestamp_utc_ms = self._to_utc_ms(ts)
             timestamp_ns = int(float(timestamp_utc_ms) * 1_000_000)
@@ -220,7 +737,7 @@ class PerfettoTraceManager:
                 try:
                     value_f = float(value)
                 except Exception:
-                    print(f"[WARN] idx={idx} value非法: {value}, 置为0")
+                    validator.coerce('value非法，置为0')
                     value_f = 0
                 self.add_counter_event(
                     process_name=pname,
@@ -235,7 +752,7 @@ class PerfettoTraceManager:
                 try:
                     duration_ns_f = int(duration_ns)
                 except Exception:
-                    print(f"[WARN] idx={idx} duration_ns非法: {duration_ns}, 置为0")
+                    validator.coerce('duration_ns非法，置为0')
                     duration_ns_f = 0
                 self.add_slice_event(
                     process_name=pname,
@@ -257,29 +774,49 @@ class PerfettoTraceManager:
                     pid=pid,
                     arguments=arguments
                 )
-            elif etype == "log":
-                msg = str(message) if message is not None else ""
-                self.add_log_event(
-                    process_name=pname,
-                    track_name=tname,
-                    log_lines=[msg] if msg else [],
-                    category=category,
-                    pid=pid
-                )
             # 可扩展更多类型
+        if log_key is not None:
+            self.add_log_lines(log_lines, *log_key)
+        validator.summary()
+        return count
+
+    def from_columnar(self, batches):
+        """
+        列式输入：batches为适配层输出的 CounterBatch/SliceBatch 列表（见 tracegen.adapters.columnar），
+        时间戳为本地时区毫秒，按批统一转换为UTC纳秒。
+        返回写入的事件数。
+        """
+        offset_ms = self._parse_timezone_offset(self.timezone) * 1000
+        count = 0
+        for batch in batches:
+            timestamps_ns = (batch.timestamps - offset_ms) * 1_000_000
+            if batch.event_type == 'counter':
+                # fast_encode按列编码，直接传数组；protobuf路径逐点赋值，转为Python数值更快
+                values = batch.values
+                if not self.fast_encode or batch.arguments is not None:
+                    timestamps_ns, values = timestamps_ns.tolist(), values.tolist()
+                count += self.add_counter_series(batch.process_name, batch.track_name, batch.event_name,
+                                                 timestamps_ns, values,
+                                                 category=batch.category, pid=batch.pid, arguments=batch.arguments)
+            elif batch.event_type == 'slice':
+                count += self.add_slice_batch(batch.process_name, batch.track_name,
+                                              timestamps_ns.tolist(), batch.durations_ns.tolist(), batch.names,
+                                              category=batch.category, pid=batch.pid, arguments=batch.arguments)
+        return count
 
-def create_process_track(pid: int, process_name: str) -> Tuple[pftrace.TracePacket, int]:
+def create_process_track(pid: int, process_name: str, track_uuid: Optional[int] = None) -> Tuple[pftrace.TracePacket, int]:
     process_track = pftrace.TracePacket()
-    process_track_uuid = uuid64()
+    process_track_uuid = track_uuid if track_uuid is not None else uuid64()
     process_track.track_descriptor.uuid = process_track_uuid
     process_track.track_descriptor.process.process_name = process_name
     if pid is not None and pid != 0:
         process_track.track_descriptor.process.pid = pid
     return process_track, process_track_uuid
 
-def create_track(parent_uuid: int, track_name: str, track_type: str) -> Tuple[pftrace.TracePacket, int]:
+def create_track(parent_uuid: int, track_name: str, track_type: str,
+                 track_uuid: Optional[int] = None) -> Tuple[pftrace.TracePacket, int]:
     track = pftrace.TracePacket()
-    track_uuid = uuid64()
+    track_uuid = track_uuid if track_uuid is not None else uuid64()
     track.track_descriptor.uuid = track_uuid
     track.track_descriptor.parent_uuid = parent_uuid
     track.track_descriptor.name = track_name
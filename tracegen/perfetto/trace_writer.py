@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import gzip
+import logging
+import os
+
+try:
+    import zstandard
+except ImportError:  # zstd为可选依赖
+    zstandard = None
+
+# Trace.packet 字段: field_number=1, wire_type=2(length-delimited) -> (1 << 3) | 2
+TRACE_PACKET_TAG = b'\x0a'
+
+# 压缩格式 -> 输出文件后缀
+COMPRESSION_SUFFIX = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+def resolve_compression(compress):
+    """
+    规范化压缩参数：'none'/None -> None；zstd不可用时回退为gzip。
+    """
+    if compress in (None, '', 'none'):
+        return None
+    if compress not in COMPRESSION_SUFFIX:
+        raise ValueError(f"Unknown compression: {compress}")
+    if compress == 'zstd' and zstandard is None:
+        logging.warning("未安装zstandard，压缩格式回退为gzip（pip install zstandard 可启用zstd）")
+        return 'gzip'
+    return compress
+
+def encode_varint(value: int) -> bytes:
+    """
+    将非负整数编码为protobuf varint。
+    """
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+class PacketWriter:
+    """
+    流式写出TracePacket：每个packet立即以 Trace.packet 字段（tag=1 + varint长度 + 字节）
+    追加写入文件，内存只占用一个写缓冲区。
+    多个 Trace.packet 字段顺序拼接即为合法的 Trace 消息，
+    与 Trace.SerializeToString() 的结果字节级一致，Perfetto UI 可直接打开。
+    compress为'gzip'/'zstd'时边写边压缩（Perfetto UI可直接打开gzip trace）。
+    append=True时追加到已有的trace文件末尾（压缩时新起一个gzip member/zstd frame，拼接后仍可整体解压）。
+    """
+    def __init__(self, filename: str, buffer_size: int = 1 << 20, compress=None, append: bool = False):
+        self.filename = filename
+        self.compress = resolve_compression(compress)
+        self.initial_bytes = os.path.getsize(filename) if append and os.path.exists(filename) else 0
+        self._raw = open(filename, 'ab' if append else 'wb', buffering=buffer_size)
+        if self.compress == 'gzip':
+            # gzip头的mtime固定为0，同样的trace内容得到字节一致的压缩文件
+            self._fp = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6, mtime=0)
+        elif self.compress == 'zstd':
+            self._fp = zstandard.ZstdCompressor(level=3).stream_writer(self._raw, closefd=False)
+        else:
+            self._fp = self._raw
+        self.packet_count = 0
+        self.bytes_written = 0  # 本次写入的未压缩trace字节数
+        self.file_bytes = 0  # 磁盘上的文件大小（追加时包含原有内容），close后有效
+
+    def write_packet(self, packet):
+        self.write_serialized(packet.SerializeToString())
+
+    def write_serialized(self, data: bytes):
+        """
+        写入一个已序列化的TracePacket（不含Trace.packet字段头）。
+        """
+        header = TRACE_PACKET_TAG + encode_varint(len(data))
+        self._fp.write(header)
+        self._fp.write(data)
+        self.packet_count += 1
+        self.bytes_written += len(header) + len(data)
+
+    def write_framed(self, data: bytes, count: int):
+        """
+        写入count个已加 Trace.packet 字段头、首尾相接的packet（如 wire.counter_packets 的结果）。
+        """
+        self._fp.write(data)
+        self.packet_count += count
+        self.bytes_written += len(data)
+
+    def write_trace_file(self, path: str, chunk_size: int = 1 << 20):
+        """
+        追加一个未压缩的Trace文件（如其它进程写出的分片）：字节原样拼接，
+        仍是合法的Trace消息。packet_count不包含其中的packet。
+        """
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                self._fp.write(chunk)
+                self.bytes_written += len(chunk)
+
+    def close(self):
+        if self._raw.closed:
+            return
+        if self._fp is not self._raw:
+            self._fp.close()
+        self._raw.close()
+        self.file_bytes = os.path.getsize(self.filename)
+
+    @property
+    def closed(self) -> bool:
+        return self._raw.closed
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        压缩比（本次写入的未压缩字节数 / 本次写入磁盘的字节数），close后有效。
+        """
+        written = self.file_bytes - self.initial_bytes
+        return self.bytes_written / written if written > 0 else 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+import struct
+from functools import lru_cache
+
+# protobuf wire format 的手写编码：只覆盖 PerfettoTraceManager 输出的几种packet
+# （track_descriptor、counter、slice begin/end、instant），直接拼接字节，不构建 TracePacket 对象。
+# 字段按字段号升序写出，与 protobuf 序列化结果字节级一致（见 benchmarks/bench_wire.py 的校验）。
+# 字段号见 perfetto_trace.proto。
+
+_MASK64 = (1 << 64) - 1
+_SMALL_VARINTS = [bytes((i,)) for i in range(0x80)]
+_pack_double = struct.Struct('<d').pack
+
+def varint(value: int) -> bytes:
+    """
+    无符号整数 -> varint；超出uint64范围时抛出ValueError（与protobuf一致）。
+    """
+    if 0 <= value < 0x80:
+        return _SMALL_VARINTS[value]
+    if 0 < value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    if value < 0 or value > _MASK64:
+        raise ValueError(f"Value out of range: {value}")
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+# track uuid、sequence id、时间戳高位等反复出现的大整数，varint按值缓存
+cached_varint = lru_cache(maxsize=65536)(varint)
+
+def timestamp_varint(timestamp: int) -> bytes:
+    """
+    纳秒时间戳的varint：低28位（前4个字节）每次计算，其余高位按值缓存（约每0.27秒变化一次）。
+    """
+    if not 0x10000000 <= timestamp <= _MASK64:
+        return varint(timestamp)
+    low = timestamp & 0xFFFFFFF
+    return bytes(((low & 0x7F) | 0x80, ((low >> 7) & 0x7F) | 0x80, ((low >> 14) & 0x7F) | 0x80,
+                  (low >> 21) | 0x80)) + cached_varint(timestamp >> 28)
+
+def int32_varint(value: int) -> bytes:
+    """
+    int32字段：负数按64位补码编码为10字节varint（与protobuf一致）。
+    """
+    if value < -(1 << 31) or value >= (1 << 31):
+        raise ValueError(f"Value out of range: {value}")
+    return varint(value & _MASK64)
+
+@lru_cache(maxsize=None)
+def tag(field: int, wire_type: int) -> bytes:
+    return varint((field << 3) | wire_type)
+
+def length_delimited(field: int, payload: bytes) -> bytes:
+    return tag(field, 2) + varint(len(payload)) + payload
+
+def string_field(field: int, value: str) -> bytes:
+    return length_delimited(field, value.encode('utf-8'))
+
+# wire type: 0 varint, 1 fixed64, 2 length-delimited
+# TracePacket
+PACKET_TIMESTAMP = tag(8, 0)
+PACKET_SEQUENCE_ID = tag(10, 0)
+PACKET_TRACK_EVENT = 11
+PACKET_INTERNED_DATA = 12
+PACKET_SEQUENCE_FLAGS = tag(13, 0)
+PACKET_TRACK_DESCRIPTOR = 60
+# TrackEvent
+EVENT_CATEGORY_IIDS = tag(3, 0)
+EVENT_DEBUG_ANNOTATIONS = 4
+EVENT_TYPE = tag(9, 0)
+EVENT_NAME_IID = tag(10, 0)
+EVENT_TRACK_UUID = tag(11, 0)
+EVENT_CATEGORIES = 22
+EVENT_NAME = 23
+EVENT_DOUBLE_COUNTER_VALUE = tag(44, 1)
+# InternedData 中各表的字段号（条目均为 iid=1、name=2）
+INTERNED_FIELDS = {
+    'event_categories': 1,
+    'event_names': 2,
+    'debug_annotation_names': 3,
+}
+_TRACK_EVENT_TAG = tag(PACKET_TRACK_EVENT, 2)
+# Trace.packet 字段头（与 trace_writer.TRACE_PACKET_TAG 相同）
+TRACE_PACKET_TAG = tag(1, 2)
+# counter_packets 按列向量化编码的最少采样数
+VECTORIZE_MIN_POINTS = 64
+
+def interned_data(entries) -> bytes:
+    """
+    entries: [(表名, iid, name), ...]，按字段号排序后编码为 InternedData 消息体（同一表内保持原顺序）。
+    """
+    parts = []
+    for field, iid, name in sorted(entries, key=lambda e: INTERNED_FIELDS[e[0]]):
+        parts.append(length_delimited(INTERNED_FIELDS[field], b'\x08' + varint(iid) + string_field(2, name)))
+    return b''.join(parts)
+
+def annotation_name_parts(name_iid=None, name=None):
+    """
+    DebugAnnotation 中参数名的编码：name_iid(1) 在 string_value(6) 之前，name(10) 在其后，
+    返回 (head, tail)，同一参数名可复用。
+    """
+    head = b'\x08' + varint(name_iid) if name_iid is not None else b''
+    tail = string_field(10, name) if name is not None else b''
+    return head, tail
+
+def encoded_annotation(head: bytes, string_value: str, tail: bytes) -> bytes:
+    """
+    TrackEvent.debug_annotations 的一项（含字段头），head/tail 为 annotation_name_parts 的结果。
+    """
+    value = string_value.encode('utf-8')
+    body = head + b'\x32' + varint(len(value)) + value + tail
+    return b'\x22' + varint(len(body)) + body
+
+def event_body_parts(event_type: int, track_uuid: int, name=None, name_iid=None, category=None, category_iid=None):
+    """
+    TrackEvent 中 debug_annotations(4) 前后的固定字段，返回 (prefix, suffix)：
+    prefix 为 category_iids(3)，suffix 为 type(9)/name_iid(10)/track_uuid(11)/categories(22)/name(23)。
+    同一track、事件名与category的事件可复用。
+    """
+    prefix = EVENT_CATEGORY_IIDS + varint(category_iid) if category_iid is not None else b''
+    suffix = EVENT_TYPE + varint(event_type)
+    if name_iid is not None:
+        suffix += EVENT_NAME_IID + varint(name_iid)
+    suffix += EVENT_TRACK_UUID + cached_varint(track_uuid)
+    if category is not None:
+        suffix += string_field(EVENT_CATEGORIES, category)
+    if name is not None:
+        suffix += string_field(EVENT_NAME, name)
+    return prefix, suffix
+
+def track_event_packet(timestamp: int, sequence_id: int, event_body: bytes, counter_value=None,
+                       interned: bytes = b'', sequence_flags=None) -> bytes:
+    """
+    带track_event的TracePacket（不含Trace.packet字段头）。
+    event_body: TrackEvent消息体（event_body_parts 的 prefix + debug_annotations + suffix）；counter_value 不为None时追加 double_counter_value。
+    """
+    if counter_value is not None:
+        event_body += EVENT_DOUBLE_COUNTER_VALUE + _pack_double(counter_value)
+    packet = (PACKET_TIMESTAMP + timestamp_varint(timestamp) + PACKET_SEQUENCE_ID + cached_varint(sequence_id)
+              + _TRACK_EVENT_TAG + varint(len(event_body)) + event_body)
+    if interned:
+        packet += length_delimited(PACKET_INTERNED_DATA, interned)
+    if sequence_flags is not None:
+        packet += PACKET_SEQUENCE_FLAGS + varint(sequence_flags)
+    return packet
+
+def track_descriptor_packet(uuid: int, name=None, parent_uuid=None, process_name=None, pid=None,
+                            counter_unit=None) -> bytes:
+    """
+    只含track_descriptor的TracePacket：uuid(1) name(2) process(3){pid(1) process_name(6)} parent_uuid(5) counter(8){unit(3)}。
+    """
+    body = b'\x08' + varint(uuid)
+    if name is not None:
+        body += string_field(2, name)
+    if process_name is not None or pid is not None:
+        process = b''
+        if pid is not None:
+            process += b'\x08' + int32_varint(pid)
+        if process_name is not None:
+            process += string_field(6, process_name)
+        body += length_delimited(3, process)
+    if parent_uuid is not None:
+        body += b'\x28' + varint(parent_uuid)
+    if counter_unit is not None:
+        body += length_delimited(8, b'\x18' + varint(counter_unit))
+    return length_delimited(PACKET_TRACK_DESCRIPTOR, body)
+
+def frame(packet: bytes) -> bytes:
+    """
+    加上 Trace.packet 字段头，可直接追加到trace文件。
+    """
+    return TRACE_PACKET_TAG + varint(len(packet)) + packet
+
+def counter_packets(timestamps, values, sequence_id: int, event_body: bytes, sequence_flags=None) -> bytes:
+    """
+    同一counter track、同一组事件字符串（已intern或不intern）的一列采样，编码为首尾相接的已加字段头的packet。
+    每个packet只有timestamp与counter值不同：其余字节预先编码为模板，
+    timestamp的varint按列用NumPy计算，整列拼成一个uint8矩阵后一次性转为bytes。
+    timestamps: 非负整数（UTC纳秒），values: 浮点数，均为可转为NumPy数组的一维序列。
+    少于 VECTORIZE_MIN_POINTS 个采样时NumPy的固定开销反而更大，逐点拼接。
+    """
+    n = len(timestamps)
+    if n == 0:
+        return b''
+    # timestamp之后、counter值之前的固定字节；track_event的长度包含定长的 tag(44) + 8字节counter值
+    event_len = len(event_body) + len(EVENT_DOUBLE_COUNTER_VALUE) + 8
+    middle = (PACKET_SEQUENCE_ID + varint(sequence_id) + _TRACK_EVENT_TAG + varint(event_len)
+              + event_body + EVENT_DOUBLE_COUNTER_VALUE)
+    tail = PACKET_SEQUENCE_FLAGS + varint(sequence_flags) if sequence_flags is not None else b''
+    if n < VECTORIZE_MIN_POINTS:
+        fixed_len = len(PACKET_TIMESTAMP) + len(middle) + 8 + len(tail)
+        parts = []
+        for ts, value in zip(timestamps, values):
+            ts_bytes = timestamp_varint(int(ts))
+            parts.append(TRACE_PACKET_TAG + varint(fixed_len + len(ts_bytes)) + PACKET_TIMESTAMP + ts_bytes
+                         + middle + _pack_double(value) + tail)
+        return b''.join(parts)
+    import numpy as np
+    ts = np.asarray(timestamps)
+    if ts.dtype.kind not in 'iu':
+        ts = ts.astype(np.int64)
+    if ts.dtype.kind == 'i' and int(ts.min()) < 0:
+        raise ValueError(f"Value out of range: {int(ts.min())}")
+    ts = ts.astype(np.uint64)
+    # 各采样timestamp的varint字节数（1~10）
+    nbytes = np.ones(n, dtype=np.int64)
+    for i in range(1, 10):
+        nbytes += ts >= np.uint64(1 << (7 * i))
+    value_bytes = np.asarray(values, dtype='<f8').view(np.uint8).reshape(n, 8)
+    out = []
+    # 时间戳varint长度相同的连续采样为一段，每段整体向量化编码（通常整列只有一段）
+    breaks = np.flatnonzero(np.diff(nbytes)) + 1
+    for lo, hi in zip(np.r_[0, breaks], np.r_[breaks, n]):
+        width = int(nbytes[lo])
+        packet_len = len(PACKET_TIMESTAMP) + width + len(middle) + 8 + len(tail)
+        head = TRACE_PACKET_TAG + varint(packet_len) + PACKET_TIMESTAMP
+        rows = np.empty((hi - lo, len(head) + width + len(middle) + 8 + len(tail)), dtype=np.uint8)
+        rows[:, :len(head)] = np.frombuffer(head, dtype=np.uint8)
+        col = len(head)
+        seg = ts[lo:hi]
+        for i in range(width):
+            byte = (seg >> np.uint64(7 * i)) & np.uint64(0x7F)
+            if i < width - 1:
+                byte |= np.uint64(0x80)
+            rows[:, col + i] = byte
+        col += width
+        rows[:, col:col + len(middle)] = np.frombuffer(middle, dtype=np.uint8)
+        col += len(middle)
+        rows[:, col:col + 8] = value_bytes[lo:hi]
+        col += 8
+        if tail:
+            rows[:, col:] = np.frombuffer(tail, dtype=np.uint8)
+        out.append(rows.tobytes())
+    return b''.join(out)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import json
+import numbers
+import os
+
+from tracegen.events import StandardEvent
+
+# 输出trace旁的索引文件：<trace文件名>.idx.json
+INDEX_SUFFIX = '.idx.json'
+# 索引格式版本：字段含义变化时递增，旧索引不再用于追加
+INDEX_VERSION = 1
+
+def index_path(trace_path):
+    return f"{trace_path}{INDEX_SUFFIX}"
+
+def load_trace_index(trace_path):
+    """
+    读取trace的索引，返回dict：
+    vin / start_time / end_time（已写入的时间窗口，两端包含）/ types / options（输出格式选项）/
+    file_bytes（写完时的文件大小）/ state（PerfettoTraceManager.export_state 的结果）/ watermarks（见 TrackWatermarks）。
+    索引不存在时抛出FileNotFoundError，版本不符或字段缺失时抛出ValueError。
+    """
+    path = index_path(trace_path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"未找到trace索引 {path}，只能追加到带索引的trace（生成时未关闭 --index）")
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"trace索引版本不符: {index.get('version')}（当前 {INDEX_VERSION}）: {path}")
+    missing = [key for key in ('vin', 'start_time', 'end_time', 'types', 'options', 'file_bytes', 'state', 'watermarks')
+               if key not in index]
+    if missing:
+        raise ValueError(f"trace索引缺少字段 {', '.join(missing)}: {path}")
+    return index
+
+def save_trace_index(trace_path, index):
+    """
+    写出trace的索引（临时文件 + 原子rename），version字段自动填入。
+    """
+    path = index_path(trace_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(index, version=INDEX_VERSION), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return path
+
+def move_trace(src, dst):
+    """
+    重命名trace及其索引（索引不存在时只移动trace）。
+    """
+    os.replace(src, dst)
+    if os.path.isfile(index_path(src)):
+        os.replace(index_path(src), index_path(dst))
+
+def event_end(timestamp, duration_ns=0):
+    """
+    事件的结束时间：标准格式timestamp（本地毫秒，可为小数，按微秒取整）换算为纳秒后加上duration_ns。
+    """
+    return round(timestamp * 1000) * 1000 + int(duration_ns or 0)
+
+class TrackWatermarks:
+    """
+    每条track (process_name, event_type, track_name) 已写入事件的最大结束时间（event_end），随索引保存。
+    追加时适配器从上次结束时间之前若干分钟开始转换（恢复依赖前一行的状态），转换出的事件经过 events()/batches()：
+    结束时间不晚于上次水位的事件已写入trace，去掉；其余的写入并推进水位。
+    按track而不是按时间窗口边界判断：各类型事件时间相对原始行时间的偏移不同（如cpu_short的采样时间比collect_time早30s），
+    边界附近的事件属于哪一次由它所在的原始行决定。上次没有出现的track不过滤。
+    """
+    def __init__(self, marks=None):
+        # cutoffs 为上次的水位（只读），marks 随本次写入的事件推进
+        self.cutoffs = {(process_name, event_type, track_name): end
+                        for process_name, event_type, track_name, end in marks or ()}
+        self.marks = dict(self.cutoffs)
+
+    def to_list(self):
+        return [[*key, end] for key, end in self.marks.items()]
+
+    def events(self, events):
+        """
+        过滤并记录标准格式事件（StandardEvent 或 dict），timestamp不是数值的事件原样透传，交给schema校验处理。
+        """
+        cutoffs = self.cutoffs
+        marks = self.marks
+        for event in events:
+            if type(event) is StandardEvent:
+                ts, duration_ns = event.timestamp, event.duration_ns
+                key = (event.process_name, event.event_type, event.track_name)
+            else:
+                ts, duration_ns = event.get('timestamp'), event.get('duration_ns', 0)
+                key = (event.get('process_name'), event.get('event_type'), event.get('track_name'))
+            if not isinstance(ts, numbers.Real):
+                yield event
+                continue
+            try:
+                end = event_end(ts, duration_ns)
+            except (TypeError, ValueError):
+                yield event
+                continue
+            cutoff = cutoffs.get(key)
+            if cutoff is not None and end <= cutoff:
+                continue
+            mark = marks.get(key)
+            if mark is None or end > mark:
+                marks[key] = end
+            yield event
+
+    def batches(self, batches):
+        """
+        过滤并记录列式批次（CounterBatch/SliceBatch），返回新的批次列表。
+        """
+        from tracegen.adapters.columnar import select
+        result = []
+        for batch in batches:
+            if not len(batch):
+                result.append(batch)
+                continue
+            end = batch.timestamps * 1_000_000
+            if batch.event_type == 'slice':
+                end = end + batch.durations_ns
+            key = (batch.process_name, batch.event_type, batch.track_name)
+            cutoff = self.cutoffs.get(key)
+            if cutoff is not None:
+                keep = end > cutoff
+                if not keep.any():
+                    continue
+                batch = select(batch, keep)
+                end = end[keep]
+            last = int(end.max())
+            if last > self.marks.get(key, last - 1):
+                self.marks[key] = last
+            result.append(batch)
+        return result
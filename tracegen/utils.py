@@ -1,10 +1,16 @@
 import re
 import datetime
+from functools import lru_cache
 
+# 支持的时间字符串格式（本地时区）
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S")
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+@lru_cache(maxsize=256)
 def parse_offset_str(offset_str):
     """
     解析 '+08h00m00s'、'-30s'、'+1h30m' 等字符串为秒数（int）。
-    支持正负号，支持 h/m/s 任意组合。
+    支持正负号，支持 h/m/s 任意组合。结果按字符串缓存（适配器每个事件都会调用）。
     """
     if not offset_str:
         return 0
@@ -25,6 +31,36 @@ def parse_offset_str(offset_str):
             total_sec += int(part)
     return sign * total_sec
 
+def _is_fixed_width(val):
+    """
+    是否为定宽的 'YYYY-MM-DD HH:MM:SS[.ffffff]' 格式（只检查分隔符位置）。
+    """
+    return (len(val) >= 19 and val[4] == '-' and val[7] == '-' and val[10] == ' '
+            and val[13] == ':' and val[16] == ':' and (len(val) == 19 or val[19] == '.'))
+
+@lru_cache(maxsize=65536)
+def parse_datetime_to_seconds(val):
+    """
+    将本地时区时间字符串（DATETIME_FORMATS）解析为秒级时间戳（float，同 datetime.timestamp()），无法解析时返回None。
+    定宽格式直接按位置切片取各字段，其它写法回退到strptime；结果按字符串缓存（同一collect_time往往对应多行/多个字段）。
+    """
+    if _is_fixed_width(val):
+        digits = val[0:4] + val[5:7] + val[8:10] + val[11:13] + val[14:16] + val[17:19]
+        frac = val[20:]
+        if digits.isascii() and digits.isdigit() and (len(val) == 19 or (0 < len(frac) <= 6 and frac.isascii() and frac.isdigit())):
+            try:
+                dt = datetime.datetime(int(val[0:4]), int(val[5:7]), int(val[8:10]), int(val[11:13]),
+                                       int(val[14:16]), int(val[17:19]), int(frac.ljust(6, '0')) if frac else 0)
+            except ValueError:
+                return None
+            return dt.timestamp()
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(val, fmt).timestamp()
+        except Exception:
+            continue
+    return None
+
 def parse_datetime_to_ms(val):
     """
     支持字符串格式如 '2025-02-06 21:40:14'，返回毫秒时间戳。
@@ -32,10 +68,48 @@ def parse_datetime_to_ms(val):
     if isinstance(val, (int, float)):
         return int(val)
     if isinstance(val, str):
-        for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
+        stamp = parse_datetime_to_seconds(val)
+        if stamp is not None:
+            return int(stamp * 1000)
+    return 0
+
+def _local_offset(naive_seconds):
+    """
+    本地时区在某一时刻的UTC偏移（秒）：naive时间按UTC换算的秒数 - 本地时间戳。
+    """
+    dt = _EPOCH + datetime.timedelta(seconds=int(naive_seconds))
+    return naive_seconds - dt.timestamp()
+
+def parse_datetime_column(values):
+    """
+    批量解析一列时间，返回np.int64毫秒时间戳数组，结果与逐个调用parse_datetime_to_ms完全一致。
+    根据第一个值判断格式：整列为同一定宽格式的字符串时，用NumPy datetime64一次性解析，
+    窗口内本地时区偏移不变时（没有夏令时切换）整列减去同一个偏移；
+    否则逐个解析（带缓存）。
+    """
+    import numpy as np  # 只有列式路径用到，按需导入
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    first = values[0]
+    if isinstance(first, str) and _is_fixed_width(first) and parse_datetime_to_seconds(first) is not None:
+        arr = np.asarray(values)
+        if arr.dtype.kind == 'U' and bool(np.all(np.char.str_len(arr) == len(first))):
             try:
-                dt = datetime.datetime.strptime(val, fmt)
-                return int(dt.timestamp() * 1000)
-            except Exception:
-                continue
-    return 0 
\ No newline at end of file
+                parsed = arr.astype('datetime64[us]')
+            except ValueError:
+                parsed = None
+            if parsed is not None and not np.isnat(parsed).any():
+                whole = parsed.astype('datetime64[s]')
+                seconds = whole.astype(np.int64)
+                micros = (parsed - whole).astype(np.int64)
+                lo, hi = int(seconds.min()), int(seconds.max())
+                # 每12小时取样一次，确认窗口内没有时区偏移变化
+                offsets = {_local_offset(t) for t in range(lo, hi, 12 * 3600)}
+                offsets.add(_local_offset(hi))
+                if len(offsets) == 1:
+                    offset = offsets.pop()
+                    # 与 datetime.timestamp() 相同的浮点运算：整数秒 + 微秒/1e6，再乘1000截断
+                    stamps = (seconds - int(offset)).astype(np.float64) + micros / 1e6
+                    return (stamps * 1000).astype(np.int64)
+    return np.fromiter((parse_datetime_to_ms(v) for v in values), dtype=np.int64, count=n)
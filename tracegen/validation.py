@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import json
+import numbers
+import os
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from functools import lru_cache
+
+from tracegen.events import EVENT_FIELDS
+
+VALIDATION_MODES = ('off', 'sample', 'strict')
+# sample模式下每隔多少条事件做一次完整的schema校验
+DEFAULT_SAMPLE_EVERY = 100
+SCHEMA_NAME = 'standard_trace_schema.json'
+
+# JSON schema类型 -> 生成的判断表达式（{v}为字段变量名）；先比较type()走快路径，再用isinstance兼容numpy标量等子类型。
+# 与JSON schema一致，bool（int的子类）不算number/integer
+_TYPE_EXPRS = {
+    'string': "type({v}) is str or isinstance({v}, str)",
+    'number': "type({v}) is float or type({v}) is int or (isinstance({v}, _Real) and not isinstance({v}, bool))",
+    'integer': "type({v}) is int or (isinstance({v}, _Integral) and not isinstance({v}, bool))",
+    'object': "type({v}) is dict or isinstance({v}, _Mapping)",
+    'array': "type({v}) is list or type({v}) is tuple",
+    'boolean': "type({v}) is bool",
+    'null': "{v} is None",
+}
+
+def find_schema_path():
+    """
+    查找标准格式schema：源码树/安装包内的 configs/（setup.py 随包安装），其次 <prefix>/share/tracegen/。
+    """
+    candidates = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'configs', SCHEMA_NAME),
+        os.path.join(sys.prefix, 'share', 'tracegen', SCHEMA_NAME),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    raise FileNotFoundError(f"未找到标准格式schema {SCHEMA_NAME}，已查找: {', '.join(candidates)}")
+
+def _field_check(field, spec, required):
+    """
+    单个字段的校验代码行：不通过时返回原因字符串。
+    必填字段为None或空字符串时记为「缺失」（与原先手写校验一致，空的process_name/track_name同样跳过）。
+    """
+    lines = []
+    if required:
+        lines.append(f"    if {field} is None or {field} == '': return '{field}缺失'")
+    types = spec.get('type')
+    if types:
+        types = [types] if isinstance(types, str) else list(types)
+        exprs = [_TYPE_EXPRS[t].format(v=field) for t in types if t in _TYPE_EXPRS and t != 'null']
+        if not required or 'null' in types:
+            exprs.insert(0, f"{field} is None")
+        if exprs:
+            lines.append(f"    if not ({' or '.join(exprs)}): return '{field}类型非法'")
+    if 'enum' in spec:
+        lines.append(f"    if {field} not in _enum_{field}" + (f" and {field} is not None" if not required else "")
+                     + f": return '{field}取值非法'")
+    return lines
+
+def compile_schema(schema, fields=None):
+    """
+    把标准格式schema（items部分）编译为专用的校验函数 check(event_type, process_name, ..., arguments)，
+    参数按 EVENT_FIELDS 顺序，全部通过时返回None，否则返回第一个不通过的原因（如 'timestamp类型非法'）。
+    fields: 只校验这些字段（默认全部），如只校验生成packet必需的字段。
+    schema中有、StandardEvent中没有的字段（thread_name/tid 等）不参与校验；必填字段先于其它字段检查。
+    返回 (函数, 生成的源码)。
+    """
+    items = schema.get('items', schema)
+    properties = items.get('properties', {})
+    required = [f for f in items.get('required', ()) if f in EVENT_FIELDS]
+    checked = [f for f in EVENT_FIELDS if f in properties and (fields is None or f in fields)]
+    namespace = {'_Real': numbers.Real, '_Integral': numbers.Integral, '_Mapping': Mapping}
+    body = []
+    for field in sorted(checked, key=lambda f: (f not in required, EVENT_FIELDS.index(f))):
+        spec = properties[field]
+        if 'enum' in spec:
+            namespace[f'_enum_{field}'] = frozenset(spec['enum'])
+        body.extend(_field_check(field, spec, field in required))
+    source = f"def check({', '.join(EVENT_FIELDS)}):\n" + '\n'.join(body + ["    return None"]) + '\n'
+    exec(compile(source, f'<schema {items.get("title", schema.get("title", ""))}>', 'exec'), namespace)
+    return namespace['check'], source
+
+@lru_cache(maxsize=None)
+def _load_checks(path):
+    """
+    读取schema并编译 (完整校验, 必填字段校验)，按路径缓存，每个进程只编译一次。
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    items = schema.get('items', schema)
+    full, _ = compile_schema(schema)
+    required, _ = compile_schema(schema, fields=set(items.get('required', ())))
+    return full, required
+
+class EventValidator:
+    """
+    标准格式事件校验：由 configs/standard_trace_schema.json 编译出的专用函数逐条校验，
+    不通过的事件按原因计数，处理完成后由 summary() 汇总输出一行，不再逐条打印。
+    - strict: 每条事件完整校验schema
+    - sample: 每条事件只校验生成packet必需的必填字段，每 sample_every 条做一次完整校验
+    - off:    不校验（仅用于可信输入，非法事件会导致该类型转换失败）
+    """
+    def __init__(self, mode='strict', sample_every=DEFAULT_SAMPLE_EVERY, schema_path=None):
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {mode}")
+        self.mode = mode
+        self.sample_every = max(1, sample_every)
+        self.rejected = Counter()
+        self.coerced = Counter()
+        self.full_check = self.required_check = None
+        if mode != 'off':
+            self.full_check, self.required_check = _load_checks(schema_path or find_schema_path())
+
+    def check_for(self, idx):
+        """
+        返回第idx条事件使用的校验函数（None表示不校验）。
+        """
+        if self.mode == 'strict':
+            return self.full_check
+        if self.mode == 'sample':
+            return self.full_check if idx % self.sample_every == 0 else self.required_check
+        return None
+
+    def reject(self, reason):
+        self.rejected[reason] += 1
+
+    def coerce(self, reason):
+        """
+        记录一次字段修正（如value无法转为数值时置为0），事件本身仍写入。
+        """
+        self.coerced[reason] += 1
+
+    def summary(self):
+        """
+        汇总输出一行校验结果，没有被跳过或修正的事件时不输出。
+        """
+        if not self.rejected and not self.coerced:
+            return
+        parts = []
+        if self.rejected:
+            reasons = '，'.join(f"{reason} {n}" for reason, n in self.rejected.most_common())
+            parts.append(f"跳过 {sum(self.rejected.values())} 条事件（{reasons}）")
+        if self.coerced:
+            reasons = '，'.join(f"{reason} {n}" for reason, n in self.coerced.most_common())
+            parts.append(f"修正 {sum(self.coerced.values())} 条事件（{reasons}）")
+        sampled = f"，抽样校验 1/{self.sample_every}" if self.mode == 'sample' else ''
+        print(f"[WARN] schema校验（{self.mode}{sampled}）：{'；'.join(parts)}")